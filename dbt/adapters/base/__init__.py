@@ -1,15 +1,37 @@
-from dbt.adapters.base.meta import available
-from dbt.adapters.base.column import Column
-from dbt.adapters.base.connections import BaseConnectionManager
-from dbt.adapters.base.impl import (
-    AdapterConfig,
-    BaseAdapter,
-    ConstraintSupport,
-    PythonJobHelper,
-)
-from dbt.adapters.base.plugin import AdapterPlugin
-from dbt.adapters.base.relation import (
-    BaseRelation,
-    RelationType,
-    SchemaSearchMap,
+from typing import TYPE_CHECKING
+
+from dbt.adapters.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from dbt.adapters.base.meta import available
+    from dbt.adapters.base.column import Column
+    from dbt.adapters.base.connections import BaseConnectionManager
+    from dbt.adapters.base.impl import (
+        AdapterConfig,
+        BaseAdapter,
+        ConstraintSupport,
+        PythonJobHelper,
+    )
+    from dbt.adapters.base.plugin import AdapterPlugin
+    from dbt.adapters.base.relation import (
+        BaseRelation,
+        RelationType,
+        SchemaSearchMap,
+    )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "available": "dbt.adapters.base.meta",
+        "Column": "dbt.adapters.base.column",
+        "BaseConnectionManager": "dbt.adapters.base.connections",
+        "AdapterConfig": "dbt.adapters.base.impl",
+        "BaseAdapter": "dbt.adapters.base.impl",
+        "ConstraintSupport": "dbt.adapters.base.impl",
+        "PythonJobHelper": "dbt.adapters.base.impl",
+        "AdapterPlugin": "dbt.adapters.base.plugin",
+        "BaseRelation": "dbt.adapters.base.relation",
+        "RelationType": "dbt.adapters.base.relation",
+        "SchemaSearchMap": "dbt.adapters.base.relation",
+    },
 )
@@ -1,10 +1,102 @@
 from dataclasses import dataclass
 import re
-from typing import Any, ClassVar, Dict, Optional
+from typing import Any, ClassVar, Dict, FrozenSet, Optional, Tuple, Type
 
 from dbt_common.exceptions import DbtRuntimeError
 
 
+@dataclass(frozen=True)
+class ColumnType:
+    """A raw data type string, parsed once and shared by every column with
+    that type.
+
+    :attr raw: The data type string as given, e.g. "varchar(256)".
+    :attr family: "string", "float", "integer" or "numeric" when the whole
+        lowercased type string is one of the column class's types of that
+        family, otherwise None.
+    :attr name: The type without any size information, e.g. "varchar".
+    :attr error: Why the size information could not be parsed, if it couldn't.
+    """
+
+    raw: str
+    family: Optional[str]
+    name: str
+    char_size: Optional[int] = None
+    numeric_precision: Optional[int] = None
+    numeric_scale: Optional[int] = None
+    error: Optional[str] = None
+
+
+_DATA_TYPE_PATTERN = re.compile(r"([^(]+)(\([^)]+\))?")
+
+
+class ColumnTypeRegistry:
+    """The parsed data types seen by one Column class. Each distinct raw type
+    string is parsed once; columns look their type up here on every call.
+    """
+
+    def __init__(self, column_class: Type["Column"]) -> None:
+        self.families: Dict[str, str] = {}
+        for family, types in (
+            ("string", column_class.STRING_TYPES),
+            ("float", column_class.FLOAT_TYPES),
+            ("integer", column_class.INTEGER_TYPES),
+            ("numeric", column_class.NUMERIC_TYPES),
+        ):
+            for type_name in types:
+                self.families.setdefault(type_name, family)
+        self.types: Dict[str, ColumnType] = {}
+
+    def get(self, raw_data_type: str) -> ColumnType:
+        column_type = self.types.get(raw_data_type)
+        if column_type is None:
+            # parsing is idempotent, so racing threads can only store equal values
+            column_type = self.types.setdefault(raw_data_type, self._parse(raw_data_type))
+        return column_type
+
+    def _parse(self, raw_data_type: str) -> ColumnType:
+        family = self.families.get(raw_data_type.lower())
+        match = _DATA_TYPE_PATTERN.match(raw_data_type)
+        if match is None:
+            return ColumnType(
+                raw_data_type,
+                family,
+                raw_data_type,
+                error=f'Could not interpret data type "{raw_data_type}"',
+            )
+        data_type, size_info = match.groups()
+        if size_info is None:
+            return ColumnType(raw_data_type, family, data_type)
+
+        # strip out the parentheses
+        parts = size_info[1:-1].split(",")
+        if len(parts) > 2:
+            return ColumnType(raw_data_type, family, data_type)
+        sizes = []
+        for part in parts:
+            try:
+                sizes.append(int(part))
+            except ValueError:
+                return ColumnType(
+                    raw_data_type,
+                    family,
+                    data_type,
+                    error=(
+                        f'Could not interpret data_type "{raw_data_type}": '
+                        f'could not convert "{part}" to an integer'
+                    ),
+                )
+        if len(sizes) == 1:
+            return ColumnType(raw_data_type, family, data_type, char_size=sizes[0])
+        return ColumnType(
+            raw_data_type,
+            family,
+            data_type,
+            numeric_precision=sizes[0],
+            numeric_scale=sizes[1],
+        )
+
+
 @dataclass
 class Column:
     # Note: This is automatically used by contract code
@@ -14,12 +106,75 @@ class Column:
     TYPE_LABELS: ClassVar[Dict[str, str]] = {
         "STRING": "TEXT",
     }
+    # The lowercased types that the is_* checks recognize. Adapters can
+    # override these instead of the checks themselves.
+    STRING_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "text",
+            "character varying",
+            "character",
+            "varchar",
+        }
+    )
+    FLOAT_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            "real",
+            "float4",
+            "float",
+            "double precision",
+            "float8",
+            "double",
+        }
+    )
+    INTEGER_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        {
+            # real types
+            "smallint",
+            "integer",
+            "bigint",
+            "smallserial",
+            "serial",
+            "bigserial",
+            # aliases
+            "int2",
+            "int4",
+            "int8",
+            "serial2",
+            "serial4",
+            "serial8",
+        }
+    )
+    NUMERIC_TYPES: ClassVar[FrozenSet[str]] = frozenset({"numeric", "decimal"})
+    # per-instance caches, set in the instance __dict__ so that they are not
+    # dataclass fields
+    _column_type: ClassVar[Optional[ColumnType]] = None
+    _data_type: ClassVar[Optional[Tuple[Tuple[Any, ...], str]]] = None
     column: str
     dtype: str
     char_size: Optional[int] = None
     numeric_precision: Optional[Any] = None
     numeric_scale: Optional[Any] = None
 
+    @classmethod
+    def type_registry(cls) -> ColumnTypeRegistry:
+        """Return the registry of parsed data types for this Column class."""
+        registry = cls.__dict__.get("_type_registry")
+        if registry is None:
+            registry = ColumnTypeRegistry(cls)
+            cls._type_registry = registry  # type: ignore[attr-defined]
+        return registry
+
+    @property
+    def column_type(self) -> ColumnType:
+        """The parsed form of this column's dtype, kept on the column until the
+        dtype changes.
+        """
+        column_type = self._column_type
+        if column_type is None or column_type.raw != self.dtype:
+            column_type = self.type_registry().get(self.dtype)
+            self.__dict__["_column_type"] = column_type
+        return column_type
+
     @classmethod
     def translate_type(cls, dtype: str) -> str:
         return cls.TYPE_LABELS.get(dtype.upper(), dtype)
@@ -39,6 +194,20 @@ class Column:
 
     @property
     def data_type(self) -> str:
+        # subclasses may build the data type from fields of their own, which
+        # the key of the cache doesn't cover
+        if type(self) is not Column:
+            return self._build_data_type()
+
+        key = (self.dtype, self.char_size, self.numeric_precision, self.numeric_scale)
+        cached = self._data_type
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        data_type = self._build_data_type()
+        self.__dict__["_data_type"] = (key, data_type)
+        return data_type
+
+    def _build_data_type(self) -> str:
         if self.is_string():
             return self.string_type(self.string_size())
         elif self.is_numeric():
@@ -47,47 +216,19 @@ class Column:
             return self.dtype
 
     def is_string(self) -> bool:
-        return self.dtype.lower() in [
-            "text",
-            "character varying",
-            "character",
-            "varchar",
-        ]
+        return self.column_type.family == "string"
 
     def is_number(self):
         return any([self.is_integer(), self.is_numeric(), self.is_float()])
 
     def is_float(self):
-        return self.dtype.lower() in [
-            # floats
-            "real",
-            "float4",
-            "float",
-            "double precision",
-            "float8",
-            "double",
-        ]
+        return self.column_type.family == "float"
 
     def is_integer(self) -> bool:
-        return self.dtype.lower() in [
-            # real types
-            "smallint",
-            "integer",
-            "bigint",
-            "smallserial",
-            "serial",
-            "bigserial",
-            # aliases
-            "int2",
-            "int4",
-            "int8",
-            "serial2",
-            "serial4",
-            "serial8",
-        ]
+        return self.column_type.family == "integer"
 
     def is_numeric(self) -> bool:
-        return self.dtype.lower() in ["numeric", "decimal"]
+        return self.column_type.family == "numeric"
 
     def string_size(self) -> int:
         if not self.is_string():
@@ -125,39 +266,13 @@ class Column:
 
     @classmethod
     def from_description(cls, name: str, raw_data_type: str) -> "Column":
-        match = re.match(r"([^(]+)(\([^)]+\))?", raw_data_type)
-        if match is None:
-            raise DbtRuntimeError(f'Could not interpret data type "{raw_data_type}"')
-        data_type, size_info = match.groups()
-        char_size = None
-        numeric_precision = None
-        numeric_scale = None
-        if size_info is not None:
-            # strip out the parentheses
-            size_info = size_info[1:-1]
-            parts = size_info.split(",")
-            if len(parts) == 1:
-                try:
-                    char_size = int(parts[0])
-                except ValueError:
-                    raise DbtRuntimeError(
-                        f'Could not interpret data_type "{raw_data_type}": '
-                        f'could not convert "{parts[0]}" to an integer'
-                    )
-            elif len(parts) == 2:
-                try:
-                    numeric_precision = int(parts[0])
-                except ValueError:
-                    raise DbtRuntimeError(
-                        f'Could not interpret data_type "{raw_data_type}": '
-                        f'could not convert "{parts[0]}" to an integer'
-                    )
-                try:
-                    numeric_scale = int(parts[1])
-                except ValueError:
-                    raise DbtRuntimeError(
-                        f'Could not interpret data_type "{raw_data_type}": '
-                        f'could not convert "{parts[1]}" to an integer'
-                    )
-
-        return cls(name, data_type, char_size, numeric_precision, numeric_scale)
+        column_type = cls.type_registry().get(raw_data_type)
+        if column_type.error is not None:
+            raise DbtRuntimeError(column_type.error)
+        return cls(
+            name,
+            column_type.name,
+            column_type.char_size,
+            column_type.numeric_precision,
+            column_type.numeric_scale,
+        )
@@ -1,4 +1,11 @@
 import abc
+from collections import Counter
+import copy
+import csv
+import functools
+import hashlib
+import itertools
+import threading
 import time
 from concurrent.futures import as_completed, Future
 from contextlib import contextmanager
@@ -15,6 +22,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     Tuple,
     Type,
@@ -23,7 +31,6 @@ from typing import (
     TYPE_CHECKING,
 )
 import os
-import pytz
 from dbt_common.behavior_flags import Behavior, BehaviorFlag
 from dbt_common.clients.jinja import CallableMacroGenerator
 from dbt_common.contracts.constraints import (
@@ -34,6 +41,7 @@ from dbt_common.contracts.constraints import (
 from dbt_common.contracts.metadata import CatalogTable
 from dbt_common.events.functions import fire_event, warn_or_error
 from dbt_common.exceptions import (
+    DbtDatabaseError,
     DbtInternalError,
     DbtRuntimeError,
     DbtValidationError,
@@ -48,6 +56,7 @@ from dbt_common.utils import (
     executor,
     filter_null_values,
 )
+from dbt_common.utils.formatting import lowercase
 
 from dbt.adapters.base.column import Column as BaseColumn
 from dbt.adapters.base.connections import (
@@ -64,7 +73,7 @@ from dbt.adapters.base.relation import (
 )
 from dbt.adapters.cache import RelationsCache, _make_ref_key_dict
 from dbt.adapters.capability import Capability, CapabilityDict
-from dbt.adapters.contracts.connection import Credentials
+from dbt.adapters.contracts.connection import ConnectionState, Credentials
 from dbt.adapters.contracts.macros import MacroResolverProtocol
 from dbt.adapters.contracts.relation import RelationConfig
 from dbt.adapters.events.types import (
@@ -73,6 +82,7 @@ from dbt.adapters.events.types import (
     CodeExecution,
     CodeExecutionStatus,
     CollectFreshnessReturnSignature,
+    ColumnChanges,
     ConstraintNotEnforced,
     ConstraintNotSupported,
     ListRelations,
@@ -87,6 +97,7 @@ from dbt.adapters.exceptions import (
     UnexpectedNonTimestampError,
 )
 from dbt.adapters.protocol import AdapterConfig, MacroContextGeneratorCallable
+from dbt.adapters.reference_keys import _ReferenceKey, _make_ref_key
 
 if TYPE_CHECKING:
     import agate
@@ -95,8 +106,12 @@ if TYPE_CHECKING:
 GET_CATALOG_MACRO_NAME = "get_catalog"
 GET_CATALOG_RELATIONS_MACRO_NAME = "get_catalog_relations"
 FRESHNESS_MACRO_NAME = "collect_freshness"
+FRESHNESS_BATCH_MACRO_NAME = "collect_freshness_batch"
+ALTER_RELATION_COLUMNS_MACRO_NAME = "alter_relation_columns"
 GET_RELATION_LAST_MODIFIED_MACRO_NAME = "get_relation_last_modified"
 
+BULK_LOAD_BATCH_SIZE = 10000
+
 
 class ConstraintSupport(str, Enum):
     ENFORCED = "enforced"
@@ -111,38 +126,116 @@ def _parse_callback_empty_table(*args, **kwargs) -> Tuple[str, "agate.Table"]:
     return "", empty_table()
 
 
-def _expect_row_value(key: str, row: "agate.Row"):
-    if key not in row.keys():
-        raise DbtInternalError(
-            'Got a row without "{}" column, columns: {}'.format(key, row.keys())
-        )
-    return row[key]
+_CATALOG_KEY_COLUMNS = ("table_database", "table_schema", "table_name")
+
+CatalogRelationKey = Tuple[Optional[str], Optional[str], Optional[str]]
+
 
+def _catalog_relation_key(
+    database: Optional[str], schema: Optional[str], identifier: Optional[str]
+) -> CatalogRelationKey:
+    return (
+        database.casefold() if database else None,
+        schema.casefold() if schema else None,
+        identifier.casefold() if identifier else None,
+    )
 
-def _catalog_filter_schemas(
-    used_schemas: FrozenSet[Tuple[str, str]]
-) -> Callable[["agate.Row"], bool]:
-    """Return a function that takes a row and decides if the row should be
-    included in the catalog output.
+
+def _catalog_relation_keys(relations: Iterable[BaseRelation]) -> FrozenSet[CatalogRelationKey]:
+    """Return the casefolded (database, schema, identifier) keys of the given
+    relations, for matching against catalog rows.
     """
-    schemas = frozenset((d.lower(), s.lower()) for d, s in used_schemas)
-
-    def test(row: "agate.Row") -> bool:
-        table_database = _expect_row_value("table_database", row)
-        table_schema = _expect_row_value("table_schema", row)
-        # the schema may be present but None, which is not an error and should
-        # be filtered out
-        if table_schema is None:
-            return False
-        return (table_database.lower(), table_schema.lower()) in schemas
+    return frozenset(_catalog_relation_key(r.database, r.schema, r.identifier) for r in relations)
+
+
+def _catalog_filter_rows(
+    table: "agate.Table",
+    used_schemas: Optional[FrozenSet[Tuple[str, str]]] = None,
+    relation_keys: Optional[FrozenSet[CatalogRelationKey]] = None,
+) -> "agate.Table":
+    """Filter catalog rows in a single pass over the raw row values.
+
+    The database, schema and table name columns are coerced to text, and each
+    row is tested against the precomputed schema and relation key sets. The
+    table is returned as is when every row is kept. Otherwise it is only
+    rebuilt when a name column was not already text, and the remaining rows
+    are selected with Table.where, without being cast again.
+    """
+    import agate
+
+    if len(table.rows) == 0:
+        return table
+
+    column_names = table.column_names
+    indexes = []
+    for key in _CATALOG_KEY_COLUMNS:
+        if key not in column_names:
+            raise DbtInternalError(
+                'Got a row without "{}" column, columns: {}'.format(key, column_names)
+            )
+        indexes.append(column_names.index(key))
+    db_idx, schema_idx, name_idx = indexes
+
+    coerce = [i for i in indexes if not isinstance(table.column_types[i], agate.Text)]
+    schemas = (
+        None
+        if used_schemas is None
+        else frozenset((d.lower(), s.lower()) for d, s in used_schemas)
+    )
+
+    def keep(values: Sequence[Any]) -> bool:
+        database, schema, name = values[db_idx], values[schema_idx], values[name_idx]
+        if schemas is not None:
+            # the schema may be present but None, which is not an error and
+            # should be filtered out
+            if database is None or schema is None:
+                return False
+            if (database.lower(), schema.lower()) not in schemas:
+                return False
+        return (
+            relation_keys is None or _catalog_relation_key(database, schema, name) in relation_keys
+        )
 
-    return test
+    if not coerce:
+        kept = [keep(row.values()) for row in table.rows]
+        if all(kept):
+            return table
+        # where() tests the rows in order
+        tests = iter(kept)
+        return table.where(lambda row: next(tests))
+
+    rows: List[List[Any]] = []
+    for row in table.rows:
+        values = list(row.values())
+        for i in coerce:
+            if values[i] is not None:
+                values[i] = str(values[i])
+        if keep(values):
+            rows.append(values)
+
+    column_types = list(table.column_types)
+    for i in coerce:
+        column_types[i] = agate.Text(null_values=())
+    return agate.Table(rows, column_names, column_types)
+
+
+@functools.lru_cache(maxsize=64)
+def _insert_values(column_count: int, row_count: int, binding_char: str) -> str:
+    """The placeholders of an insert of row_count rows of column_count
+    values, which seeds with the same shape share.
+    """
+    values = "({})".format(", ".join([binding_char] * column_count))
+    return ",\n".join([values] * row_count)
 
 
 def _utc(dt: Optional[datetime], source: Optional[BaseRelation], field_name: str) -> datetime:
     """If dt has a timezone, return a new datetime that's in UTC. Otherwise,
     assume the datetime is already for UTC and add the timezone.
     """
+    # pytz is only needed for source freshness, so it is imported here rather
+    # than with this module
+    import pytz
+
     if dt is None:
         raise UnexpectedNullError(field_name, source)
 
@@ -261,6 +354,21 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     MAX_SCHEMA_METADATA_RELATIONS = 100
 
+    # The maximum number of sources whose loaded_at_field freshness is
+    # collected in a single query by calculate_freshness_batch.
+    FRESHNESS_BATCH_SIZE = 100
+
+    # The estimated cost of issuing a single catalog query, measured in the
+    # number of catalog relations that could be scanned in the same time. Used
+    # to choose between fetching the catalog for chunks of relations or for
+    # whole schemas.
+    CATALOG_QUERY_COST = 100
+
+    # Whether the columns fetched for a relation are cached for the rest of the
+    # run. Only adapters that change relations through the DDL methods and the
+    # macros that call invalidate_column_cache should turn this on.
+    CACHE_COLUMNS = False
+
     # This static member variable can be overridden in concrete adapter
     # implementations to indicate adapter support for optional capabilities.
     _capabilities = CapabilityDict({})
@@ -271,6 +379,16 @@ class BaseAdapter(metaclass=AdapterMeta):
         self.connections = self.ConnectionManager(config, mp_context)
         self._macro_resolver: Optional[MacroResolverProtocol] = None
         self._macro_context_generator: Optional[MacroContextGeneratorCallable] = None
+        # the number of relations the catalog last returned for each
+        # (database, schema)
+        self._catalog_relation_counts: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        # the columns fetched for each relation this run, if CACHE_COLUMNS is
+        # set; they are dropped whenever dbt changes the relation
+        self._column_cache: Dict[_ReferenceKey, List[BaseColumn]] = {}
+        # the connections claimed by parallel bulk loads that are running, which
+        # share the config.threads connections with the nodes being run
+        self._bulk_load_lock = threading.Lock()
+        self._bulk_load_connections = 0
         # this will be updated to include global behavior flags once they exist
         self.behavior = []  # type: ignore
 
@@ -549,6 +667,7 @@ class BaseAdapter(metaclass=AdapterMeta):
         with self.cache.lock:
             if clear:
                 self.cache.clear()
+                self.invalidate_column_cache()
             self._relations_cache_for_schemas(relation_configs, required_schemas)
 
     @available
@@ -558,6 +677,8 @@ class BaseAdapter(metaclass=AdapterMeta):
             name = self.nice_connection_name()
             raise NullRelationCacheAttemptedError(name)
         self.cache.add(relation)
+        # the relation was just (re)built, so its columns may have changed
+        self.invalidate_column_cache(relation)
         # so jinja doesn't render things
         return ""
 
@@ -569,7 +690,16 @@ class BaseAdapter(metaclass=AdapterMeta):
         if relation is None:
             name = self.nice_connection_name()
             raise NullRelationDropAttemptedError(name)
-        self.cache.drop(relation)
+        dropped_key = _make_ref_key(relation)
+        with self.cache.lock:
+            # dropping a relation drops the views that depend on it too
+            if dropped_key in self.cache.relations:
+                dropped = self.cache.relations[dropped_key].collect_consequences()
+            else:
+                dropped = {dropped_key}
+            self.cache.drop(relation)
+        for key in dropped:
+            self._column_cache.pop(key, None)
         return ""
 
     @available
@@ -588,6 +718,41 @@ class BaseAdapter(metaclass=AdapterMeta):
             raise RenameToNoneAttemptedError(src_name, dst_name, name)
 
         self.cache.rename(from_relation, to_relation)
+        self.invalidate_column_cache(from_relation)
+        self.invalidate_column_cache(to_relation)
+        return ""
+
+    ###
+    # Caching methods for columns
+    ###
+    def _get_cached_columns(self, relation: BaseRelation) -> Optional[List[BaseColumn]]:
+        """Get the cached columns of the relation, or None if they aren't
+        cached.
+        """
+        if not self.CACHE_COLUMNS:
+            return None
+        cached = self._column_cache.get(_make_ref_key(relation))
+        if cached is None:
+            return None
+        # callers may change the columns they get
+        return [copy.copy(column) for column in cached]
+
+    def _cache_columns(self, relation: BaseRelation, columns: List[BaseColumn]) -> None:
+        # a relation without columns may just not have been created yet
+        if self.CACHE_COLUMNS and columns:
+            self._column_cache[_make_ref_key(relation)] = [copy.copy(column) for column in columns]
+
+    @available
+    def invalidate_column_cache(self, relation: Optional[BaseRelation] = None) -> str:
+        """Forget the cached columns of the given relation, or of every
+        relation if none is given. The adapter's DDL methods and the
+        relation cache methods do this already; call it after changing a
+        relation's columns some other way.
+        """
+        if relation is None:
+            self._column_cache.clear()
+        else:
+            self._column_cache.pop(_make_ref_key(relation), None)
         return ""
 
     ###
@@ -656,6 +821,39 @@ class BaseAdapter(metaclass=AdapterMeta):
         """Get a list of the columns in the given Relation."""
         raise NotImplementedError("`get_columns_in_relation` is not implemented for this adapter!")
 
+    @available.parse(lambda *a, **k: {})
+    def get_columns_in_relations(
+        self, relations: Iterable[BaseRelation]
+    ) -> Dict[BaseRelation, List[BaseColumn]]:
+        """Get the columns in each of the given relations.
+
+        Columns that are already cached are not fetched again, and the rest
+        are fetched together by _get_columns_in_relations_without_caching.
+        """
+        columns: Dict[BaseRelation, List[BaseColumn]] = {}
+        missing: List[BaseRelation] = []
+        for relation in relations:
+            cached = self._get_cached_columns(relation)
+            if cached is None:
+                missing.append(relation)
+            else:
+                columns[relation] = cached
+
+        if missing:
+            fetched = self._get_columns_in_relations_without_caching(missing)
+            for relation, relation_columns in fetched.items():
+                self._cache_columns(relation, relation_columns)
+                columns[relation] = relation_columns
+        return columns
+
+    def _get_columns_in_relations_without_caching(
+        self, relations: List[BaseRelation]
+    ) -> Dict[BaseRelation, List[BaseColumn]]:
+        """Fetch the columns in each of the given relations. Adapters that can
+        describe many relations in one query should override this.
+        """
+        return {relation: self.get_columns_in_relation(relation) for relation in relations}
+
     def get_catalog_for_single_relation(self, relation: BaseRelation) -> Optional[CatalogTable]:
         """Get catalog information including table-level and column-level metadata for a single relation."""
         raise NotImplementedError(
@@ -731,6 +929,329 @@ class BaseAdapter(metaclass=AdapterMeta):
     ###
     # Provided methods about relations
     ###
+    @available
+    def alter_relation_columns(
+        self,
+        relation: BaseRelation,
+        add_columns: Optional[Iterable[BaseColumn]] = None,
+        remove_columns: Optional[Iterable[BaseColumn]] = None,
+        type_changes: Optional[Iterable[Dict[str, str]]] = None,
+    ) -> None:
+        """Add columns to, remove columns from and change the types of columns
+        in a relation, with as few statements as the alter_relation_columns
+        macro can combine them into.
+
+        :param type_changes: A dict for each column to change, with its
+            column_name, new_type and optionally its orig_type.
+        """
+        add_columns = list(add_columns or [])
+        remove_columns = list(remove_columns or [])
+        type_changes = list(type_changes or [])
+        if not (add_columns or remove_columns or type_changes):
+            return
+
+        self._fire_column_changes(relation, add_columns, remove_columns, type_changes)
+        kwargs = {
+            "relation": relation,
+            "add_columns": add_columns,
+            "remove_columns": remove_columns,
+            "type_changes": type_changes,
+        }
+        self.execute_macro(ALTER_RELATION_COLUMNS_MACRO_NAME, kwargs=kwargs)
+
+    def _fire_column_changes(
+        self,
+        relation: BaseRelation,
+        add_columns: List[BaseColumn],
+        remove_columns: List[BaseColumn],
+        type_changes: List[Dict[str, str]],
+    ) -> None:
+        fire_event(
+            ColumnChanges(
+                table=_make_ref_key_dict(relation),
+                added_columns=[column.name for column in add_columns],
+                removed_columns=[column.name for column in remove_columns],
+                type_changes=[
+                    {
+                        "column_name": change["column_name"],
+                        "orig_type": change.get("orig_type", ""),
+                        "new_type": change["new_type"],
+                    }
+                    for change in type_changes
+                ],
+            )
+        )
+
+    @available
+    def get_insert_batches(
+        self,
+        relation: BaseRelation,
+        columns_csv: str,
+        rows: Iterable[Sequence[Any]],
+        batch_size: int,
+        binding_char: str,
+    ) -> Iterator[Tuple[str, List[Any]]]:
+        """Yield a parameterized insert statement and its flat list of
+        bindings for each batch of at most batch_size rows. Statements are
+        rendered once per batch row count, so every full batch of a seed
+        reuses the same statement string.
+
+        :param columns_csv: The quoted, comma separated columns to insert.
+        :param binding_char: The driver's placeholder for one binding.
+        """
+        prefix = "insert into {} ({}) values\n".format(relation.render(), columns_csv)
+        statements: Dict[int, str] = {}
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, batch_size))
+            if not chunk:
+                return
+            sql = statements.get(len(chunk))
+            if sql is None:
+                sql = prefix + _insert_values(len(chunk[0]), len(chunk), binding_char)
+                statements[len(chunk)] = sql
+            yield sql, list(itertools.chain.from_iterable(chunk))
+
+    @available
+    def diff_seed_rows(
+        self, rows: Iterable[Sequence[Any]], existing_hashes: Iterable[Optional[str]]
+    ) -> Dict[str, Any]:
+        """Compare the rows of a seed with the row hashes stored alongside the
+        rows already in its table, for seeds with a row_hash_column. Rows whose
+        hash is found as many times as it is stored are left alone; for any
+        other hash, the stored rows are deleted and the seed's rows inserted.
+
+        :return: A dict with the rows to insert, in seed order and each with
+            its hash appended, under "rows"; the hashes to delete first under
+            "deleted_hashes"; and under "delete_all" whether every row must be
+            deleted first, because some stored rows have no hash.
+        """
+        rows = list(rows)
+        hashes = [self._seed_row_hash(row) for row in rows]
+        stored = Counter(existing_hashes)
+
+        delete_all = None in stored
+        if delete_all:
+            changed = set(hashes)
+            deleted_hashes: List[str] = []
+        else:
+            counts = Counter(hashes)
+            changed = {row_hash for row_hash in counts if counts[row_hash] != stored[row_hash]}
+            deleted_hashes = [
+                row_hash
+                for row_hash in stored
+                if row_hash is not None and stored[row_hash] != counts[row_hash]
+            ]
+        return {
+            "rows": [
+                (*row, row_hash) for row, row_hash in zip(rows, hashes) if row_hash in changed
+            ],
+            "deleted_hashes": deleted_hashes,
+            "delete_all": delete_all,
+        }
+
+    @staticmethod
+    def _seed_row_hash(row: Sequence[Any]) -> str:
+        text = "\x1f".join("\x00" if value is None else str(value) for value in row)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    @available
+    def bulk_load(
+        self,
+        relation: BaseRelation,
+        source: Union[str, "os.PathLike[str]", Iterable[Sequence[Any]]],
+        column_names: Optional[Sequence[str]] = None,
+        batch_size: int = BULK_LOAD_BATCH_SIZE,
+        quote_columns: Optional[bool] = None,
+        parallel: bool = False,
+        text_columns: Optional[Iterable[str]] = None,
+        drop_on_error: bool = False,
+    ) -> int:
+        """Stream rows into an existing relation in chunks of at most
+        batch_size rows, so that memory use does not grow with the size of the
+        source. Returns the number of rows loaded.
+
+        :param source: Either the path of a CSV file, whose header row names
+            the columns, or an iterable of rows. The fields of a CSV file are
+            converted to the types agate would infer for their columns, as
+            they are when seeds are loaded through agate, which takes a
+            first pass over the file.
+        :param column_names: The columns to load the rows into. Required when
+            the source is an iterable of rows.
+        :param quote_columns: The quote_columns config of the seed, if any.
+        :param parallel: Load the chunks concurrently, over the connections
+            of the threads that are not in use, if
+            can_bulk_load_in_parallel(). Each connection commits its own
+            rows, so the relation should be a staging relation that is swapped
+            in once the load succeeds.
+        :param text_columns: Columns of a CSV file to load as text, as with
+            the seed column_types config.
+        :param drop_on_error: Drop the relation if the load fails, as for a
+            staging relation.
+        """
+        if batch_size < 1:
+            raise DbtRuntimeError(f"Invalid bulk load batch size: {batch_size}")
+        try:
+            return self._bulk_load(
+                relation, source, column_names, batch_size, quote_columns, parallel, text_columns
+            )
+        except Exception:
+            if drop_on_error:
+                self.drop_relation(relation)
+            raise
+
+    def _bulk_load(
+        self,
+        relation: BaseRelation,
+        source: Union[str, "os.PathLike[str]", Iterable[Sequence[Any]]],
+        column_names: Optional[Sequence[str]],
+        batch_size: int,
+        quote_columns: Optional[bool],
+        parallel: bool,
+        text_columns: Optional[Iterable[str]],
+    ) -> int:
+        load = self._bulk_load_parallel if parallel else self._bulk_load_chunks
+
+        if isinstance(source, (str, os.PathLike)):
+            from dbt.adapters.base.type_inference import infer_csv_types
+
+            casts = [
+                data_type.cast
+                for data_type in infer_csv_types(source, text_columns or ()).column_types
+            ]
+            with open(source, newline="", encoding="utf-8-sig") as fp:
+                reader = csv.reader(fp)
+                header = next(reader, None)
+                if header is None:
+                    return 0
+                # fields missing from short rows are nulls, as they are in agate
+                rows = (
+                    [
+                        cast(value)
+                        for cast, value in itertools.zip_longest(casts, row[: len(casts)])
+                    ]
+                    for row in reader
+                )
+                return load(relation, column_names or header, rows, batch_size, quote_columns)
+
+        if column_names is None:
+            raise DbtRuntimeError(f"Cannot bulk load rows into {relation} without column names")
+        return load(relation, column_names, source, batch_size, quote_columns)
+
+    def _bulk_load_chunks(
+        self,
+        relation: BaseRelation,
+        column_names: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        batch_size: int,
+        quote_columns: Optional[bool],
+    ) -> int:
+        columns = [self.quote_seed_column(column, quote_columns) for column in column_names]
+        loaded = 0
+        iterator = iter(rows)
+        while True:
+            chunk = list(itertools.islice(iterator, batch_size))
+            if not chunk:
+                return loaded
+            self.bulk_load_rows(relation, columns, chunk)
+            loaded += len(chunk)
+
+    def _bulk_load_parallel(
+        self,
+        relation: BaseRelation,
+        column_names: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        batch_size: int,
+        quote_columns: Optional[bool],
+    ) -> int:
+        workers = 0
+        if not self.config.args.single_threaded and self.can_bulk_load_in_parallel():
+            workers = self._claim_bulk_load_connections()
+        try:
+            if workers < 2:
+                return self._bulk_load_chunks(
+                    relation, column_names, rows, batch_size, quote_columns
+                )
+            return self._bulk_load_threads(
+                relation, column_names, rows, batch_size, quote_columns, workers
+            )
+        finally:
+            with self._bulk_load_lock:
+                self._bulk_load_connections -= workers
+
+    @available
+    @classmethod
+    def can_bulk_load_in_parallel(cls) -> bool:
+        """Whether bulk_load can load over several connections. The other
+        connections can only see a relation once it is committed, so this
+        needs the NonTransactionalDDL capability.
+        """
+        return cls.supports(Capability.NonTransactionalDDL)
+
+    def _claim_bulk_load_connections(self) -> int:
+        """Claim the connections of the threads that are not in use, so that
+        the connections of the nodes being run and of the loads running
+        alongside them stay within config.threads.
+        """
+        with self._bulk_load_lock:
+            with self.connections.lock:
+                in_use = sum(
+                    1
+                    for connection in self.connections.thread_connections.values()
+                    if connection.state == ConnectionState.OPEN
+                )
+            workers = max(self.config.threads - in_use - self._bulk_load_connections, 0)
+            self._bulk_load_connections += workers
+            return workers
+
+    def _bulk_load_threads(
+        self,
+        relation: BaseRelation,
+        column_names: Sequence[str],
+        rows: Iterable[Sequence[Any]],
+        batch_size: int,
+        quote_columns: Optional[bool],
+        workers: int,
+    ) -> int:
+        columns = [self.quote_seed_column(column, quote_columns) for column in column_names]
+        iterator = iter(rows)
+        lock = threading.Lock()
+        failed = threading.Event()
+
+        def load() -> int:
+            # each worker pulls the next chunk from the shared source, so only
+            # one chunk per thread is in memory at a time
+            loaded = 0
+            while not failed.is_set():
+                with lock:
+                    chunk = list(itertools.islice(iterator, batch_size))
+                if not chunk:
+                    break
+                try:
+                    self.bulk_load_rows(relation, columns, chunk)
+                except Exception:
+                    failed.set()
+                    raise
+                loaded += len(chunk)
+            if loaded:
+                self.connections.commit()
+            return loaded
+
+        with executor(self.config) as tpe:
+            futures: List[Future[int]] = []
+            for idx in range(workers):
+                name = f"load_{relation.identifier}_{idx}"
+                futures.append(tpe.submit_connected(self, name, load))
+            return sum(future.result() for future in as_completed(futures))
+
+    def bulk_load_rows(
+        self, relation: BaseRelation, columns: List[str], rows: List[Sequence[Any]]
+    ) -> None:
+        """Load one chunk of rows into the given (already quoted) columns of
+        the relation, with the fastest path the database driver offers.
+        """
+        raise NotImplementedError("`bulk_load_rows` is not implemented for this adapter!")
+
     @available.parse_list
     def get_missing_columns(
         self, from_relation: BaseRelation, to_relation: BaseRelation
@@ -762,6 +1283,64 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return [col for (col_name, col) in from_columns.items() if col_name in missing_columns]
 
+    @available.parse(lambda *a, **k: {})
+    def compute_schema_diff(
+        self, source_relation: BaseRelation, target_relation: BaseRelation
+    ) -> Dict[str, Any]:
+        """Compare the columns of an incremental model's new data with its
+        existing table, for on_schema_change.
+
+        :param source_relation: The relation holding the new data.
+        :param target_relation: The existing incremental table.
+        :return: The changes dict of the check_for_schema_changes macro, with
+            the keys schema_changed, source_not_in_target,
+            target_not_in_source, source_columns, target_columns and
+            new_target_types.
+        """
+        source_columns = self.get_columns_in_relation(source_relation)
+        target_columns = self.get_columns_in_relation(target_relation)
+        return self._diff_column_schemas(source_columns, target_columns)
+
+    @staticmethod
+    def _diff_column_schemas(
+        source_columns: List[BaseColumn], target_columns: List[BaseColumn]
+    ) -> Dict[str, Any]:
+        """Diff two column lists with the same results as the diff_columns and
+        diff_column_data_types macros, using dicts instead of nested loops.
+        """
+        source_names = {column.column for column in source_columns}
+        target_names = {column.column for column in target_columns}
+        targets_by_name: Dict[str, BaseColumn] = {}
+        for column in target_columns:
+            # the macros use the first target column with a matching name
+            targets_by_name.setdefault(column.name, column)
+
+        source_not_in_target = [c for c in source_columns if c.name not in target_names]
+        target_not_in_source = [c for c in target_columns if c.name not in source_names]
+
+        new_target_types = []
+        for source_column in source_columns:
+            target_column = targets_by_name.get(source_column.name)
+            if (
+                target_column is not None
+                and source_column.data_type != target_column.data_type
+                and not source_column.can_expand_to(other_column=target_column)
+            ):
+                new_target_types.append(
+                    {"column_name": target_column.name, "new_type": source_column.data_type}
+                )
+
+        return {
+            "schema_changed": bool(
+                source_not_in_target or target_not_in_source or new_target_types
+            ),
+            "source_not_in_target": source_not_in_target,
+            "target_not_in_source": target_not_in_source,
+            "source_columns": source_columns,
+            "target_columns": target_columns,
+            "new_target_types": new_target_types,
+        }
+
     @available.parse_none
     def valid_snapshot_target(
         self, relation: BaseRelation, column_names: Optional[Dict[str, str]] = None
@@ -890,7 +1469,11 @@ class BaseAdapter(metaclass=AdapterMeta):
 
     @available.parse_none
     def get_relation(self, database: str, schema: str, identifier: str) -> Optional[BaseRelation]:
-        relations_list = self.list_relations(database, schema)
+        if identifier is not None and (database, schema) in self.cache:
+            # only match against the cached relations that share the identifier
+            relations_list = self.cache.get_relations_by_identifier(database, schema, identifier)
+        else:
+            relations_list = self.list_relations(database, schema)
 
         matches = self._make_match(relations_list, database, schema, identifier)
 
@@ -1084,6 +1667,25 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return None
 
+    @available
+    @classmethod
+    def convert_csv_types(
+        cls,
+        source: Union[str, "os.PathLike[str]"],
+        text_columns: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Optional[str]]:
+        """Return the database type of each column of a CSV file, as
+        convert_type would for an agate table of the whole file, from a
+        single pass over the file.
+
+        :param text_columns: Columns to always treat as text, as with the
+            seed column_types config.
+        """
+        from dbt.adapters.base.type_inference import infer_csv_types
+
+        table = infer_csv_types(source, text_columns or ())
+        return {name: cls.convert_type(table, idx) for idx, name in enumerate(table.column_names)}
+
     ###
     # Operations involving the manifest
     ###
@@ -1157,16 +1759,14 @@ class BaseAdapter(metaclass=AdapterMeta):
     ) -> "agate.Table":
         """Filter the table as appropriate for catalog entries. Subclasses can
         override this to change filtering rules on a per-adapter basis.
-        """
-        from dbt_common.clients.agate_helper import table_from_rows
 
-        # force database + schema to be strings
-        table = table_from_rows(
-            table.rows,
-            table.column_names,
-            text_only_columns=["table_database", "table_schema", "table_name"],
-        )
-        return table.where(_catalog_filter_schemas(used_schemas))
+        Adapters which declare the CatalogFilterPushdown capability already
+        filter by schema in their catalog macros, so only the database, schema
+        and table name columns are coerced to text here.
+        """
+        if cls.supports(Capability.CatalogFilterPushdown):
+            return _catalog_filter_rows(table)
+        return _catalog_filter_rows(table, used_schemas=used_schemas)
 
     def _get_one_catalog(
         self,
@@ -1178,8 +1778,64 @@ class BaseAdapter(metaclass=AdapterMeta):
         table = self.execute_macro(GET_CATALOG_MACRO_NAME, kwargs=kwargs)
 
         results = self._catalog_filter_table(table, used_schemas)  # type: ignore[arg-type]
+        self._record_catalog_relation_counts(results)
         return results
 
+    def _record_catalog_relation_counts(self, table: "agate.Table") -> None:
+        """Remember how many relations the catalog returned for each schema,
+        to balance later catalog queries. The catalog has a row per column, so
+        relations are counted by their distinct names.
+        """
+        column_names = table.column_names
+        if any(key not in column_names for key in _CATALOG_KEY_COLUMNS):
+            return
+        db_idx, schema_idx, name_idx = (column_names.index(key) for key in _CATALOG_KEY_COLUMNS)
+
+        names: Dict[Tuple[Optional[str], Optional[str]], Set[Optional[str]]] = {}
+        for row in table.rows:
+            values = row.values()
+            key = (lowercase(values[db_idx]), lowercase(values[schema_idx]))
+            names.setdefault(key, set()).add(lowercase(values[name_idx]))
+        self._catalog_relation_counts.update((key, len(n)) for key, n in names.items())
+
+    def _get_catalog_schema_groups(
+        self, information_schema: InformationSchema, schemas: Set[Optional[str]]
+    ) -> List[Set[Optional[str]]]:
+        """Partition the schemas of an information schema into balanced groups
+        which can be fetched in parallel.
+
+        Schemas are weighted by the number of relations the catalog last
+        returned for them, or else by the number of relations cached for
+        them. A new group is only split off while every group carries at
+        least CATALOG_QUERY_COST of weight, and there are never more groups
+        than threads.
+        """
+        database = lowercase(information_schema.database)
+        relation_counts = self.cache.get_relation_counts()
+        weights: Dict[Optional[str], int] = {}
+        for schema in schemas:
+            key = (database, lowercase(schema))
+            weights[schema] = (
+                self._catalog_relation_counts.get(key) or relation_counts.get(key) or 1
+            )
+
+        group_count = max(
+            1,
+            min(
+                self.config.threads,
+                len(schemas),
+                sum(weights.values()) // self.CATALOG_QUERY_COST,
+            ),
+        )
+        groups: List[Set[Optional[str]]] = [set() for _ in range(group_count)]
+        loads = [0] * group_count
+        # assign the heaviest schemas first, each to the lightest group so far
+        for schema in sorted(schemas, key=lambda s: weights[s], reverse=True):
+            lightest = loads.index(min(loads))
+            groups[lightest].add(schema)
+            loads[lightest] += weights[schema]
+        return groups
+
     def _get_one_catalog_by_relations(
         self,
         information_schema: InformationSchema,
@@ -1200,42 +1856,149 @@ class BaseAdapter(metaclass=AdapterMeta):
         relation_configs: Iterable[RelationConfig],
         used_schemas: FrozenSet[Tuple[str, str]],
         relations: Optional[Set[BaseRelation]] = None,
+        previous_catalog: Optional["agate.Table"] = None,
+        previous_catalog_generated_at: Optional[datetime] = None,
     ):
+        """Get the catalog for the given relations, or for every schema in
+        used_schemas if no relations are given.
+
+        If relations are given, along with the catalog table of a previous run
+        and the time at which that run started, and the adapter supports the
+        TableLastModifiedMetadata capability, the catalog is built
+        incrementally: only relations modified since the previous run are
+        queried, and their rows are merged with the unchanged rows of the
+        previous catalog. Without relations, the full catalog of every schema
+        is needed, including the relations dbt doesn't manage, so it is always
+        fetched in full.
+        """
+        if (
+            relations is not None
+            and previous_catalog is not None
+            and previous_catalog_generated_at is not None
+            and self.supports(Capability.TableLastModifiedMetadata)
+        ):
+            return self._get_incremental_catalog(
+                relation_configs,
+                used_schemas,
+                relations,
+                previous_catalog,
+                previous_catalog_generated_at,
+            )
+
         catalogs: "agate.Table"
         if (
             relations is None
-            or len(relations) > self.MAX_SCHEMA_METADATA_RELATIONS
             or not self.supports(Capability.SchemaMetadataByRelations)
+            or not self._catalog_by_relations_is_cheaper(relations)
         ):
             # Do it the traditional way. We get the full catalog.
             catalogs, exceptions = self.get_catalog(relation_configs, used_schemas)
+            filtered_by_relations = False
         else:
             # Do it the new way. We try to save time by selecting information
             # only for the exact set of relations we are interested in.
             catalogs, exceptions = self.get_catalog_by_relations(used_schemas, relations)
+            filtered_by_relations = self.supports(Capability.CatalogFilterPushdown)
 
-        if relations and catalogs:
-            relation_map = {
-                (
-                    r.database.casefold() if r.database else None,
-                    r.schema.casefold() if r.schema else None,
-                    r.identifier.casefold() if r.identifier else None,
-                )
-                for r in relations
-            }
+        if relations and catalogs and not filtered_by_relations:
+            catalogs = _catalog_filter_rows(
+                catalogs, relation_keys=_catalog_relation_keys(relations)
+            )
 
-            def in_map(row: "agate.Row"):
-                d = _expect_row_value("table_database", row)
-                s = _expect_row_value("table_schema", row)
-                i = _expect_row_value("table_name", row)
-                d = d.casefold() if d is not None else None
-                s = s.casefold() if s is not None else None
-                i = i.casefold() if i is not None else None
-                return (d, s, i) in relation_map
+        return catalogs, exceptions
 
-            catalogs = catalogs.where(in_map)
+    def _get_incremental_catalog(
+        self,
+        relation_configs: Iterable[RelationConfig],
+        used_schemas: FrozenSet[Tuple[str, str]],
+        relations: Set[BaseRelation],
+        previous_catalog: "agate.Table",
+        previous_catalog_generated_at: datetime,
+    ) -> Tuple["agate.Table", List[Exception]]:
+        from dbt_common.clients.agate_helper import merge_tables
+
+        generated_at = _utc(previous_catalog_generated_at, None, "previous_catalog_generated_at")
+        previous_catalog = _catalog_filter_rows(previous_catalog)
+        self._record_catalog_relation_counts(previous_catalog)
+        previous_keys = {
+            _catalog_relation_key(row["table_database"], row["table_schema"], row["table_name"])
+            for row in previous_catalog
+        }
 
-        return catalogs, exceptions
+        exceptions: List[Exception] = []
+        freshness_responses: Dict[BaseRelation, FreshnessResponse] = {}
+        try:
+            _, freshness_responses = self.calculate_freshness_from_metadata_batch(list(relations))
+        except Exception as exc:
+            # without last modified metadata every relation is considered changed
+            warn_or_error(CatalogGenerationError(exc=str(exc)))
+            exceptions.append(exc)
+
+        changed: Set[BaseRelation] = set()
+        for relation in relations:
+            freshness = freshness_responses.get(relation)
+            if (
+                freshness is None
+                or freshness["max_loaded_at"] >= generated_at
+                or _catalog_relation_key(relation.database, relation.schema, relation.identifier)
+                not in previous_keys
+            ):
+                changed.add(relation)
+
+        tables = [
+            _catalog_filter_rows(
+                previous_catalog, relation_keys=_catalog_relation_keys(relations - changed)
+            )
+        ]
+        if changed:
+            catalog, changed_exceptions = self.get_filtered_catalog(
+                relation_configs, used_schemas, changed
+            )
+            tables.append(catalog)
+            exceptions.extend(changed_exceptions)
+
+        return merge_tables(tables), exceptions
+
+    def _get_catalog_relation_chunks(
+        self, relations: Iterable[BaseRelation]
+    ) -> List[Tuple[InformationSchema, List[BaseRelation]]]:
+        """Split the relations of each information schema into chunks of at
+        most MAX_SCHEMA_METADATA_RELATIONS relations.
+        """
+        chunk_size = self.MAX_SCHEMA_METADATA_RELATIONS
+        chunks: List[Tuple[InformationSchema, List[BaseRelation]]] = []
+        for info_schema, info_relations in self._get_catalog_relations_by_info_schema(
+            relations
+        ).items():
+            for start in range(0, len(info_relations), chunk_size):
+                chunks.append((info_schema, info_relations[start : start + chunk_size]))
+        return chunks
+
+    def _catalog_by_relations_is_cheaper(self, relations: Set[BaseRelation]) -> bool:
+        """Estimate whether fetching the catalog for chunks of relations costs
+        less than fetching the full catalog of every schema they belong to.
+
+        Each query is charged CATALOG_QUERY_COST plus one unit per relation it
+        scans. Schema sizes come from the relations cache, and are otherwise
+        assumed to be no larger than the number of requested relations.
+        """
+        relations_by_info_schema = self._get_catalog_relations_by_info_schema(relations)
+        chunk_size = self.MAX_SCHEMA_METADATA_RELATIONS
+        chunk_count = sum(
+            -(-len(info_relations) // chunk_size)
+            for info_relations in relations_by_info_schema.values()
+        )
+
+        requested: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        for relation in relations:
+            key = (lowercase(relation.database), lowercase(relation.schema))
+            requested[key] = requested.get(key, 0) + 1
+        cached = self.cache.get_relation_counts()
+        schema_size = sum(max(count, cached.get(key, 0)) for key, count in requested.items())
+
+        chunked_cost = chunk_count * self.CATALOG_QUERY_COST + len(relations)
+        full_cost = len(relations_by_info_schema) * self.CATALOG_QUERY_COST + schema_size
+        return chunked_cost <= full_cost
 
     def row_matches_relation(self, row: "agate.Row", relations: Set[BaseRelation]):
         pass
@@ -1252,10 +2015,11 @@ class BaseAdapter(metaclass=AdapterMeta):
                 if len(schemas) == 0:
                     continue
                 name = ".".join([str(info.database), "information_schema"])
-                fut = tpe.submit_connected(
-                    self, name, self._get_one_catalog, info, schemas, used_schemas
-                )
-                futures.append(fut)
+                for schema_group in self._get_catalog_schema_groups(info, schemas):
+                    fut = tpe.submit_connected(
+                        self, name, self._get_one_catalog, info, schema_group, used_schemas
+                    )
+                    futures.append(fut)
 
         catalogs, exceptions = catch_as_completed(futures)
         return catalogs, exceptions
@@ -1265,16 +2029,14 @@ class BaseAdapter(metaclass=AdapterMeta):
     ) -> Tuple["agate.Table", List[Exception]]:
         with executor(self.config) as tpe:
             futures: List[Future["agate.Table"]] = []
-            relations_by_schema = self._get_catalog_relations_by_info_schema(relations)
-            for info_schema in relations_by_schema:
+            for info_schema, chunk in self._get_catalog_relation_chunks(relations):
                 name = ".".join([str(info_schema.database), "information_schema"])
-                relations = set(relations_by_schema[info_schema])
                 fut = tpe.submit_connected(
                     self,
                     name,
                     self._get_one_catalog_by_relations,
                     info_schema,
-                    relations,
+                    chunk,
                     used_schemas,
                 )
                 futures.append(fut)
@@ -1322,21 +2084,146 @@ class BaseAdapter(metaclass=AdapterMeta):
         # the current time according to the db.
         if len(table) != 1 or len(table[0]) != 2:
             raise MacroResultError(FRESHNESS_MACRO_NAME, table)
-        if table[0][0] is None:
+        freshness = self._create_loaded_at_freshness_response(
+            table[0][0], table[0][1], source, loaded_at_field
+        )
+        return adapter_response, freshness
+
+    def calculate_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+        batch_size: Optional[int] = None,
+    ) -> Tuple[List[Optional[AdapterResponse]], Dict[BaseRelation, FreshnessResponse]]:
+        """
+        Given a list of (source, loaded_at_field, filter) tuples, calculate the loaded_at_field
+        freshness of many sources per query. Sources are grouped by database and split into
+        chunks of at most batch_size sources (FRESHNESS_BATCH_SIZE by default); each chunk is
+        collected by the collect_freshness_batch macro, and the chunks run concurrently.
+
+        :param sources: The sources to calculate freshness for, with their loaded_at_field and
+            optional filter
+        :param macro_resolver: An optional macro_resolver to use for collect_freshness_batch
+        :param batch_size: The maximum number of sources to collect in a single query
+        :return: a tuple where:
+            * the first element is a list of optional AdapterResponses, one for each query made.
+            * the second element is a dictionary mapping each input source BaseRelation to its
+              FreshnessResponse. If a relation is listed more than once, the last one wins.
+        """
+        batch_size = batch_size or self.FRESHNESS_BATCH_SIZE
+        sources_by_database: Dict[Optional[str], List[Tuple[BaseRelation, str, Optional[str]]]]
+        sources_by_database = {}
+        for source in sources:
+            sources_by_database.setdefault(lowercase(source[0].database), []).append(source)
+
+        chunks: List[List[Tuple[BaseRelation, str, Optional[str]]]] = []
+        for database_sources in sources_by_database.values():
+            for start in range(0, len(database_sources), batch_size):
+                chunks.append(database_sources[start : start + batch_size])
+
+        results: List[Tuple[Optional[AdapterResponse], Dict[BaseRelation, FreshnessResponse]]]
+        if len(chunks) == 1:
+            # a single query can run on the current connection
+            results = [self._calculate_one_freshness_batch(chunks[0], macro_resolver)]
+        else:
+            with executor(self.config) as tpe:
+                futures = []
+                for chunk in chunks:
+                    name = f"freshness_{chunk[0][0].database}"
+                    fut = tpe.submit_connected(
+                        self, name, self._calculate_one_freshness_batch, chunk, macro_resolver
+                    )
+                    futures.append(fut)
+                # keep the adapter responses in the order the queries were submitted
+                results = [future.result() for future in futures]
+
+        adapter_responses: List[Optional[AdapterResponse]] = []
+        freshness_responses: Dict[BaseRelation, FreshnessResponse] = {}
+        for adapter_response, chunk_responses in results:
+            adapter_responses.append(adapter_response)
+            freshness_responses.update(chunk_responses)
+        return adapter_responses, freshness_responses
+
+    def _calculate_one_freshness_batch(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> Tuple[Optional[AdapterResponse], Dict[BaseRelation, FreshnessResponse]]:
+        import agate
+
+        kwargs: Dict[str, Any] = {
+            "sources": [
+                {"relation": source, "loaded_at_field": loaded_at_field, "filter": filter}
+                for source, loaded_at_field, filter in sources
+            ],
+        }
+        try:
+            result = self.execute_macro(
+                FRESHNESS_BATCH_MACRO_NAME, kwargs=kwargs, macro_resolver=macro_resolver
+            )
+        except DbtDatabaseError:
+            # a loaded_at_field the batch query can't handle, like one that
+            # can't be cast to a timestamp, fails the whole batch: collect the
+            # freshness of its sources one at a time instead
+            return self._calculate_freshness_one_by_one(sources, macro_resolver)
+        if isinstance(result, agate.Table):
+            adapter_response = None
+            table = result
+        else:
+            adapter_response, table = result.response, result.table  # type: ignore[attr-defined]
+
+        # one row per source: its index in the batch, the maximum
+        # `loaded_at_field` value and the current time according to the db.
+        freshness_responses: Dict[BaseRelation, FreshnessResponse] = {}
+        for row in table:
+            if len(row) != 3 or row[0] is None or not 0 <= row[0] < len(sources):
+                raise MacroResultError(FRESHNESS_BATCH_MACRO_NAME, table)
+            source, loaded_at_field, _ = sources[int(row[0])]
+            freshness_responses[source] = self._create_loaded_at_freshness_response(
+                row[1], row[2], source, loaded_at_field
+            )
+        if len(freshness_responses) != len({source for source, _, _ in sources}):
+            raise MacroResultError(FRESHNESS_BATCH_MACRO_NAME, table)
+        return adapter_response, freshness_responses
+
+    def _calculate_freshness_one_by_one(
+        self,
+        sources: List[Tuple[BaseRelation, str, Optional[str]]],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> Tuple[Optional[AdapterResponse], Dict[BaseRelation, FreshnessResponse]]:
+        adapter_response: Optional[AdapterResponse] = None
+        freshness_responses: Dict[BaseRelation, FreshnessResponse] = {}
+        for source, loaded_at_field, filter in sources:
+            adapter_response, freshness_responses[source] = self.calculate_freshness(
+                source, loaded_at_field, filter, macro_resolver
+            )
+        # the response of the last query stands in for the batch
+        return adapter_response, freshness_responses
+
+    def _create_loaded_at_freshness_response(
+        self,
+        max_loaded_at: Optional[datetime],
+        snapshotted_at: Optional[datetime],
+        source: BaseRelation,
+        loaded_at_field: str,
+    ) -> FreshnessResponse:
+        import pytz
+
+        if max_loaded_at is None:
             # no records in the table, so really the max_loaded_at was
             # infinitely long ago. Just call it 0:00 January 1 year UTC
             max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
         else:
-            max_loaded_at = _utc(table[0][0], source, loaded_at_field)
+            max_loaded_at = _utc(max_loaded_at, source, loaded_at_field)
 
-        snapshotted_at = _utc(table[0][1], source, loaded_at_field)
+        snapshotted_at = _utc(snapshotted_at, source, loaded_at_field)
         age = (snapshotted_at - max_loaded_at).total_seconds()
         freshness: FreshnessResponse = {
             "max_loaded_at": max_loaded_at,
             "snapshotted_at": snapshotted_at,
             "age": age,
         }
-        return adapter_response, freshness
+        return freshness
 
     def calculate_freshness_from_metadata_batch(
         self,
@@ -1347,7 +2234,8 @@ class BaseAdapter(metaclass=AdapterMeta):
         Given a list of sources (BaseRelations), calculate the metadata-based freshness in batch.
         This method should _not_ execute a warehouse query per source, but rather batch up
         the sources into as few requests as possible to minimize the number of roundtrips required
-        to compute metadata-based freshness for each input source.
+        to compute metadata-based freshness for each input source. One query is made per
+        information schema, and the queries for different information schemas run concurrently.
 
         :param sources: The list of sources to calculate metadata-based freshness for
         :param macro_resolver: An optional macro_resolver to use for get_relation_last_modified
@@ -1371,22 +2259,41 @@ class BaseAdapter(metaclass=AdapterMeta):
             self._get_catalog_relations_by_info_schema(sources)
         )
 
+        results: List[Tuple[Optional[AdapterResponse], "agate.Table"]] = []
+        if len(sources_by_info_schema) == 1:
+            # a single query can run on the current connection
+            for (
+                information_schema,
+                sources_for_information_schema,
+            ) in sources_by_info_schema.items():
+                results.append(
+                    self._get_one_relation_last_modified(
+                        information_schema, sources_for_information_schema, macro_resolver
+                    )
+                )
+        else:
+            with executor(self.config) as tpe:
+                futures: List[Future[Tuple[Optional[AdapterResponse], "agate.Table"]]] = []
+                for (
+                    information_schema,
+                    sources_for_information_schema,
+                ) in sources_by_info_schema.items():
+                    name = ".".join([str(information_schema.database), "information_schema"])
+                    fut = tpe.submit_connected(
+                        self,
+                        name,
+                        self._get_one_relation_last_modified,
+                        information_schema,
+                        sources_for_information_schema,
+                        macro_resolver,
+                    )
+                    futures.append(fut)
+                # keep the adapter responses in the order the queries were submitted
+                results = [future.result() for future in futures]
+
         freshness_responses: Dict[BaseRelation, FreshnessResponse] = {}
         adapter_responses: List[Optional[AdapterResponse]] = []
-        for (
-            information_schema,
-            sources_for_information_schema,
-        ) in sources_by_info_schema.items():
-            result = self.execute_macro(
-                GET_RELATION_LAST_MODIFIED_MACRO_NAME,
-                kwargs={
-                    "information_schema": information_schema,
-                    "relations": sources_for_information_schema,
-                },
-                macro_resolver=macro_resolver,
-                needs_conn=True,
-            )
-            adapter_response, table = result.response, result.table  # type: ignore[attr-defined]
+        for adapter_response, table in results:
             adapter_responses.append(adapter_response)
 
             for row in table:
@@ -1396,6 +2303,23 @@ class BaseAdapter(metaclass=AdapterMeta):
 
         return adapter_responses, freshness_responses
 
+    def _get_one_relation_last_modified(
+        self,
+        information_schema: InformationSchema,
+        relations: List[BaseRelation],
+        macro_resolver: Optional[MacroResolverProtocol] = None,
+    ) -> Tuple[Optional[AdapterResponse], "agate.Table"]:
+        result = self.execute_macro(
+            GET_RELATION_LAST_MODIFIED_MACRO_NAME,
+            kwargs={
+                "information_schema": information_schema,
+                "relations": relations,
+            },
+            macro_resolver=macro_resolver,
+            needs_conn=True,
+        )
+        return result.response, result.table  # type: ignore[attr-defined]
+
     def calculate_freshness_from_metadata(
         self,
         source: BaseRelation,
@@ -1411,6 +2335,8 @@ class BaseAdapter(metaclass=AdapterMeta):
     def _create_freshness_response(
         self, last_modified: Optional[datetime], snapshotted_at: Optional[datetime]
     ) -> FreshnessResponse:
+        import pytz
+
         if last_modified is None:
             # Interpret missing value as "infinitely long ago"
             max_loaded_at = datetime(1, 1, 1, 0, 0, 0, tzinfo=pytz.UTC)
@@ -1,5 +1,5 @@
 from threading import local
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from dbt_common.exceptions import DbtRuntimeError
 
@@ -25,6 +25,9 @@ class _QueryComment(local):
     def __init__(self, initial) -> None:
         self.query_comment: Optional[str] = initial
         self.append: bool = False
+        # the comment as it is added to each statement, built once per set()
+        self._prefix: str = ""
+        self._suffix: str = ""
 
     def add(self, sql: str) -> str:
         if not self.query_comment:
@@ -33,13 +36,12 @@ class _QueryComment(local):
         if self.append:
             # replace last ';' with '<comment>;'
             sql = sql.rstrip()
-            if sql[-1] == ";":
-                sql = sql[:-1]
-                return "{}\n/* {} */;".format(sql, self.query_comment.strip())
+            if sql.endswith(";"):
+                return sql[:-1] + self._suffix + ";"
 
-            return "{}\n/* {} */".format(sql, self.query_comment.strip())
+            return sql + self._suffix
 
-        return "/* {} */\n{}".format(self.query_comment.strip(), sql)
+        return self._prefix + sql
 
     def set(self, comment: Optional[str], append: bool):
         if isinstance(comment, str) and "*/" in comment:
@@ -48,6 +50,10 @@ class _QueryComment(local):
             raise DbtRuntimeError(f'query comment contains illegal value "*/": {comment}')
         self.query_comment = comment
         self.append = append
+        if comment:
+            comment = comment.strip()
+            self._prefix = "/* {} */\n".format(comment)
+            self._suffix = "\n/* {} */".format(comment)
 
 
 QueryStringFunc = Callable[[str, Optional[QueryHeaderContextWrapper]], str]
@@ -74,6 +80,13 @@ class MacroQueryStringSetter:
             )
             ctx = self._get_context()
             self.generator = QueryStringGenerator(macro, ctx)
+        self._has_comment = bool(comment_macro)
+        self._append = False
+        if isinstance(self.config.query_comment, QueryComment):
+            self._append = self.config.query_comment.append
+        # rendered comments by connection name and node unique_id, so each
+        # node's comment is rendered once per run
+        self._rendered: Dict[Tuple[str, Optional[str]], str] = {}
         self.comment = _QueryComment(None)
         self.reset()
 
@@ -90,12 +103,22 @@ class MacroQueryStringSetter:
         self.set("master", None)
 
     def set(self, name: str, query_header_context: Any):
-        wrapped: Optional[QueryHeaderContextWrapper] = None
-        if query_header_context is not None:
-            wrapped = QueryHeaderContextWrapper(query_header_context)
-        comment_str = self.generator(name, wrapped)
+        if not self._has_comment:
+            self.comment.set("", self._append)
+            return
 
-        append = False
-        if isinstance(self.config.query_comment, QueryComment):
-            append = self.config.query_comment.append
-        self.comment.set(comment_str, append)
+        key: Optional[Tuple[str, Optional[str]]] = (name, None)
+        if query_header_context is not None:
+            unique_id = getattr(query_header_context, "unique_id", None)
+            key = (name, unique_id) if isinstance(unique_id, str) else None
+
+        comment_str = self._rendered.get(key) if key is not None else None
+        if comment_str is None:
+            wrapped: Optional[QueryHeaderContextWrapper] = None
+            if query_header_context is not None:
+                wrapped = QueryHeaderContextWrapper(query_header_context)
+            comment_str = self.generator(name, wrapped)
+            if key is not None:
+                self._rendered[key] = comment_str
+
+        self.comment.set(comment_str, self._append)
@@ -1,8 +1,10 @@
 from collections.abc import Hashable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from datetime import datetime
+from enum import Enum
 from typing import (
     Any,
+    Callable,
     Dict,
     FrozenSet,
     Iterator,
@@ -12,7 +14,11 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    get_args,
+    get_origin,
+    get_type_hints,
 )
+from weakref import WeakValueDictionary
 
 from dbt_common.exceptions import CompilationError, DbtRuntimeError
 from dbt_common.utils import deep_merge, filter_null_values
@@ -37,6 +43,139 @@ Self = TypeVar("Self", bound="BaseRelation")
 SerializableIterable = Union[Tuple, FrozenSet]
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convert the output of to_dict() into an equivalent hashable value."""
+    if isinstance(value, dict):
+        return tuple((k, _freeze(value[k])) for k in sorted(value))
+    elif isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# returned by the converters below for values that need the full
+# to_dict/from_dict round trip of FakeAPIObject.incorporate
+_NOT_SIMPLE = object()
+
+FieldConverter = Callable[[Any, Any], Any]
+
+
+def _scalar_converter(field_type: Any) -> Optional[Callable[[Any], Any]]:
+    """Return a function that checks a value for a str, bool, int or enum
+    field (optionally Optional), or None for any other field type.
+    """
+    nullable = False
+    if get_origin(field_type) is Union:
+        args = get_args(field_type)
+        non_null = [arg for arg in args if arg is not type(None)]
+        if len(non_null) != 1:
+            return None
+        nullable = len(non_null) != len(args)
+        field_type = non_null[0]
+
+    if not isinstance(field_type, type):
+        return None
+    elif issubclass(field_type, Enum):
+        enum_type = field_type
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return value if nullable else _NOT_SIMPLE
+            if isinstance(value, enum_type):
+                return value
+            if isinstance(value, str):
+                try:
+                    return enum_type(value)
+                except ValueError:
+                    return _NOT_SIMPLE
+            return _NOT_SIMPLE
+
+    elif field_type in (str, bool, int):
+        scalar_type = field_type
+
+        def convert(value: Any) -> Any:
+            if value is None:
+                return value if nullable else _NOT_SIMPLE
+            return value if type(value) is scalar_type else _NOT_SIMPLE
+
+    else:
+        return None
+    return convert
+
+
+def _nested_converter(field_type: Any) -> Optional[FieldConverter]:
+    """Return a function that applies a dict of scalar values to a nested
+    FakeAPIObject field (such as a Path or Policy), or None if the field is
+    not such an object.
+    """
+    if not (isinstance(field_type, type) and issubclass(field_type, FakeAPIObject)):
+        return None
+    hints = get_type_hints(field_type)
+    converters: Dict[str, Callable[[Any], Any]] = {}
+    for f in fields(field_type):  # type: ignore[arg-type]
+        converter = _scalar_converter(hints[f.name])
+        if converter is None or not f.init:
+            return None
+        converters[f.name] = converter
+
+    def convert(current: Any, value: Any) -> Any:
+        if not isinstance(value, dict) or current is None:
+            return _NOT_SIMPLE
+        changes = {}
+        for key, part in value.items():
+            converter = converters.get(key)
+            if converter is None:
+                return _NOT_SIMPLE
+            part = converter(part)
+            if part is _NOT_SIMPLE:
+                return _NOT_SIMPLE
+            changes[key] = part
+        return current.replace(**changes)
+
+    return convert
+
+
+def _ignore_current(convert: Callable[[Any], Any]) -> FieldConverter:
+    return lambda current, value: convert(value)
+
+
+_INCORPORATE_CONVERTERS: Dict[type, Dict[str, FieldConverter]] = {}
+
+
+def _incorporate_converters(cls: type) -> Dict[str, FieldConverter]:
+    """Return the fields of cls that incorporate() can set without a
+    to_dict/from_dict round trip, with the function that computes each new
+    value from the current value and the incorporated value.
+    """
+    converters = _INCORPORATE_CONVERTERS.get(cls)
+    if converters is not None:
+        return converters
+
+    converters = {}
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        # unresolvable annotations on an adapter's relation, use the slow path
+        hints = {}
+    for f in fields(cls):
+        if f.name not in hints or not f.init:
+            continue
+        scalar = _scalar_converter(hints[f.name])
+        if scalar is not None:
+            converters[f.name] = _ignore_current(scalar)
+            continue
+        nested = _nested_converter(hints[f.name])
+        if nested is not None:
+            converters[f.name] = nested
+    _INCORPORATE_CONVERTERS[cls] = converters
+    return converters
+
+
+# Equal relations derived from other relations (schema relations, information
+# schemas) are shared through this pool. Entries are dropped once unused.
+_INTERNED_RELATIONS: "WeakValueDictionary[Tuple[type, Hashable], BaseRelation]"
+_INTERNED_RELATIONS = WeakValueDictionary()
+
+
 @dataclass
 class EventTimeFilter(FakeAPIObject):
     field_name: str
@@ -86,10 +225,49 @@ class BaseRelation(FakeAPIObject, Hashable):
         # this should be unreachable
         raise ValueError(f"BaseRelation has no {field_name} field!")
 
+    def _identity(self) -> Hashable:
+        """Return a hashable form of `to_dict(omit_none=True)`, which is what
+        relations are compared by. Relations are immutable, so it is computed
+        once and stored on the instance.
+        """
+        try:
+            return self.__dict__["_cached_identity"]
+        except KeyError:
+            identity = _freeze(self.to_dict(omit_none=True))
+            object.__setattr__(self, "_cached_identity", identity)
+            return identity
+
+    def _interned(self: Self) -> Self:
+        """Return the shared instance of relations equal to this one."""
+        return _INTERNED_RELATIONS.setdefault(  # type: ignore[return-value]
+            (type(self), self._identity()), self
+        )
+
+    def _derived(self, key: Hashable, derive: Callable[[], Any]) -> Any:
+        """Return the relation that derive() builds from this relation. It is
+        built once per instance, and equal results are shared between
+        instances.
+        """
+        cache = self.__dict__.get("_cached_derived")
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_cached_derived", cache)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        derived = derive()
+        if isinstance(derived, BaseRelation):
+            derived = derived._interned()
+        cache[key] = derived
+        return derived
+
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
-        return self.to_dict(omit_none=True) == other.to_dict(omit_none=True)
+        return self._identity() == other._identity()
 
     @classmethod
     def get_default_quote_policy(cls) -> Policy:
@@ -142,6 +320,29 @@ class BaseRelation(FakeAPIObject, Hashable):
 
         return exact_match
 
+    def incorporate(self, **kwargs):
+        """Return a copy of this relation with the kwargs deep-merged into it.
+
+        When every value is a plain value of its field's type, or a dict of
+        plain values for a nested field like `path` or `quote_policy`, the new
+        relation is built directly from the field values instead of round
+        tripping through to_dict and from_dict.
+        """
+        if kwargs:
+            converters = _incorporate_converters(type(self))
+            changes = {}
+            for key, value in kwargs.items():
+                converter = converters.get(key)
+                if converter is None:
+                    break
+                value = converter(getattr(self, key), value)
+                if value is _NOT_SIMPLE:
+                    break
+                changes[key] = value
+            else:
+                return self.replace(**changes)
+        return super().incorporate(**kwargs)
+
     def replace_path(self, **kwargs):
         return self.replace(path=self.path.replace(**kwargs))
 
@@ -184,13 +385,16 @@ class BaseRelation(FakeAPIObject, Hashable):
         if not isinstance(view_name, str):
             view_name = None
 
-        # Kick the user-supplied schema out of the information schema relation
-        # Instead address this as <database>.information_schema by default
-        info_schema = InformationSchema.from_relation(self, view_name)
-        return info_schema.incorporate(path={"schema": None})
+        def derive() -> "InformationSchema":
+            # Kick the user-supplied schema out of the information schema relation
+            # Instead address this as <database>.information_schema by default
+            info_schema = InformationSchema.from_relation(self, view_name)
+            return info_schema.incorporate(path={"schema": None})
+
+        return self._derived(("information_schema", view_name), derive)
 
     def information_schema_only(self) -> "InformationSchema":
-        return self.information_schema()
+        return self._derived("information_schema_only", self.information_schema)
 
     def without_identifier(self) -> "BaseRelation":
         """Return a form of this relation that only has the database and schema
@@ -200,7 +404,10 @@ class BaseRelation(FakeAPIObject, Hashable):
 
         The hash of the returned object is the result of render().
         """
-        return self.include(identifier=False).replace_path(identifier=None)
+        return self._derived(
+            "without_identifier",
+            lambda: self.include(identifier=False).replace_path(identifier=None),
+        )
 
     def _render_iterator(
         self,
@@ -214,8 +421,16 @@ class BaseRelation(FakeAPIObject, Hashable):
             yield key, path_part
 
     def render(self) -> str:
+        # relations are immutable, so the rendered form is computed once and
+        # stored on the instance. It is also what relations are hashed by.
+        try:
+            return self.__dict__["_cached_render"]
+        except KeyError:
+            pass
         # if there is nothing set, this will return the empty string.
-        return ".".join(part for _, part in self._render_iterator() if part is not None)
+        rendered = ".".join(part for _, part in self._render_iterator() if part is not None)
+        object.__setattr__(self, "_cached_render", rendered)
+        return rendered
 
     def _render_subquery_alias(self, namespace: str) -> str:
         """Some databases require an alias for subqueries (postgres, mysql) for all others we want to avoid adding
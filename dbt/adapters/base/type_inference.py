@@ -0,0 +1,246 @@
+"""Single-pass type inference for seed files.
+
+agate infers the types of a CSV by building a table of every row, and the
+convert_*_type hooks then run an aggregate (a further pass) per column. The
+TypeInferrer below tests each distinct value of a column once against the
+same candidate types, in the same order, and keeps only the values that
+decide the result of the aggregates the hooks use: the minimum, the maximum,
+the longest text, the most whole and decimal places and a null. Those
+values make up a small summary table with the types agate would infer, which
+can be passed to the convert_*_type hooks in place of the full table.
+"""
+
+import csv
+from decimal import Decimal
+import itertools
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import agate
+from agate.exceptions import CastError
+from dbt_common.clients.agate_helper import build_type_tester
+
+_MISSING = object()
+
+# the number of distinct values per column remembered so that repeats are
+# not tested again
+_SEEN_LIMIT = 4096
+
+INFERENCE_BATCH_SIZE = 10000
+
+# numbers that agate.Number parses to exactly Decimal(value), without the
+# symbol stripping it has to try first
+_PLAIN_NUMBER = re.compile(r"-?[0-9]+(\.[0-9]+)?")
+
+
+def _tester_types(
+    text_columns: Iterable[str],
+) -> Tuple[List[agate.data_types.DataType], Dict[str, agate.data_types.DataType]]:
+    # the candidate types, in the order agate tries them, and the forced types
+    # of the TypeTester that dbt_common builds for seeds, so that the types
+    # agate would try are tried here too; agate.TypeTester has no public
+    # accessor for them, but has kept them in these attributes throughout 1.x
+    tester = build_type_tester(list(text_columns))
+    possible_types = tester._possible_types  # type: ignore[attr-defined]
+    force = tester._force  # type: ignore[attr-defined]
+    return list(possible_types), dict(force)
+
+
+def _caster(data_type: agate.data_types.DataType) -> Callable[[str], Any]:
+    cast = data_type.cast
+    if not (
+        isinstance(data_type, agate.Number)
+        and data_type.decimal_symbol == "."
+        and data_type.group_symbol == ","
+    ):
+        return cast
+
+    match = _PLAIN_NUMBER.fullmatch
+
+    def cast_number(raw: str) -> Any:
+        if match(raw):
+            return Decimal(raw)
+        return cast(raw)
+
+    return cast_number
+
+
+class _Hypothesis:
+    """A candidate type for a column, with the raw values that decide the
+    aggregates over the column if it ends up with this type.
+    """
+
+    def __init__(self, data_type: agate.data_types.DataType) -> None:
+        self.data_type = data_type
+        self.cast = _caster(data_type)
+        self.is_number = isinstance(data_type, agate.Number)
+        self.is_ordered = self.is_number or isinstance(data_type, agate.Date)
+        self.is_ordered = self.is_ordered or isinstance(data_type, agate.DateTime)
+        self.is_text = isinstance(data_type, agate.Text)
+        self.first: Any = _MISSING
+        self.null: Any = _MISSING
+        self.min: Any = _MISSING
+        self.max: Any = _MISSING
+        self.min_value: Any = None
+        self.max_value: Any = None
+        self.most_whole: Any = _MISSING
+        self.most_decimals: Any = _MISSING
+        self.whole_places = 1
+        self.decimal_places = 0
+        self.longest: Any = _MISSING
+        self.longest_bytes: Any = _MISSING
+        self.length = -1
+        self.byte_length = -1
+
+    def observe(self, raw: Optional[str], value: Any) -> None:
+        if value is None:
+            if self.null is _MISSING:
+                self.null = raw
+            return
+        if self.first is _MISSING:
+            self.first = raw
+
+        if self.is_text:
+            length = len(value)
+            if length > self.length:
+                self.length, self.longest = length, raw
+            byte_length = length if value.isascii() else len(value.encode("utf-8"))
+            if byte_length > self.byte_length:
+                self.byte_length, self.longest_bytes = byte_length, raw
+            return
+
+        if self.is_number:
+            if not value.is_finite():
+                return
+            _, digits, exponent = value.normalize().as_tuple()
+            whole_places = len(digits) + exponent
+            if whole_places > self.whole_places:
+                self.whole_places, self.most_whole = whole_places, raw
+            if -exponent > self.decimal_places:
+                self.decimal_places, self.most_decimals = -exponent, raw
+
+        if self.is_ordered:
+            if self.min is _MISSING:
+                self.min = self.max = raw
+                self.min_value = self.max_value = value
+                return
+            try:
+                if value < self.min_value:
+                    self.min, self.min_value = raw, value
+                elif value > self.max_value:
+                    self.max, self.max_value = raw, value
+            except TypeError:
+                # naive and aware datetimes can't be compared, by agate either
+                pass
+
+    def witnesses(self) -> List[Any]:
+        candidates = (
+            self.first,
+            self.min,
+            self.max,
+            self.most_whole,
+            self.most_decimals,
+            self.longest,
+            self.longest_bytes,
+            self.null,
+        )
+        return list(dict.fromkeys(raw for raw in candidates if raw is not _MISSING))
+
+
+class TypeInferrer:
+    """Infer the agate types of the columns of a CSV from its raw string
+    values, fed in chunks of rows with update().
+
+    :param column_names: The names of the columns, from the CSV header.
+    :param text_columns: Columns that are always Text, as with the seed
+        column_types config.
+    """
+
+    def __init__(self, column_names: Sequence[str], text_columns: Iterable[str] = ()) -> None:
+        possible_types, force = _tester_types(text_columns)
+        self.column_names = list(column_names)
+        self._hypotheses: List[List[_Hypothesis]] = []
+        for name in self.column_names:
+            types = [force[name]] if name in force else possible_types
+            self._hypotheses.append([_Hypothesis(data_type) for data_type in types])
+        self._seen: List[Set[str]] = [set() for _ in self.column_names]
+
+    def update(self, rows: Sequence[Sequence[str]]) -> None:
+        # work a column at a time; values missing from short rows are nulls
+        # and values past the end of the header are ignored
+        columns = list(itertools.zip_longest(*rows, fillvalue=_MISSING))
+        for idx, (hypotheses, seen) in enumerate(zip(self._hypotheses, self._seen)):
+            values = columns[idx] if idx < len(columns) else (_MISSING,)
+            self._update_column(hypotheses, seen, values)
+
+    @staticmethod
+    def _update_column(
+        hypotheses: List[_Hypothesis], seen: Set[str], values: Iterable[Any]
+    ) -> None:
+        for raw in values:
+            if raw in seen:
+                continue
+            if raw is _MISSING:
+                for hypothesis in hypotheses:
+                    hypothesis.observe(None, None)
+                continue
+            if len(seen) < _SEEN_LIMIT:
+                seen.add(raw)
+            for hypothesis in list(hypotheses):
+                try:
+                    value = hypothesis.cast(raw)
+                except CastError:
+                    hypotheses.remove(hypothesis)
+                else:
+                    hypothesis.observe(raw, value)
+
+    def summary_table(self) -> agate.Table:
+        """A table with the inferred column types, holding only the values
+        that decide the result of the Min, Max, MaxLength, MaxPrecision and
+        HasNulls aggregates over each column. Its row count is not that of
+        the data.
+        """
+        column_types = []
+        columns = []
+        for hypotheses in self._hypotheses:
+            # the first hypothesis left is the one agate would prefer
+            hypothesis = hypotheses[0]
+            column_types.append(hypothesis.data_type)
+            columns.append(hypothesis.witnesses())
+
+        height = max((len(column) for column in columns), default=0)
+        padded = [column + column[:1] * (height - len(column)) for column in columns]
+        return agate.Table(list(zip(*padded)), self.column_names, column_types=column_types)
+
+
+def infer_row_types(
+    rows: Iterable[Sequence[str]],
+    column_names: Sequence[str],
+    text_columns: Iterable[str] = (),
+    batch_size: int = INFERENCE_BATCH_SIZE,
+) -> agate.Table:
+    """Scan rows of raw string values once, in chunks of batch_size rows, and
+    return the summary table of the types agate would infer for them.
+    """
+    inferrer = TypeInferrer(column_names, text_columns)
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, batch_size))
+        if not chunk:
+            return inferrer.summary_table()
+        inferrer.update(chunk)
+
+
+def infer_csv_types(
+    source: Union[str, "os.PathLike[str]"],
+    text_columns: Iterable[str] = (),
+    batch_size: int = INFERENCE_BATCH_SIZE,
+) -> agate.Table:
+    """Like infer_row_types, for the rows of a CSV file with a header row."""
+    with open(source, newline="", encoding="utf-8-sig") as fp:
+        reader = csv.reader(fp)
+        header = next(reader, None)
+        if header is None:
+            return agate.Table([])
+        return infer_row_types(reader, header, text_columns, batch_size)
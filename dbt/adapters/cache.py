@@ -1,4 +1,5 @@
 from copy import deepcopy
+import string
 import threading
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
@@ -28,6 +29,18 @@ def dot_separated(key: _ReferenceKey) -> str:
     return ".".join(map(str, key))
 
 
+def _fold_identifier(identifier: Optional[str]) -> Optional[str]:
+    """Return the key that the identifier lookup index stores an identifier
+    under. Relations approximately match when their lowercased identifiers are
+    equal once quote characters are stripped, so strip every punctuation
+    character: that keeps all approximate matches under the same key, whatever
+    an adapter's quote character is.
+    """
+    if identifier is None:
+        return None
+    return identifier.lower().strip(string.punctuation)
+
+
 class _CachedRelation:
     """Nothing about _CachedRelation is guaranteed to be thread-safe!
 
@@ -163,14 +176,42 @@ class RelationsCache:
     :attr threading.RLock lock: The lock around relations, held during updates.
         The adapters also hold this lock while filling the cache.
     :attr Set[str] schemas: The set of known/cached schemas, all lowercased.
+    :attr Dict identifiers: The keys of the known relations in each lowercased
+        schema, indexed by folded identifier.
     """
 
     def __init__(self, log_cache_events: bool = False) -> None:
         self.relations: Dict[_ReferenceKey, _CachedRelation] = {}
         self.lock = threading.RLock()
         self.schemas: Set[Tuple[Optional[str], Optional[str]]] = set()
+        self.identifiers: Dict[
+            Tuple[Optional[str], Optional[str]], Dict[Optional[str], Set[_ReferenceKey]]
+        ] = {}
         self.log_cache_events = log_cache_events
 
+    def _index_key(self, key: _ReferenceKey) -> None:
+        """Add a relation key to the identifier index. Callers should hold the
+        lock.
+        """
+        schema_index = self.identifiers.setdefault((key.database, key.schema), {})
+        schema_index.setdefault(_fold_identifier(key.identifier), set()).add(key)
+
+    def _unindex_key(self, key: _ReferenceKey) -> None:
+        """Remove a relation key from the identifier index. Callers should hold
+        the lock.
+        """
+        schema_key = (key.database, key.schema)
+        schema_index = self.identifiers.get(schema_key, {})
+        folded = _fold_identifier(key.identifier)
+        keys = schema_index.get(folded)
+        if keys is None:
+            return
+        keys.discard(key)
+        if not keys:
+            del schema_index[folded]
+            if not schema_index:
+                del self.identifiers[schema_key]
+
     def add_schema(
         self,
         database: Optional[str],
@@ -241,6 +282,8 @@ class RelationsCache:
         """
         self.add_schema(relation.database, relation.schema)
         key = relation.key()
+        if key not in self.relations:
+            self._index_key(key)
         return self.relations.setdefault(key, relation)
 
     def _add_link(self, referenced_key, dependent_key):
@@ -342,6 +385,7 @@ class RelationsCache:
         # remove direct refs
         for key in keys:
             del self.relations[key]
+            self._unindex_key(key)
         # then remove all entries from each child
         for cached in self.relations.values():
             cached.release_references(keys)
@@ -388,6 +432,7 @@ class RelationsCache:
         # basically, the name changes but some underlying ID moves. Kind of
         # like an object reference!
         relation = self.relations.pop(old_key)
+        self._unindex_key(old_key)
         new_key = new_relation.key()
 
         # relation has to rename its innards, so it needs the _CachedRelation.
@@ -407,6 +452,7 @@ class RelationsCache:
                 cached.rename_key(old_key, new_key)
 
         self.relations[new_key] = relation
+        self._index_key(new_key)
         # also fixup the schemas!
         self.add_schema(new_key.database, new_key.schema)
 
@@ -492,11 +538,46 @@ class RelationsCache:
             raise NoneRelationFoundError()
         return results
 
+    def get_relations_by_identifier(
+        self, database: Optional[str], schema: Optional[str], identifier: str
+    ) -> List[Any]:
+        """Case-insensitively get the relations in the given schema that could
+        match the given identifier, ignoring any quote characters around it.
+        This is a superset of the relations that `BaseRelation.matches` will
+        match exactly or approximately, found without scanning the schema.
+
+        :param str schema: The case-insensitive schema name to list from.
+        :param str identifier: The identifier to look up.
+        :return List[BaseRelation]: The candidate relations.
+        """
+        schema_key = (lowercase(database), lowercase(schema))
+        with self.lock:
+            keys = self.identifiers.get(schema_key, {}).get(_fold_identifier(identifier), ())
+            results = [self.relations[key].inner for key in keys]
+
+        if None in results:
+            raise NoneRelationFoundError()
+        return results
+
+    def get_relation_counts(self) -> Dict[Tuple[Optional[str], Optional[str]], int]:
+        """Count the cached relations in each schema.
+
+        :return Dict[Tuple[Optional[str], Optional[str]], int]: The number of
+            relations keyed by the lowercased database and schema names.
+        """
+        counts: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        with self.lock:
+            for key in self.relations:
+                schema_key = (key.database, key.schema)
+                counts[schema_key] = counts.get(schema_key, 0) + 1
+        return counts
+
     def clear(self):
         """Clear the cache"""
         with self.lock:
             self.relations.clear()
             self.schemas.clear()
+            self.identifiers.clear()
 
     def _list_relations_in_schema(
         self, database: Optional[str], schema: Optional[str]
@@ -21,6 +21,15 @@ class Capability(str, Enum):
     """Indicates support for getting catalog information including table-level and column-level metadata for a single
     relation."""
 
+    CatalogFilterPushdown = "CatalogFilterPushdown"
+    """Indicates that the get_catalog and get_catalog_relations macros only return rows for the requested schemas and
+    relations, so the catalog results do not need to be filtered again after they are fetched."""
+
+    NonTransactionalDDL = "NonTransactionalDDL"
+    """Indicates that DDL statements are committed as soon as they run, or do not run in a transaction at all, so the
+    relations they create are visible to other connections right away. Seeds are only loaded over several connections
+    with this capability."""
+
 
 class Support(str, Enum):
     Unknown = "Unknown"
@@ -1,3 +1,7 @@
+import importlib
+from types import ModuleType
+from typing import Optional
+
 # Aliasing common Level classes in order to make custom, but not overly-verbose versions that have PROTO_TYPES_MODULE set to the adapter-specific generated types_pb2 module
 from dbt_common.events.base_types import (
     BaseEvent,
@@ -9,11 +13,25 @@ from dbt_common.events.base_types import (
     WarnLevel as CommonWarnLevel,
 )
 
-from dbt.adapters.events import adapter_types_pb2
+
+class _LazyModule:
+    """A class attribute holding a module, which is only imported when the
+    attribute is first used.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.module: Optional[ModuleType] = None
+
+    def __get__(self, instance, owner) -> ModuleType:
+        if self.module is None:
+            self.module = importlib.import_module(self.name)
+        return self.module
 
 
 class AdapterBaseEvent(BaseEvent):
-    PROTO_TYPES_MODULE = adapter_types_pb2
+    # the generated protobuf module is only needed once an event is fired
+    PROTO_TYPES_MODULE = _LazyModule("dbt.adapters.events.adapter_types_pb2")  # type: ignore[assignment]
 
 
 class DynamicLevel(CommonDynamicLevel, AdapterBaseEvent):
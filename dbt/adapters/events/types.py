@@ -435,3 +435,24 @@ class TypeCodeNotFound(DebugLevel):
             "returned by `get_column_schema_from_query`"
         )
         return line_wrap_message(warning_tag(msg))
+
+
+class ColumnChanges(DebugLevel):
+    def code(self) -> str:
+        return "E051"
+
+    def message(self) -> str:
+        changes = []
+        if self.added_columns:
+            changes.append(f"adding {', '.join(self.added_columns)}")
+        if self.removed_columns:
+            changes.append(f"removing {', '.join(self.removed_columns)}")
+        for change in self.type_changes:
+            if change.orig_type:
+                changes.append(
+                    f"changing {change.column_name} from {change.orig_type} to {change.new_type}"
+                )
+            else:
+                changes.append(f"changing {change.column_name} to {change.new_type}")
+        table = ".".join((self.table.database, self.table.schema, self.table.identifier))
+        return f"Changing columns in table {table}: {'; '.join(changes)}"
@@ -0,0 +1,33 @@
+"""Lazy attributes for packages, so that importing a package, or any one of its
+modules, doesn't import the modules behind everything the package exports.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_attributes(
+    package: str, attributes: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build the module __getattr__ and __dir__ functions (PEP 562) of a
+    package whose attributes are imported from its modules when they are first
+    used.
+
+    :param package: The name of the package.
+    :param attributes: The module each attribute is imported from, by name.
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name), name)
+        # later lookups find the attribute without calling __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,230 @@
+"""Bundles of the macros of an include path, cached on disk.
+
+Parsing and compiling the Jinja of the ~100 macro files of the global project,
+and those of each adapter plugin, takes about a second, and it has to be done
+by every invocation. A MacroBundle holds the macro files of an include path,
+with the name and compiled template code of each macro they define. Bundles
+are cached on disk under a hash of the contents of the files, and of the
+versions of what compiled them, so a bundle is rebuilt only when one of those
+changes, and loading an unchanged bundle takes milliseconds. Rebuilding the
+bundle of an include path removes its previous bundles from the cache.
+"""
+
+import dataclasses
+import hashlib
+import marshal
+import os
+from pathlib import Path
+import sys
+import tempfile
+from types import CodeType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import jinja2
+from dbt_common.__about__ import version as dbt_common_version
+from dbt_common.clients.jinja import catch_jinja, extract_toplevel_blocks, get_environment
+from dbt_common.exceptions import CompilationError
+from dbt_common.utils.jinja import MACRO_PREFIX
+
+MACRO_PATH = "macros"
+MACRO_BLOCKS = {"macro", "materialization", "test", "data_test"}
+
+# bump this when the contents of a bundle change, so cached bundles are rebuilt
+_BUNDLE_FORMAT = 1
+
+
+def get_macro_cache_dir() -> Optional[Path]:
+    """
+    Get the directory macro bundles are cached in from the environment variables.
+
+    If DBT_MACRO_CACHE_DIR is set to an empty string, bundles are not cached.
+    Expected format: 'DBT_MACRO_CACHE_DIR=/path/to/cache'
+    """
+    cache_dir = os.environ.get("DBT_MACRO_CACHE_DIR")
+    if cache_dir is None:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        return Path(cache_home) / "dbt" / "macro_bundles"
+    if cache_dir == "":
+        return None
+    return Path(cache_dir)
+
+
+@dataclasses.dataclass
+class BundledMacro:
+    name: str
+    contents: str
+    code: CodeType
+
+    def get_template(self, ctx: Dict[str, Any], capture_macros: bool = False) -> jinja2.Template:
+        """The template of the macro, as get_template() would compile it from
+        its contents.
+        """
+        env = get_environment(None, capture_macros)
+        return env.template_class.from_code(env, self.code, env.make_globals(ctx), None)
+
+
+@dataclasses.dataclass
+class MacroFile:
+    # the path of the file, relative to the include path
+    path: str
+    contents: str
+    macros: List[BundledMacro]
+
+
+@dataclasses.dataclass
+class MacroBundle:
+    include_path: Path
+    digest: str
+    files: List[MacroFile]
+
+    def macros(self) -> Iterator[BundledMacro]:
+        for macro_file in self.files:
+            yield from macro_file.macros
+
+    def _dump(self) -> bytes:
+        files = [
+            (f.path, f.contents, [(m.name, m.contents, m.code) for m in f.macros])
+            for f in self.files
+        ]
+        return marshal.dumps((_BUNDLE_FORMAT, self.digest, files))
+
+    @classmethod
+    def _load(cls, include_path: Path, data: bytes, expected_digest: str) -> "MacroBundle":
+        bundle_format, digest, files = marshal.loads(data)
+        if bundle_format != _BUNDLE_FORMAT:
+            raise ValueError(f"Unknown macro bundle format {bundle_format}")
+        if digest != expected_digest:
+            raise ValueError(f"Macro bundle digest {digest} does not match {expected_digest}")
+        return cls(
+            include_path,
+            digest,
+            [
+                MacroFile(path, contents, [BundledMacro(*macro) for macro in macros])
+                for path, contents, macros in files
+            ],
+        )
+
+
+def _read_sources(include_path: Path) -> List[Tuple[str, bytes]]:
+    # the include paths of dbt and its adapters keep their macros in macros/
+    sources = []
+    for path in (include_path / MACRO_PATH).rglob("*.sql"):
+        sources.append((path.relative_to(include_path).as_posix(), path.read_bytes()))
+    return sorted(sources)
+
+
+def _digest(sources: List[Tuple[str, bytes]]) -> str:
+    # compiled code can only be loaded by the same python, and may differ
+    # between versions of jinja and dbt-common
+    sha = hashlib.sha256()
+    for part in (
+        str(_BUNDLE_FORMAT),
+        sys.implementation.cache_tag,
+        jinja2.__version__,
+        dbt_common_version,
+    ):
+        sha.update(part.encode("utf-8") + b"\0")
+    for path, contents in sources:
+        sha.update(path.encode("utf-8") + b"\0")
+        sha.update(hashlib.sha256(contents).digest())
+    return sha.hexdigest()
+
+
+def _bundle_macros(path: str, contents: str) -> List[BundledMacro]:
+    env = get_environment()
+    macros = []
+    blocks = extract_toplevel_blocks(contents, allowed_blocks=MACRO_BLOCKS, collect_raw_data=False)
+    for block in blocks:
+        full_block = block.full_block or ""
+        with catch_jinja():
+            ast = env.parse(full_block)
+            macro_nodes = list(ast.find_all(jinja2.nodes.Macro))
+            if len(macro_nodes) != 1:
+                raise CompilationError(
+                    f"Found {len(macro_nodes)} macros in a block of {path}, expected 1"
+                )
+            name = macro_nodes[0].name.replace(MACRO_PREFIX, "", 1)
+            # the parsed template compiles to the same code as its source
+            code = env.compile(ast)
+        macros.append(BundledMacro(name, full_block, code))
+    return macros
+
+
+def build_macro_bundle(include_path: Path) -> MacroBundle:
+    """Build the macro bundle of an include path, without the cache."""
+    sources = _read_sources(include_path)
+    return _build(include_path, sources, _digest(sources))
+
+
+def _build(include_path: Path, sources: List[Tuple[str, bytes]], digest: str) -> MacroBundle:
+    files = []
+    for path, raw in sources:
+        contents = raw.decode("utf-8")
+        files.append(MacroFile(path, contents, _bundle_macros(path, contents)))
+    return MacroBundle(include_path, digest, files)
+
+
+def load_macro_bundle(include_path: Path, cache_dir: Optional[Path] = None) -> MacroBundle:
+    """Load the macro bundle of an include path from the cache in cache_dir,
+    or build it and add it to the cache if it isn't there. Without a
+    cache_dir, the bundle is always built.
+    """
+    sources = _read_sources(include_path)
+    digest = _digest(sources)
+    if cache_dir is None:
+        return _build(include_path, sources, digest)
+
+    path_key = _path_key(include_path)
+    cache_file = cache_dir / f"{path_key}-{digest}.bundle"
+    try:
+        return MacroBundle._load(include_path, _read_bundle(cache_file), digest)
+    except (OSError, ValueError, EOFError, TypeError):
+        # missing, untrusted, or not readable by this python: rebuild it
+        pass
+
+    bundle = _build(include_path, sources, digest)
+    try:
+        _write_bundle(bundle, cache_file)
+    except OSError:
+        # the cache is an optimization, so a read-only cache dir isn't an error
+        return bundle
+
+    # the older bundles of the include path won't be read again
+    for old_file in cache_dir.glob(f"{path_key}-*.bundle"):
+        if old_file != cache_file:
+            try:
+                old_file.unlink()
+            except OSError:
+                pass
+    return bundle
+
+
+def _path_key(include_path: Path) -> str:
+    # the bundles of an include path are named after it, so that they can be
+    # found and replaced when it changes
+    path = str(include_path.resolve()).encode("utf-8")
+    return hashlib.sha256(path).hexdigest()[:16]
+
+
+def _read_bundle(cache_file: Path) -> bytes:
+    # bundles hold code that is run, so only read those no other user could
+    # have written
+    with open(cache_file, "rb") as fp:
+        stat = os.fstat(fp.fileno())
+        if hasattr(os, "getuid") and (stat.st_uid != os.getuid() or stat.st_mode & 0o022):
+            raise ValueError(f"Macro bundle {cache_file} is writable by other users")
+        return fp.read()
+
+
+def _write_bundle(bundle: MacroBundle, cache_file: Path) -> None:
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # write to a temporary file first, so that concurrent invocations never
+    # read a partly written bundle
+    fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(bundle._dump())
+        os.replace(tmp_name, cache_file)
+    finally:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
@@ -1,2 +1,3 @@
 from dbt.adapters.record.handle import RecordReplayHandle
 from dbt.adapters.record.cursor.cursor import RecordReplayCursor
+from dbt.adapters.record.store import BinaryRecorder
@@ -9,6 +9,7 @@ from dbt.adapters.record.cursor.fetchone import CursorFetchOneRecord
 from dbt.adapters.record.cursor.fetchmany import CursorFetchManyRecord
 from dbt.adapters.record.cursor.fetchall import CursorFetchAllRecord
 from dbt.adapters.record.cursor.rowcount import CursorGetRowCountRecord
+from dbt.adapters.record.cursor.timing import timed
 
 
 class RecordReplayCursor:
@@ -25,19 +26,23 @@ class RecordReplayCursor:
 
     @record_function(CursorExecuteRecord, method=True, id_field_name="connection_name")
     def execute(self, operation, parameters=None) -> None:
-        self.native_cursor.execute(operation, parameters)
+        with timed():
+            self.native_cursor.execute(operation, parameters)
 
     @record_function(CursorFetchOneRecord, method=True, id_field_name="connection_name")
     def fetchone(self) -> Any:
-        return self.native_cursor.fetchone()
+        with timed():
+            return self.native_cursor.fetchone()
 
     @record_function(CursorFetchManyRecord, method=True, id_field_name="connection_name")
     def fetchmany(self, size: int) -> Any:
-        return self.native_cursor.fetchmany(size)
+        with timed():
+            return self.native_cursor.fetchmany(size)
 
     @record_function(CursorFetchAllRecord, method=True, id_field_name="connection_name")
     def fetchall(self) -> Any:
-        return self.native_cursor.fetchall()
+        with timed():
+            return self.native_cursor.fetchall()
 
     @property
     def connection_name(self) -> Optional[str]:
@@ -1,7 +1,9 @@
 import dataclasses
 from typing import Any, Iterable, Union, Mapping
 
-from dbt_common.record import Record, Recorder
+from dbt_common.record import Recorder
+
+from dbt.adapters.record.cursor.timing import TimedRecord
 
 
 @dataclasses.dataclass
@@ -12,7 +14,7 @@ class CursorExecuteParams:
 
 
 @Recorder.register_record_type
-class CursorExecuteRecord(Record):
+class CursorExecuteRecord(TimedRecord):
     """Implements record/replay support for the cursor.execute() method."""
 
     params_cls = CursorExecuteParams
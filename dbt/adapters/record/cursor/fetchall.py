@@ -2,7 +2,9 @@ import dataclasses
 import datetime
 from typing import Any, Dict, List, Mapping
 
-from dbt_common.record import Record, Recorder
+from dbt_common.record import Recorder
+
+from dbt.adapters.record.cursor.timing import TimedRecord
 
 
 @dataclasses.dataclass
@@ -58,7 +60,7 @@ class CursorFetchAllResult:
 
 
 @Recorder.register_record_type
-class CursorFetchAllRecord(Record):
+class CursorFetchAllRecord(TimedRecord):
     """Implements record/replay support for the cursor.fetchall() method."""
 
     params_cls = CursorFetchAllParams
@@ -1,7 +1,9 @@
 import dataclasses
 from typing import Any, List
 
-from dbt_common.record import Record, Recorder
+from dbt_common.record import Recorder
+
+from dbt.adapters.record.cursor.timing import TimedRecord
 
 
 @dataclasses.dataclass
@@ -15,7 +17,7 @@ class CursorFetchManyResult:
 
 
 @Recorder.register_record_type
-class CursorFetchManyRecord(Record):
+class CursorFetchManyRecord(TimedRecord):
     """Implements record/replay support for the cursor.fetchmany() method."""
 
     params_cls = CursorFetchManyParams
@@ -1,7 +1,9 @@
 import dataclasses
 from typing import Any
 
-from dbt_common.record import Record, Recorder
+from dbt_common.record import Recorder
+
+from dbt.adapters.record.cursor.timing import TimedRecord
 
 
 @dataclasses.dataclass
@@ -15,7 +17,7 @@ class CursorFetchOneResult:
 
 
 @Recorder.register_record_type
-class CursorFetchOneRecord(Record):
+class CursorFetchOneRecord(TimedRecord):
     """Implements record/replay support for the cursor.fetchone() method."""
 
     params_cls = CursorFetchOneParams
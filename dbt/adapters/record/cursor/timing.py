@@ -0,0 +1,41 @@
+import contextvars
+from contextlib import contextmanager
+import time
+from typing import Any, Iterator, Mapping, Optional
+
+from dbt_common.record import Record
+
+_ELAPSED: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "_ELAPSED", default=None
+)
+
+
+@contextmanager
+def timed() -> Iterator[None]:
+    """Time a call to the native cursor, for the record of the call."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _ELAPSED.set(time.perf_counter() - start)
+
+
+class TimedRecord(Record):
+    """A Record which also notes how long the call took, in seconds, when the
+    call was made under timed(). The time is kept by binary recordings, so
+    that replay can simulate it, but not in the record's dict form, so that it
+    doesn't show up in diffs of recordings.
+    """
+
+    def __init__(self, params, result, seq=None, elapsed: Optional[float] = None) -> None:
+        super().__init__(params, result, seq)
+        if elapsed is None:
+            elapsed = _ELAPSED.get()
+            _ELAPSED.set(None)
+        self.elapsed = elapsed
+
+    @classmethod
+    def from_dict(cls, dct: Mapping[str, Any]) -> "Record":
+        record = super().from_dict(dct)
+        record.elapsed = dct.get("elapsed")  # type: ignore[attr-defined]
+        return record
@@ -0,0 +1,516 @@
+"""A compact binary store for record/replay sessions.
+
+The JSON recording written by dbt_common's Recorder holds every record, and
+every row of every fetched result, as JSON-able Python objects. The store
+below writes records as msgpack frames instead, appended to the file as they
+are added:
+
+- the rows of fetchall() and fetchmany() results are written in chunks of
+  rows, without first converting the whole result;
+- SQL strings passed to cursor.execute() are interned, so a statement that is
+  run many times is stored once;
+- on replay, the file is memory-mapped and records are only decoded when
+  they are first requested;
+- the records are indexed by type and by connection, so that replaying a
+  call only has to look at the calls recorded for the same connection, in
+  the order they were made;
+- the time that timed cursor calls took is kept, so that replay can take as
+  long, or a multiple of that.
+
+Every frame starts with a header of its kind, a tag and the length of its
+payload. The tag of a type or string frame is the id it is interned under;
+that of a record, chunk or error frame is the id of the type of the record.
+The chunk frames of a record follow its record frame, which holds the
+number of them. A record with fewer chunk frames than that, or followed by an
+error frame, couldn't be written in full and is skipped.
+
+When the store is closed, the index is written in an index frame, followed
+by a trailer frame with the offset of the index, so that opening the store
+only has to read those. A store that wasn't closed, as when recording was
+aborted, is indexed by reading through its frames instead.
+"""
+
+import dataclasses
+import datetime
+from decimal import Decimal
+import mmap
+import os
+import struct
+import time
+from threading import Lock
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+import msgpack  # type: ignore[import-untyped]
+from dbt_common.record import Record, Recorder, RecorderMode
+
+from dbt.adapters.events.logging import AdapterLogger
+from dbt.adapters.record.cursor.fetchall import CursorFetchAllResult
+from dbt.adapters.record.cursor.fetchmany import CursorFetchManyResult
+
+logger = AdapterLogger("RecordStore")
+
+MAGIC = b"DBTREC\x00\x01"
+
+RECORD_CHUNK_ROWS = 1000
+
+_FRAME = struct.Struct("<cII")
+_STRING_ID = struct.Struct("<I")
+_OFFSET = struct.Struct("<Q")
+
+_TYPE = b"T"
+_STRING = b"S"
+_RECORD = b"R"
+_CHUNK = b"C"
+_ERROR = b"E"
+_INDEX = b"I"
+_TRAILER = b"X"
+
+_EXT_DATE = 1
+_EXT_DATETIME = 2
+_EXT_DECIMAL = 3
+_EXT_STRING = 4
+
+# params that are interned rather than written with every record
+_INTERNED_PARAMS = ("operation",)
+
+# results whose rows are written in chunks
+_CHUNKED_RESULTS = (CursorFetchAllResult, CursorFetchManyResult)
+
+
+def _encode_value(value: Any) -> Any:
+    # datetime is a subclass of date, so it has to be checked first
+    if isinstance(value, datetime.datetime):
+        return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode("utf-8"))
+    if isinstance(value, datetime.date):
+        return msgpack.ExtType(_EXT_DATE, value.isoformat().encode("utf-8"))
+    if isinstance(value, Decimal):
+        return msgpack.ExtType(_EXT_DECIMAL, str(value).encode("utf-8"))
+    # other values, like UUIDs and timedeltas, are replayed as their strings,
+    # as they would be from a JSON recording
+    return str(value)
+
+
+def _warn_not_recorded(type_name: str, error: Exception) -> None:
+    logger.warning(f"A {type_name} could not be recorded and is left out: {error}")
+
+
+def _to_dict(obj: Any) -> Any:
+    if obj is None:
+        return None
+    return obj._to_dict() if hasattr(obj, "_to_dict") else dataclasses.asdict(obj)
+
+
+class RecordStoreWriter:
+    """Append records to a binary record store. The store is indexed when it
+    is closed.
+
+    :param path: The file to write, which is replaced if it exists.
+    :param chunk_rows: The number of rows of a fetched result to write per
+        frame.
+    """
+
+    def __init__(
+        self, path: Union[str, "os.PathLike[str]"], chunk_rows: int = RECORD_CHUNK_ROWS
+    ) -> None:
+        self.chunk_rows = chunk_rows
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._offset = len(MAGIC)
+        self._packer = msgpack.Packer(default=_encode_value, use_bin_type=True)
+        self._type_ids: Dict[str, int] = {}
+        self._string_ids: Dict[str, int] = {}
+        # the start and end offsets of each string, in the order of their ids
+        self._string_spans: List[int] = []
+        # the start and end offsets of each record, by type and connection
+        self._index: Dict[str, Dict[Optional[str], List[int]]] = {}
+        self._lock = Lock()
+
+    def add(self, record: Record) -> None:
+        with self._lock:
+            type_name = type(record).__name__
+            type_id = self._intern(self._type_ids, _TYPE, type_name)
+            try:
+                head, connection_name = self._pack_head(record)
+            except Exception as e:
+                # nothing of the record has been written, so it's just left out
+                _warn_not_recorded(type_name, e)
+                return
+            start = self._write_frame(_RECORD, type_id, head)
+            if isinstance(record.result, _CHUNKED_RESULTS):
+                try:
+                    rows = record.result.results
+                    for offset in range(0, len(rows), self.chunk_rows):
+                        chunk = rows[offset : offset + self.chunk_rows]
+                        self._write_frame(_CHUNK, type_id, self._packer.pack(chunk))
+                except Exception as e:
+                    self._write_frame(_ERROR, type_id, str(e).encode("utf-8"))
+                    _warn_not_recorded(type_name, e)
+                    return
+            spans = self._index.setdefault(type_name, {}).setdefault(connection_name, [])
+            spans.extend((start, self._offset))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            index = {"strings": self._string_spans, "records": self._index}
+            start = self._write_frame(_INDEX, 0, msgpack.packb(index, use_bin_type=True))
+            self._write_frame(_TRAILER, 0, _OFFSET.pack(start))
+            self._file.close()
+
+    def _pack_head(self, record: Record) -> Tuple[bytes, Optional[str]]:
+        params = _to_dict(record.params)
+        connection_name = params.get("connection_name")
+        for name in _INTERNED_PARAMS:
+            value = params.get(name)
+            if isinstance(value, str):
+                string_id = self._intern(self._string_ids, _STRING, value)
+                params[name] = msgpack.ExtType(_EXT_STRING, _STRING_ID.pack(string_id))
+
+        # the number of chunk frames that follow, if the result is chunked
+        chunks: Optional[int] = None
+        result = None
+        if isinstance(record.result, _CHUNKED_RESULTS):
+            chunks = -(-len(record.result.results) // self.chunk_rows)
+        else:
+            result = _to_dict(record.result)
+        elapsed = getattr(record, "elapsed", None)
+        head = self._packer.pack([record.seq, params, result, chunks, elapsed])
+        return head, connection_name
+
+    def _intern(self, ids: Dict[str, int], kind: bytes, value: str) -> int:
+        if value not in ids:
+            ids[value] = len(ids)
+            start = self._write_frame(kind, ids[value], value.encode("utf-8"))
+            if kind == _STRING:
+                self._string_spans.extend((start + _FRAME.size, self._offset))
+        return ids[value]
+
+    def _write_frame(self, kind: bytes, tag: int, payload: bytes) -> int:
+        start = self._offset
+        self._file.write(_FRAME.pack(kind, tag, len(payload)))
+        self._file.write(payload)
+        self._offset += _FRAME.size + len(payload)
+        return start
+
+
+class _LazyRecords(Sequence[Dict[str, Any]]):
+    """Records in a store, decoded when they are accessed.
+
+    :param spans: The start and end offsets of each record, one after the
+        other.
+    """
+
+    def __init__(self, reader: "RecordStoreReader", spans: List[int]) -> None:
+        self._reader = reader
+        self._spans = spans
+
+    def __len__(self) -> int:
+        return len(self._spans) // 2
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._reader._decode(self._spans[2 * index], self._spans[2 * index + 1])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        spans = iter(self._spans)
+        for start, end in zip(spans, spans):
+            yield self._reader._decode(start, end)
+
+
+class RecordStoreReader(Mapping[str, Sequence[Dict[str, Any]]]):
+    """Read a binary record store, mapping the name of each record type to its
+    records in the dict form accepted by Record.from_dict().
+
+    The file is memory-mapped, and opening it only reads its index.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        with open(path, "rb") as fp:
+            if fp.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a record store")
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        self._string_spans: List[int] = []
+        self._string_cache: Dict[int, str] = {}
+        self._spans: Dict[str, Dict[Optional[str], List[int]]] = {}
+        if not self._read_index():
+            self._scan()
+
+    def _read_index(self) -> bool:
+        mm = self._mmap
+        trailer = len(mm) - _FRAME.size - _OFFSET.size
+        if trailer < len(MAGIC):
+            return False
+        kind, _, length = _FRAME.unpack_from(mm, trailer)
+        if kind != _TRAILER or length != _OFFSET.size:
+            return False
+        (start,) = _OFFSET.unpack_from(mm, trailer + _FRAME.size)
+        if not len(MAGIC) <= start <= trailer - _FRAME.size:
+            return False
+        kind, _, length = _FRAME.unpack_from(mm, start)
+        if kind != _INDEX or start + _FRAME.size + length != trailer:
+            return False
+        index = msgpack.unpackb(mm[start + _FRAME.size : trailer], raw=False, strict_map_key=False)
+        self._string_spans = index["strings"]
+        self._spans = index["records"]
+        return True
+
+    def _scan(self) -> None:
+        mm = self._mmap
+        size = len(mm)
+        type_names: Dict[int, str] = {}
+        # the spans of the type and connection of the last record, the last
+        # of which its chunks extend
+        current: Optional[List[int]] = None
+        # the chunk frames of the last record that haven't been read yet
+        missing = 0
+        pos = len(MAGIC)
+        while pos + _FRAME.size <= size:
+            kind, tag, length = _FRAME.unpack_from(mm, pos)
+            start, pos = pos, pos + _FRAME.size + length
+            if pos > size:
+                # the last frame was cut short, as when recording was aborted
+                break
+            if kind == _TYPE:
+                type_names[tag] = mm[start + _FRAME.size : pos].decode("utf-8")
+            elif kind == _STRING:
+                self._string_spans.extend((start + _FRAME.size, pos))
+            elif kind == _RECORD:
+                if current is not None and missing:
+                    del current[-2:]
+                _, params, _, chunks, _ = self._unpack(mm[start + _FRAME.size : pos])
+                by_connection = self._spans.setdefault(type_names[tag], {})
+                current = by_connection.setdefault(params.get("connection_name"), [])
+                current.extend((start, pos))
+                missing = chunks or 0
+            elif kind == _CHUNK and current is not None:
+                current[-1] = pos
+                missing -= 1
+            elif kind == _ERROR and current is not None:
+                del current[-2:]
+                current = None
+        # the store ended before all the chunks of the last record
+        if current is not None and missing:
+            del current[-2:]
+
+    def records(self, type_name: str, connection_name: Optional[str]) -> Sequence[Dict[str, Any]]:
+        """The records of a type made on a connection, in the order they were
+        recorded.
+        """
+        return _LazyRecords(self, self._spans.get(type_name, {}).get(connection_name, []))
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> "RecordStoreReader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __getitem__(self, type_name: str) -> Sequence[Dict[str, Any]]:
+        pairs = sorted(
+            pair
+            for spans in self._spans[type_name].values()
+            for pair in zip(spans[::2], spans[1::2])
+        )
+        return _LazyRecords(self, [offset for pair in pairs for offset in pair])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._spans)
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def _decode(self, start: int, end: int) -> Dict[str, Any]:
+        mm = self._mmap
+        _, _, length = _FRAME.unpack_from(mm, start)
+        pos = start + _FRAME.size
+        seq, params, result, chunks, elapsed = self._unpack(mm[pos : pos + length])
+        pos += length
+        if chunks is not None:
+            rows: List[Any] = []
+            while pos < end:
+                _, _, length = _FRAME.unpack_from(mm, pos)
+                pos += _FRAME.size
+                rows.extend(self._unpack(mm[pos : pos + length]))
+                pos += length
+            result = {"results": rows}
+        return {"params": params, "result": result, "seq": seq, "elapsed": elapsed}
+
+    def _unpack(self, data: bytes) -> Any:
+        return msgpack.unpackb(data, ext_hook=self._decode_ext, raw=False, strict_map_key=False)
+
+    def _decode_ext(self, code: int, data: bytes) -> Any:
+        if code == _EXT_STRING:
+            return self._string(_STRING_ID.unpack(data)[0])
+        if code == _EXT_DATETIME:
+            return datetime.datetime.fromisoformat(data.decode("utf-8"))
+        if code == _EXT_DATE:
+            return datetime.date.fromisoformat(data.decode("utf-8"))
+        if code == _EXT_DECIMAL:
+            return Decimal(data.decode("utf-8"))
+        return msgpack.ExtType(code, data)
+
+    def _string(self, string_id: int) -> str:
+        if string_id not in self._string_cache:
+            start, end = self._string_spans[2 * string_id : 2 * string_id + 2]
+            self._string_cache[string_id] = self._mmap[start:end].decode("utf-8")
+        return self._string_cache[string_id]
+
+
+class _ReplayQueue:
+    """The recorded calls of one type on one connection, in the order they
+    were made, decoded as they are replayed.
+    """
+
+    def __init__(self, record_cls: Type[Record], records: Sequence[Dict[str, Any]]) -> None:
+        self._record_cls = record_cls
+        self._records = records
+        self._next = 0
+        # records that were decoded while looking for a later match
+        self._skipped: List[Record] = []
+
+    def pop(self, params: Any) -> Optional[Record]:
+        for idx, record in enumerate(self._skipped):
+            if record.params == params:
+                return self._skipped.pop(idx)
+        while self._next < len(self._records):
+            record = self._record_cls.from_dict(self._records[self._next])
+            self._next += 1
+            if record.params == params:
+                return record
+            self._skipped.append(record)
+        return None
+
+
+def get_replay_latency_from_env() -> Optional[float]:
+    """
+    Get the replay latency scale from the environment variables.
+    Expected format: 'DBT_RECORDER_REPLAY_LATENCY=1.0' or 'DBT_ENGINE_RECORDER_REPLAY_LATENCY=1.0'
+    """
+    replay_latency_str = os.environ.get("DBT_ENGINE_RECORDER_REPLAY_LATENCY") or os.environ.get(
+        "DBT_RECORDER_REPLAY_LATENCY"
+    )
+    if replay_latency_str is None:
+        return None
+
+    return float(replay_latency_str)
+
+
+class BinaryRecorder(Recorder):
+    """A Recorder which writes and replays recordings in the binary record
+    store format, instead of JSON.
+
+    On replay, a call is matched against the calls recorded for the same
+    connection, starting from the next one in the order they were made, so
+    that it usually takes a single comparison.
+
+    :param replay_latency: If set, a replayed call sleeps for the time the
+        recorded call took, multiplied by this, so that replay takes about
+        as long as the warehouse did. Defaults to the
+        DBT_RECORDER_REPLAY_LATENCY environment variable, and otherwise
+        calls are replayed at once.
+
+    Diffing against a previous recording still requires JSON recordings.
+    """
+
+    def __init__(
+        self,
+        mode: RecorderMode,
+        types: Optional[List],
+        row_limit: Optional[int] = None,
+        current_recording_path: str = "recording.dbtrec",
+        previous_recording_path: Optional[str] = None,
+        in_memory: bool = False,
+        chunk_rows: int = RECORD_CHUNK_ROWS,
+        replay_latency: Optional[float] = None,
+    ) -> None:
+        self._writer: Optional[RecordStoreWriter] = None
+        # the parent's streamed recording is always JSON, so it's kept in
+        # memory there and streamed to the store here instead
+        super().__init__(
+            mode,
+            types,
+            row_limit=row_limit,
+            current_recording_path=current_recording_path,
+            previous_recording_path=previous_recording_path,
+            in_memory=True,
+        )
+        self.chunk_rows = chunk_rows
+        self.replay_latency = (
+            get_replay_latency_from_env() if replay_latency is None else replay_latency
+        )
+        self._replay_queues: Dict[Tuple[str, Optional[str]], _ReplayQueue] = {}
+        self._replay_lock = Lock()
+        if mode == RecorderMode.RECORD and not in_memory:
+            self._writer = RecordStoreWriter(current_recording_path, chunk_rows)
+
+    def add_record(self, record: Record) -> None:
+        if self._writer is None:
+            return super().add_record(record)
+
+        # records are written in the order of their seq
+        with self._counter_lock:
+            record.seq = self._counter
+            self._counter += 1
+            self._writer.add(record)
+
+    def pop_matching_record(self, params: Any) -> Optional[Record]:
+        record = self._pop_matching_record(params)
+        elapsed = getattr(record, "elapsed", None)
+        if elapsed and self.replay_latency:
+            time.sleep(elapsed * self.replay_latency)
+        return record
+
+    def _pop_matching_record(self, params: Any) -> Optional[Record]:
+        reader = self._unprocessed_records_by_type
+        if not isinstance(reader, RecordStoreReader):
+            return super().pop_matching_record(params)
+
+        rec_type_name = self._record_name_by_params_name.get(type(params).__name__)
+        if rec_type_name is None:
+            raise Exception(
+                f"A record of type {type(params).__name__} was requested, but no such type has been registered."
+            )
+
+        connection_name = getattr(params, "connection_name", None)
+        key = (rec_type_name, connection_name)
+        with self._replay_lock:
+            queue = self._replay_queues.get(key)
+            if queue is None:
+                queue = _ReplayQueue(
+                    self._record_cls_by_name[rec_type_name],
+                    reader.records(rec_type_name, connection_name),
+                )
+                self._replay_queues[key] = queue
+            return queue.pop(params)
+
+    def write(self) -> None:
+        if self._writer is not None:
+            self.clean_up_stream()
+            return
+
+        records = [r for records in self._records_by_type.values() for r in records]
+        records.sort(key=lambda r: r.seq)
+        writer = RecordStoreWriter(self.current_recording_path, self.chunk_rows)
+        try:
+            for record in records:
+                writer.add(record)
+        finally:
+            writer.close()
+
+    def clean_up_stream(self) -> None:
+        writer = getattr(self, "_writer", None)
+        if writer is not None:
+            writer.close()
+            self._writer = None
+
+    @classmethod
+    def load(cls, file_name: str) -> RecordStoreReader:  # type: ignore[override]
+        return RecordStoreReader(file_name)
@@ -1,12 +1,29 @@
-from dbt.adapters.relation_configs.config_base import (
-    RelationConfigBase,
-    RelationResults,
-)
-from dbt.adapters.relation_configs.config_change import (
-    RelationConfigChange,
-    RelationConfigChangeAction,
-)
-from dbt.adapters.relation_configs.config_validation import (
-    RelationConfigValidationMixin,
-    RelationConfigValidationRule,
+from typing import TYPE_CHECKING
+
+from dbt.adapters.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from dbt.adapters.relation_configs.config_base import (
+        RelationConfigBase,
+        RelationResults,
+    )
+    from dbt.adapters.relation_configs.config_change import (
+        RelationConfigChange,
+        RelationConfigChangeAction,
+    )
+    from dbt.adapters.relation_configs.config_validation import (
+        RelationConfigValidationMixin,
+        RelationConfigValidationRule,
+    )
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "RelationConfigBase": "dbt.adapters.relation_configs.config_base",
+        "RelationResults": "dbt.adapters.relation_configs.config_base",
+        "RelationConfigChange": "dbt.adapters.relation_configs.config_change",
+        "RelationConfigChangeAction": "dbt.adapters.relation_configs.config_change",
+        "RelationConfigValidationMixin": "dbt.adapters.relation_configs.config_validation",
+        "RelationConfigValidationRule": "dbt.adapters.relation_configs.config_validation",
+    },
 )
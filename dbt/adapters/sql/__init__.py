@@ -1,2 +1,15 @@
-from dbt.adapters.sql.connections import SQLConnectionManager
-from dbt.adapters.sql.impl import SQLAdapter
+from typing import TYPE_CHECKING
+
+from dbt.adapters.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from dbt.adapters.sql.connections import SQLConnectionManager
+    from dbt.adapters.sql.impl import SQLAdapter
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "SQLConnectionManager": "dbt.adapters.sql.connections",
+        "SQLAdapter": "dbt.adapters.sql.impl",
+    },
+)
@@ -1,6 +1,17 @@
 import abc
+import io
 import time
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from dbt_common.events.contextvars import get_node_info
 from dbt_common.events.functions import fire_event
@@ -34,6 +45,11 @@ class SQLConnectionManager(BaseConnectionManager):
         - open
     """
 
+    # whether add_bulk_insert loads rows with COPY ... FROM STDIN through the
+    # copy_expert method of psycopg2 cursors, rather than with executemany;
+    # adapters whose drivers support it turn it on
+    BULK_INSERT_WITH_COPY: bool = False
+
     @abc.abstractmethod
     def cancel(self, connection: Connection):
         """Cancel the given connection."""
@@ -102,6 +118,79 @@ class SQLConnectionManager(BaseConnectionManager):
 
             return connection, cursor
 
+    def add_bulk_insert(
+        self,
+        table: str,
+        columns: List[str],
+        rows: List[Sequence[Any]],
+        binding_char: str = "%s",
+        auto_begin: bool = True,
+    ) -> Tuple[Connection, Any]:
+        """Insert rows into the given (already quoted) columns of a table,
+        with a single parameterized executemany, or with COPY if the adapter
+        sets BULK_INSERT_WITH_COPY.
+        """
+        connection = self.get_thread_connection()
+        if auto_begin and connection.transaction_open is False:
+            self.begin()
+        fire_event(
+            ConnectionUsed(
+                conn_type=self.TYPE,
+                conn_name=cast_to_str(connection.name),
+                node_info=get_node_info(),
+            )
+        )
+
+        cursor = connection.handle.cursor()
+        columns_csv = ", ".join(columns)
+        if self.BULK_INSERT_WITH_COPY:
+            sql = f"copy {table} ({columns_csv}) from stdin with (format csv)"
+        else:
+            values = ", ".join(binding_char for _ in columns)
+            sql = f"insert into {table} ({columns_csv}) values ({values})"
+
+        with self.exception_handler(sql):
+            fire_event(
+                SQLQuery(
+                    conn_name=cast_to_str(connection.name),
+                    sql=f"{sql} -- {len(rows)} rows",
+                    node_info=get_node_info(),
+                )
+            )
+
+            pre = time.perf_counter()
+
+            if self.BULK_INSERT_WITH_COPY:
+                cursor.copy_expert(sql, io.StringIO(self._rows_to_csv(rows)))
+            else:
+                cursor.executemany(sql, rows)
+
+            fire_event(
+                SQLQueryStatus(
+                    status=str(self.get_response(cursor)),
+                    elapsed=time.perf_counter() - pre,
+                    node_info=get_node_info(),
+                )
+            )
+
+            return connection, cursor
+
+    @staticmethod
+    def _rows_to_csv(rows: List[Sequence[Any]]) -> str:
+        # Nulls are written as unquoted empty fields and every other value is
+        # quoted, so COPY can tell nulls and empty strings apart.
+        lines = []
+        for row in rows:
+            fields = []
+            for value in row:
+                if value is None:
+                    fields.append("")
+                else:
+                    fields.append('"' + str(value).replace('"', '""') + '"')
+            lines.append(",".join(fields))
+        lines.append("")
+        return "\n".join(lines)
+
     @classmethod
     @abc.abstractmethod
     def get_response(cls, cursor: Any) -> AdapterResponse:
@@ -1,16 +1,19 @@
-from typing import Any, List, Optional, Tuple, Type, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, TYPE_CHECKING
 
 from dbt_common.events.functions import fire_event
+from dbt_common.utils.formatting import lowercase
 
 from dbt.adapters.base import BaseAdapter, BaseRelation, available
+from dbt.adapters.base.column import Column as BaseColumn
 from dbt.adapters.cache import _make_ref_key_dict
 from dbt.adapters.contracts.connection import AdapterResponse, Connection
-from dbt.adapters.events.types import ColTypeChange, SchemaCreation, SchemaDrop
+from dbt.adapters.events.types import SchemaCreation, SchemaDrop
 from dbt.adapters.exceptions import RelationTypeNullError
 from dbt.adapters.sql.connections import SQLConnectionManager
 
 LIST_RELATIONS_MACRO_NAME = "list_relations_without_caching"
 GET_COLUMNS_IN_RELATION_MACRO_NAME = "get_columns_in_relation"
+GET_COLUMNS_IN_RELATIONS_MACRO_NAME = "get_columns_in_relations"
 LIST_SCHEMAS_MACRO_NAME = "list_schemas"
 CHECK_SCHEMA_EXISTS_MACRO_NAME = "check_schema_exists"
 CREATE_SCHEMA_MACRO_NAME = "create_schema"
@@ -20,6 +23,7 @@ TRUNCATE_RELATION_MACRO_NAME = "truncate_relation"
 DROP_RELATION_MACRO_NAME = "drop_relation"
 ALTER_COLUMN_TYPE_MACRO_NAME = "alter_column_type"
 VALIDATE_SQL_MACRO_NAME = "validate_sql"
+GET_BINDING_CHAR_MACRO_NAME = "get_binding_char"
 
 if TYPE_CHECKING:
     import agate
@@ -41,6 +45,14 @@ class SQLAdapter(BaseAdapter):
         - list_relations_without_caching
         - get_columns_in_relation
         - get_catalog_for_single_relation
+
+    Macros to optionally override:
+        - get_columns_in_relations, if the database has no ANSI
+          information_schema.columns view
+
+    Methods to optionally override:
+        - bulk_load_rows, to load seed rows through a faster native path
+          than COPY or executemany
     """
 
     ConnectionManager: Type[SQLConnectionManager]
@@ -66,6 +78,12 @@ class SQLAdapter(BaseAdapter):
         """
         return self.connections.add_query(sql, auto_begin, bindings, abridge_sql_log)
 
+    def bulk_load_rows(
+        self, relation: BaseRelation, columns: List[str], rows: List[Sequence[Any]]
+    ) -> None:
+        binding_char = str(self.execute_macro(GET_BINDING_CHAR_MACRO_NAME))
+        self.connections.add_bulk_insert(relation.render(), columns, rows, binding_char)
+
     @classmethod
     def convert_text_type(cls, agate_table: "agate.Table", col_idx: int) -> str:
         return "text"
@@ -107,21 +125,30 @@ class SQLAdapter(BaseAdapter):
 
         target_columns = {c.name: c for c in self.get_columns_in_relation(current)}
 
+        type_changes = []
         for column_name, reference_column in reference_columns.items():
             target_column = target_columns.get(column_name)
 
             if target_column is not None and target_column.can_expand_to(reference_column):
                 col_string_size = reference_column.string_size()
                 new_type = self.Column.string_type(col_string_size)
-                fire_event(
-                    ColTypeChange(
-                        orig_type=target_column.data_type,
-                        new_type=new_type,
-                        table=_make_ref_key_dict(current),
-                    )
+                type_changes.append(
+                    {
+                        "column_name": column_name,
+                        "orig_type": target_column.data_type,
+                        "new_type": new_type,
+                    }
                 )
 
-                self.alter_column_type(current, column_name, new_type)
+        if not type_changes:
+            return
+        if type(self).alter_column_type is SQLAdapter.alter_column_type:
+            self.alter_relation_columns(current, type_changes=type_changes)
+        else:
+            # keep using an adapter's own alter_column_type
+            self._fire_column_changes(current, [], [], type_changes)
+            for change in type_changes:
+                self.alter_column_type(current, change["column_name"], change["new_type"])
 
     def alter_column_type(self, relation, column_name, new_column_type) -> None:
         """
@@ -154,9 +181,42 @@ class SQLAdapter(BaseAdapter):
         self.execute_macro(RENAME_RELATION_MACRO_NAME, kwargs=kwargs)
 
     def get_columns_in_relation(self, relation):
-        return self.execute_macro(
-            GET_COLUMNS_IN_RELATION_MACRO_NAME, kwargs={"relation": relation}
-        )
+        columns = self._get_cached_columns(relation)
+        if columns is None:
+            columns = self.execute_macro(
+                GET_COLUMNS_IN_RELATION_MACRO_NAME, kwargs={"relation": relation}
+            )
+            self._cache_columns(relation, columns)
+        return columns
+
+    def _get_columns_in_relations_without_caching(
+        self, relations: List[BaseRelation]
+    ) -> Dict[BaseRelation, List[BaseColumn]]:
+        """Fetch the columns of the relations in each database with one
+        get_columns_in_relations query.
+        """
+        by_database: Dict[Optional[str], List[BaseRelation]] = {}
+        for relation in relations:
+            by_database.setdefault(lowercase(relation.database), []).append(relation)
+
+        columns: Dict[BaseRelation, List[BaseColumn]] = {}
+        for database_relations in by_database.values():
+            by_name: Dict[Tuple[Optional[str], Optional[str]], BaseRelation] = {}
+            for relation in database_relations:
+                by_name[(lowercase(relation.schema), lowercase(relation.identifier))] = relation
+                columns[relation] = []
+
+            table = self.execute_macro(
+                GET_COLUMNS_IN_RELATIONS_MACRO_NAME, kwargs={"relations": database_relations}
+            )
+            for schema, identifier, *column in table:
+                found = by_name.get((lowercase(schema), lowercase(identifier)))
+                if found is None:
+                    # relations without a schema match any schema
+                    found = by_name.get((None, lowercase(identifier)))
+                if found is not None:
+                    columns[found].append(self.Column(*column))
+        return columns
 
     def create_schema(self, relation: BaseRelation) -> None:
         relation = relation.without_identifier()
@@ -179,6 +239,7 @@ class SQLAdapter(BaseAdapter):
         self.commit_if_has_connection()
         # we can update the cache here
         self.cache.drop_schema(relation.database, relation.schema)
+        self.invalidate_column_cache()
 
     def list_relations_without_caching(
         self,
@@ -7,6 +7,36 @@
     'get_columns_in_relation macro not implemented for adapter '+adapter.type()) }}
 {% endmacro %}
 
+{% macro get_columns_in_relations(relations) -%}
+  {{ return(adapter.dispatch('get_columns_in_relations', 'dbt')(relations)) }}
+{% endmacro %}
+
+{#
+  Returns one row per column of the given relations, which are all in the same database:
+  (table_schema, table_name, column_name, data_type, character_maximum_length, numeric_precision, numeric_scale)
+#}
+{% macro default__get_columns_in_relations(relations) -%}
+  {% call statement('get_columns_in_relations', fetch_result=True) %}
+      select
+          table_schema,
+          table_name,
+          column_name,
+          data_type,
+          character_maximum_length,
+          numeric_precision,
+          numeric_scale
+
+      from {{ relations[0].information_schema('columns') }}
+      where
+      {%- for relation in relations %}
+          {{ 'or ' if not loop.first }}(table_name = '{{ relation.identifier }}'
+          {%- if relation.schema %} and table_schema = '{{ relation.schema }}'{% endif %})
+      {%- endfor %}
+      order by table_schema, table_name, ordinal_position
+  {% endcall %}
+  {{ return(load_result('get_columns_in_relations').table) }}
+{% endmacro %}
+
 {# helper for adapter-specific implementations of get_columns_in_relation #}
 {% macro sql_convert_columns_in_relation(table) -%}
   {% set columns = [] %}
@@ -83,7 +113,9 @@
 {% endmacro %}
 
 {% macro alter_column_type(relation, column_name, new_column_type) -%}
-  {{ return(adapter.dispatch('alter_column_type', 'dbt')(relation, column_name, new_column_type)) }}
+  {% set result = adapter.dispatch('alter_column_type', 'dbt')(relation, column_name, new_column_type) %}
+  {% do adapter.invalidate_column_cache(relation) %}
+  {{ return(result) }}
 {% endmacro %}
 
 {% macro default__alter_column_type(relation, column_name, new_column_type) -%}
@@ -105,8 +137,74 @@
 {% endmacro %}
 
 
+{% macro alter_column_types(relation, type_changes) -%}
+  {% set result = adapter.dispatch('alter_column_types', 'dbt')(relation, type_changes) %}
+  {% do adapter.invalidate_column_cache(relation) %}
+  {{ return(result) }}
+{% endmacro %}
+
+{#
+  Changes the type of every column in type_changes, a list of dicts with a column_name and a new_type.
+  When the adapter uses the default alter_column_type and alter_relation_add_remove_columns, the
+  columns are changed together: one statement adds every temporary column, one copies the data over
+  and one drops the old columns. Otherwise each column is changed with alter_column_type.
+#}
+{% macro default__alter_column_types(relation, type_changes) -%}
+  {%- set uses_default_ddl = (
+      adapter.dispatch('alter_column_type', 'dbt').get_name() == 'default__alter_column_type'
+      and adapter.dispatch('alter_relation_add_remove_columns', 'dbt').get_name() == 'default__alter_relation_add_remove_columns'
+  ) -%}
+
+  {% if not uses_default_ddl or type_changes | length < 2 %}
+    {% for change in type_changes %}
+      {% do alter_column_type(relation, change['column_name'], change['new_type']) %}
+    {% endfor %}
+  {% else %}
+    {% call statement('alter_column_types') %}
+      alter table {{ relation.render() }}
+      {%- for change in type_changes %}
+        add column {{ adapter.quote(change['column_name'] + "__dbt_alter") }} {{ change['new_type'] }}{{ ',' if not loop.last }}
+      {%- endfor %};
+      update {{ relation.render() }} set
+      {%- for change in type_changes %}
+        {{ adapter.quote(change['column_name'] + "__dbt_alter") }} = {{ adapter.quote(change['column_name']) }}{{ ',' if not loop.last }}
+      {%- endfor %};
+      alter table {{ relation.render() }}
+      {%- for change in type_changes %}
+        drop column {{ adapter.quote(change['column_name']) }} cascade{{ ',' if not loop.last }}
+      {%- endfor %};
+      {%- for change in type_changes %}
+      alter table {{ relation.render() }} rename column {{ adapter.quote(change['column_name'] + "__dbt_alter") }} to {{ adapter.quote(change['column_name']) }}{{ ';' if not loop.last }}
+      {%- endfor %}
+    {% endcall %}
+  {% endif %}
+{% endmacro %}
+
+
+{% macro alter_relation_columns(relation, add_columns = none, remove_columns = none, type_changes = none) -%}
+  {% set result = adapter.dispatch('alter_relation_columns', 'dbt')(relation, add_columns, remove_columns, type_changes) %}
+  {% do adapter.invalidate_column_cache(relation) %}
+  {{ return(result) }}
+{% endmacro %}
+
+{#
+  Applies all of a relation's column changes: additions and removals in one
+  alter_relation_add_remove_columns statement, then the type changes with alter_column_types.
+#}
+{% macro default__alter_relation_columns(relation, add_columns, remove_columns, type_changes) %}
+  {% if add_columns or remove_columns %}
+    {% do alter_relation_add_remove_columns(relation, add_columns, remove_columns) %}
+  {% endif %}
+  {% if type_changes %}
+    {% do alter_column_types(relation, type_changes) %}
+  {% endif %}
+{% endmacro %}
+
+
 {% macro alter_relation_add_remove_columns(relation, add_columns = none, remove_columns = none) -%}
-  {{ return(adapter.dispatch('alter_relation_add_remove_columns', 'dbt')(relation, add_columns, remove_columns)) }}
+  {% set result = adapter.dispatch('alter_relation_add_remove_columns', 'dbt')(relation, add_columns, remove_columns) %}
+  {% do adapter.invalidate_column_cache(relation) %}
+  {{ return(result) }}
 {% endmacro %}
 
 {% macro default__alter_relation_add_remove_columns(relation, add_columns, remove_columns) %}
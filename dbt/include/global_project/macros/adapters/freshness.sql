@@ -14,3 +14,38 @@
   {% endcall %}
   {{ return(load_result('collect_freshness')) }}
 {% endmacro %}
+
+
+{% macro collect_freshness_batch(sources) %}
+  {{ return(adapter.dispatch('collect_freshness_batch', 'dbt')(sources))}}
+{% endmacro %}
+
+{% macro default__collect_freshness_batch(sources) %}
+  {#- the branches of a union must have the same types, and the loaded_at
+      fields of the sources may not, so each branch casts its own to a time
+      zone aware type, which keeps the time zone of aware values -#}
+  {%- set timestamp_type = freshness_batch_timestamp_type() -%}
+  {% call statement('collect_freshness_batch', fetch_result=True, auto_begin=False) -%}
+    {% for source in sources -%}
+    select
+      {{ loop.index0 }} as source_index,
+      cast(max({{ source.loaded_at_field }}) as {{ timestamp_type }}) as max_loaded_at,
+      cast({{ current_timestamp() }} as {{ timestamp_type }}) as snapshotted_at
+    from {{ source.relation }}
+    {% if source.filter %}
+    where {{ source.filter }}
+    {% endif %}
+    {% if not loop.last %}union all{% endif %}
+    {% endfor %}
+  {% endcall %}
+  {{ return(load_result('collect_freshness_batch')) }}
+{% endmacro %}
+
+
+{% macro freshness_batch_timestamp_type() %}
+  {{ return(adapter.dispatch('freshness_batch_timestamp_type', 'dbt')()) }}
+{% endmacro %}
+
+{% macro default__freshness_batch_timestamp_type() %}
+  {{ return('timestamp with time zone') }}
+{% endmacro %}
@@ -18,31 +18,11 @@
 
 {% macro check_for_schema_changes(source_relation, target_relation) %}
 
-  {% set schema_changed = False %}
-
-  {%- set source_columns = adapter.get_columns_in_relation(source_relation) -%}
-  {%- set target_columns = adapter.get_columns_in_relation(target_relation) -%}
-  {%- set source_not_in_target = diff_columns(source_columns, target_columns) -%}
-  {%- set target_not_in_source = diff_columns(target_columns, source_columns) -%}
-
-  {% set new_target_types = diff_column_data_types(source_columns, target_columns) %}
-
-  {% if source_not_in_target != [] %}
-    {% set schema_changed = True %}
-  {% elif target_not_in_source != [] or new_target_types != [] %}
-    {% set schema_changed = True %}
-  {% elif new_target_types != [] %}
-    {% set schema_changed = True %}
-  {% endif %}
-
-  {% set changes_dict = {
-    'schema_changed': schema_changed,
-    'source_not_in_target': source_not_in_target,
-    'target_not_in_source': target_not_in_source,
-    'source_columns': source_columns,
-    'target_columns': target_columns,
-    'new_target_types': new_target_types
-  } %}
+  {% set changes_dict = adapter.compute_schema_diff(source_relation, target_relation) %}
+  {% set schema_changed = changes_dict['schema_changed'] %}
+  {% set source_not_in_target = changes_dict['source_not_in_target'] %}
+  {% set target_not_in_source = changes_dict['target_not_in_source'] %}
+  {% set new_target_types = changes_dict['new_target_types'] %}
 
   {% set msg %}
     In {{ target_relation }}:
@@ -72,17 +52,7 @@
      {%- set remove_from_target_arr = schema_changes_dict['target_not_in_source'] -%}
      {%- set new_target_types = schema_changes_dict['new_target_types'] -%}
 
-     {% if add_to_target_arr | length > 0 or remove_from_target_arr | length > 0 %}
-       {%- do alter_relation_add_remove_columns(target_relation, add_to_target_arr, remove_from_target_arr) -%}
-     {% endif %}
-
-     {% if new_target_types != [] %}
-       {% for ntt in new_target_types %}
-         {% set column_name = ntt['column_name'] %}
-         {% set new_type = ntt['new_type'] %}
-         {% do alter_column_type(target_relation, column_name, new_type) %}
-       {% endfor %}
-     {% endif %}
+     {%- do adapter.alter_relation_columns(target_relation, add_to_target_arr, remove_from_target_arr, new_target_types) -%}
 
   {% endif %}
 
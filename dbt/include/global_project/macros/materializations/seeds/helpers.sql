@@ -4,18 +4,8 @@
 {%- endmacro %}
 
 {% macro default__create_csv_table(model, agate_table) %}
-  {%- set column_override = model['config'].get('column_types', {}) -%}
-  {%- set quote_seed_column = model['config'].get('quote_columns', None) -%}
-
   {% set sql %}
-    create table {{ this.render() }} (
-        {%- for col_name in agate_table.column_names -%}
-            {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
-            {%- set type = column_override.get(col_name, inferred_type) -%}
-            {%- set column_name = (col_name | string) -%}
-            {{ adapter.quote_seed_column(column_name, quote_seed_column) }} {{ type }} {%- if not loop.last -%}, {%- endif -%}
-        {%- endfor -%}
-    )
+    create table {{ this.render() }} ({{ get_csv_table_columns_sql(model, agate_table) }})
   {% endset %}
 
   {% call statement('_') -%}
@@ -26,15 +16,39 @@
 {% endmacro %}
 
 
+{% macro get_csv_table_columns_sql(model, agate_table) %}
+  {%- set column_override = model['config'].get('column_types', {}) -%}
+  {%- set quote_seed_column = model['config'].get('quote_columns', None) -%}
+  {%- set row_hash_column = model['config'].get('row_hash_column', None) -%}
+
+  {%- for col_name in agate_table.column_names -%}
+      {%- set inferred_type = adapter.convert_type(agate_table, loop.index0) -%}
+      {%- set type = column_override.get(col_name, inferred_type) -%}
+      {%- set column_name = (col_name | string) -%}
+      {{ adapter.quote_seed_column(column_name, quote_seed_column) }} {{ type }} {%- if not loop.last -%}, {%- endif -%}
+  {%- endfor -%}
+  {%- if row_hash_column -%}
+      , {{ adapter.quote_seed_column(row_hash_column, quote_seed_column) }} {{ type_string() }}
+  {%- endif -%}
+{% endmacro %}
+
+
 {% macro reset_csv_table(model, full_refresh, old_relation, agate_table) -%}
   {{ adapter.dispatch('reset_csv_table', 'dbt')(model, full_refresh, old_relation, agate_table) }}
 {%- endmacro %}
 
 {% macro default__reset_csv_table(model, full_refresh, old_relation, agate_table) %}
     {% set sql = "" %}
-    {% if full_refresh %}
+    {% set row_hash_column = model['config'].get('row_hash_column', None) %}
+    {% if seed_loads_in_parallel(model) %}
+        {# the table is kept until load_csv_rows swaps in a freshly loaded one #}
+        {% set sql = "-- replaced by a table loaded in parallel" %}
+    {% elif full_refresh or (row_hash_column and not seed_has_row_hashes(old_relation, agate_table, row_hash_column)) %}
         {{ adapter.drop_relation(old_relation) }}
         {% set sql = create_csv_table(model, agate_table) %}
+    {% elif row_hash_column %}
+        {# keep the rows, load_csv_rows only applies the changed ones #}
+        {% set sql = "-- rows compared by " ~ row_hash_column %}
     {% else %}
         {{ adapter.truncate_relation(old_relation) }}
         {% set sql = "truncate table " ~ old_relation.render() %}
@@ -44,6 +58,22 @@
 {% endmacro %}
 
 
+{% macro seed_has_row_hashes(old_relation, agate_table, row_hash_column) %}
+    {#- the existing table can be loaded incrementally if it has the seed's columns plus the row hash column -#}
+    {%- set existing = adapter.get_columns_in_relation(old_relation) | map(attribute='name') | map('lower') | sort -%}
+    {%- set expected = agate_table.column_names | map('string') | map('lower') | list -%}
+    {%- do expected.append(row_hash_column | lower) -%}
+    {{ return(existing | list == expected | sort | list) }}
+{% endmacro %}
+
+
+{% macro seed_loads_in_parallel(model) %}
+    {#- incremental loads by row hash take precedence over parallel loads, which need an adapter that can load over several connections -#}
+    {%- set parallel_load = model['config'].get('parallel_load', false) and not model['config'].get('row_hash_column', None) -%}
+    {{ return(parallel_load and adapter.can_bulk_load_in_parallel()) }}
+{% endmacro %}
+
+
 {% macro get_csv_sql(create_or_truncate_sql, insert_sql) %}
     {{ adapter.dispatch('get_csv_sql', 'dbt')(create_or_truncate_sql, insert_sql) }}
 {% endmacro %}
@@ -91,34 +121,74 @@
 
 {% macro default__load_csv_rows(model, agate_table) %}
 
+  {% set row_hash_column = model['config'].get('row_hash_column', None) %}
+  {% if row_hash_column %}
+      {{ return(load_changed_csv_rows(model, agate_table, row_hash_column)) }}
+  {% elif seed_loads_in_parallel(model) %}
+      {{ return(load_csv_rows_in_parallel(model, agate_table)) }}
+  {% elif model['config'].get('parallel_load', false) %}
+      {% do exceptions.warn("Ignoring parallel_load for seed " ~ this.render() ~ ": the " ~ adapter.type() ~ " adapter cannot load a seed over several connections") %}
+  {% endif %}
+
   {% set batch_size = get_batch_size() %}
 
   {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) %}
-  {% set bindings = [] %}
+  {% set binding_char = get_binding_char() %}
 
   {% set statements = [] %}
 
-  {% for chunk in agate_table.rows | batch(batch_size) %}
-      {% set bindings = [] %}
+  {% for sql, bindings in adapter.get_insert_batches(this, cols_sql, agate_table.rows, batch_size, binding_char) %}
+      {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
+
+      {% if loop.first %}
+          {% do statements.append(sql) %}
+      {% endif %}
+  {% endfor %}
+
+  {# Return SQL so we can render it out into the compiled files #}
+  {{ return(statements[0]) }}
+{% endmacro %}
+
+
+{% macro load_changed_csv_rows(model, agate_table, row_hash_column) -%}
+  {{ return(adapter.dispatch('load_changed_csv_rows', 'dbt')(model, agate_table, row_hash_column)) }}
+{%- endmacro %}
+
+{% macro default__load_changed_csv_rows(model, agate_table, row_hash_column) %}
+
+  {% set batch_size = get_batch_size() %}
+
+  {% set quote_seed_column = model['config'].get('quote_columns', None) %}
+  {% set hash_col_sql = adapter.quote_seed_column(row_hash_column, quote_seed_column) %}
+  {% set cols_sql = get_seed_column_quoted_csv(model, agate_table.column_names) ~ ', ' ~ hash_col_sql %}
+  {% set binding_char = get_binding_char() %}
+
+  {% set stored_hashes_sql %}
+      select {{ hash_col_sql }} from {{ this.render() }}
+  {% endset %}
+  {% set stored_hashes = run_query(stored_hashes_sql).columns[0].values() %}
+  {% set changes = adapter.diff_seed_rows(agate_table.rows, stored_hashes) %}
 
-      {% for row in chunk %}
-          {% do bindings.extend(row) %}
-      {% endfor %}
+  {% if changes.delete_all %}
+      {% do adapter.add_query("delete from " ~ this.render()) %}
+  {% endif %}
 
+  {% for chunk in changes.deleted_hashes | batch(batch_size) %}
       {% set sql %}
-          insert into {{ this.render() }} ({{ cols_sql }}) values
-          {% for row in chunk -%}
-              ({%- for column in agate_table.column_names -%}
-                  {{ get_binding_char() }}
-                  {%- if not loop.last%},{%- endif %}
-              {%- endfor -%})
-              {%- if not loop.last%},{%- endif %}
-          {%- endfor %}
+          delete from {{ this.render() }} where {{ hash_col_sql }} in (
+          {%- for row_hash in chunk -%}
+              {{ binding_char }}{%- if not loop.last %}, {% endif -%}
+          {%- endfor -%})
       {% endset %}
+      {% do adapter.add_query(sql, bindings=chunk, abridge_sql_log=True) %}
+  {% endfor %}
+
+  {% set statements = [] %}
 
+  {% for sql, bindings in adapter.get_insert_batches(this, cols_sql, changes.rows, batch_size, binding_char) %}
       {% do adapter.add_query(sql, bindings=bindings, abridge_sql_log=True) %}
 
-      {% if loop.index0 == 0 %}
+      {% if loop.first %}
           {% do statements.append(sql) %}
       {% endif %}
   {% endfor %}
@@ -126,3 +196,46 @@
   {# Return SQL so we can render it out into the compiled files #}
   {{ return(statements[0]) }}
 {% endmacro %}
+
+
+{% macro load_csv_rows_in_parallel(model, agate_table) -%}
+  {{ return(adapter.dispatch('load_csv_rows_in_parallel', 'dbt')(model, agate_table)) }}
+{%- endmacro %}
+
+{% macro default__load_csv_rows_in_parallel(model, agate_table) %}
+
+  {% set target_relation = this.incorporate(type='table') %}
+  {% set old_relation = load_cached_relation(target_relation) %}
+  {% set staging_relation = make_intermediate_relation(target_relation) %}
+  {% set backup_relation = make_backup_relation(target_relation, 'table') %}
+  {{ drop_relation_if_exists(load_cached_relation(staging_relation)) }}
+  {{ drop_relation_if_exists(load_cached_relation(backup_relation)) }}
+
+  {% set sql %}
+    create table {{ staging_relation.render() }} ({{ get_csv_table_columns_sql(model, agate_table) }})
+  {% endset %}
+  {% call statement('_') -%}
+    {{ sql }}
+  {%- endcall %}
+
+  {% do adapter.bulk_load(
+      staging_relation,
+      agate_table.rows,
+      column_names=agate_table.column_names,
+      batch_size=get_batch_size(),
+      quote_columns=model['config'].get('quote_columns', None),
+      parallel=true,
+      drop_on_error=true
+  ) %}
+
+  {% if old_relation is none %}
+      {% do adapter.rename_relation(staging_relation, target_relation) %}
+  {% else %}
+      {% do adapter.rename_relation(target_relation, backup_relation) %}
+      {% do adapter.rename_relation(staging_relation, target_relation) %}
+      {% do adapter.drop_relation(backup_relation) %}
+  {% endif %}
+
+  {# Return SQL so we can render it out into the compiled files #}
+  {{ return(sql) }}
+{% endmacro %}
@@ -25,6 +25,9 @@
     {{ exceptions.raise_compiler_error("Cannot seed to '{}', it is a view".format(old_relation.render())) }}
   {% elif exists_as_table %}
     {% set create_table_sql = reset_csv_table(model, full_refresh_mode, old_relation, agate_table) %}
+  {% elif seed_loads_in_parallel(model) %}
+    {# load_csv_rows renames a table loaded in parallel into place #}
+    {% set create_table_sql = "-- created by a table loaded in parallel" %}
   {% else %}
     {% set create_table_sql = create_csv_table(model, agate_table) %}
   {% endif %}
@@ -3,14 +3,27 @@
 #}
 {% macro create_columns(relation, columns) %}
   {{ adapter.dispatch('create_columns', 'dbt')(relation, columns) }}
+  {% do adapter.invalidate_column_cache(relation) %}
 {% endmacro %}
 
 {% macro default__create_columns(relation, columns) %}
-  {% for column in columns %}
-    {% call statement() %}
-      alter table {{ relation.render() }} add column "{{ column.name }}" {{ column.data_type }};
-    {% endcall %}
-  {% endfor %}
+  {#-- adapters that override alter_relation_add_remove_columns may not accept several actions in one alter statement --#}
+  {% if adapter.dispatch('alter_relation_add_remove_columns', 'dbt').get_name() == 'default__alter_relation_add_remove_columns' %}
+    {% if columns %}
+      {% call statement() %}
+        alter table {{ relation.render() }}
+        {%- for column in columns %}
+          add column "{{ column.name }}" {{ column.data_type }}{{ ',' if not loop.last }}
+        {%- endfor %};
+      {% endcall %}
+    {% endif %}
+  {% else %}
+    {% for column in columns %}
+      {% call statement() %}
+        alter table {{ relation.render() }} add column "{{ column.name }}" {{ column.data_type }};
+      {% endcall %}
+    {% endfor %}
+  {% endif %}
 {% endmacro %}
 
 
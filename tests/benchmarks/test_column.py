@@ -0,0 +1,61 @@
+import pytest
+
+from dbt.adapters.base import Column
+
+pytest.importorskip("pytest_benchmark")
+
+RAW_DATA_TYPES = [
+    "character varying(256)",
+    "text",
+    "integer",
+    "bigint",
+    "numeric(38,6)",
+    "double precision",
+    "timestamp without time zone",
+    "boolean",
+]
+
+
+@pytest.fixture(scope="module")
+def descriptions():
+    return [(f"column_{i}", RAW_DATA_TYPES[i % len(RAW_DATA_TYPES)]) for i in range(2500)]
+
+
+@pytest.fixture(scope="module")
+def columns(descriptions):
+    return [Column.from_description(name, raw) for name, raw in descriptions]
+
+
+def test_column_from_description(benchmark, descriptions):
+    def run():
+        return [Column.from_description(name, raw) for name, raw in descriptions]
+
+    assert len(benchmark(run)) == len(descriptions)
+
+
+def test_column_type_checks(benchmark, columns):
+    def run():
+        return sum(1 for column in columns if column.is_number() or column.is_string())
+
+    assert benchmark(run) == 1876
+
+
+def test_column_data_type(benchmark, columns):
+    def run():
+        return [column.data_type for column in columns]
+
+    assert benchmark(run)[0] == "character varying(256)"
+
+
+def test_column_schema_diff(benchmark, columns):
+    target = {column.name: column for column in columns}
+
+    def run():
+        return [
+            column.name
+            for column in columns
+            if column.can_expand_to(target[column.name])
+            or column.data_type != target[column.name].data_type
+        ]
+
+    assert benchmark(run) == []
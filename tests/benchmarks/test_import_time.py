@@ -0,0 +1,22 @@
+import pytest
+
+from tests.unit.test_import_time import _import_times
+
+pytest.importorskip("pytest_benchmark")
+
+# the time that importing dbt.adapters' own modules may take, in microseconds,
+# not counting the packages they depend on
+IMPORT_TIME_BUDGET_US = 200_000
+
+
+@pytest.mark.parametrize("module", ["dbt.adapters.sql.impl", "dbt.adapters.factory"])
+def test_import_time(benchmark, module):
+    own_times = []
+
+    def run():
+        times = _import_times(module)
+        own_times.append(sum(us for name, us in times.items() if name.startswith("dbt.adapters")))
+
+    benchmark.pedantic(run, rounds=3)
+    # the best round, as the others may have been slowed down by the machine
+    assert min(own_times) < IMPORT_TIME_BUDGET_US
@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+import pytest
+
+from dbt.adapters.base.query_headers import MacroQueryStringSetter
+from dbt.adapters.contracts.connection import QueryComment
+
+pytest.importorskip("pytest_benchmark")
+
+SQL = "select id, name from analytics.customers where id = 1;"
+COMMENT = '{"app": "dbt", "node_id": "{{ node.unique_id if node else connection_name }}"}'
+NODE = SimpleNamespace(unique_id="model.project.customers")
+
+
+def _setter(comment, append=False):
+    config = SimpleNamespace(query_comment=QueryComment(comment=comment, append=append))
+    setter = MacroQueryStringSetter(config, {})
+    setter.set("model.project.customers", NODE)
+    return setter
+
+
+@pytest.mark.parametrize("append", [False, True])
+def test_add_query_comment(benchmark, append):
+    setter = _setter(COMMENT, append)
+    assert "model.project.customers" in benchmark(setter.add, SQL)
+
+
+def test_add_empty_query_comment(benchmark):
+    setter = _setter("")
+    assert benchmark(setter.add, SQL) == SQL
+
+
+def test_set_query_comment(benchmark):
+    setter = _setter(COMMENT)
+    benchmark(setter.set, "model.project.customers", NODE)
+    assert "model.project.customers" in setter.add(SQL)
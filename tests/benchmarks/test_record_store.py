@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from dbt_common.record import Recorder, RecorderMode
+
+from dbt.adapters.record.cursor.execute import CursorExecuteParams, CursorExecuteRecord
+from dbt.adapters.record.cursor.fetchall import (
+    CursorFetchAllParams,
+    CursorFetchAllRecord,
+    CursorFetchAllResult,
+)
+from dbt.adapters.record.store import BinaryRecorder
+
+pytest.importorskip("pytest_benchmark")
+
+CONNECTIONS = 8
+CALLS = 5000
+
+
+def _calls():
+    for seq in range(CALLS):
+        connection_name = f"model.project.model_{seq % CONNECTIONS}"
+        sql = f"select * from analytics.table_{seq % 50} where id = %s"
+        yield CursorExecuteRecord(CursorExecuteParams(connection_name, sql, [seq]), None)
+        yield CursorFetchAllRecord(
+            CursorFetchAllParams(connection_name),
+            CursorFetchAllResult([(seq, "name", seq * 1.5)] * 10),
+        )
+
+
+@pytest.fixture(scope="module", params=[Recorder, BinaryRecorder])
+def recording(request, tmp_path_factory):
+    recorder_cls = request.param
+    path = str(tmp_path_factory.mktemp("recording") / "recording")
+    recorder = recorder_cls(
+        RecorderMode.RECORD,
+        None,
+        current_recording_path=path,
+        in_memory=recorder_cls is Recorder,
+    )
+    for record in _calls():
+        recorder.add_record(record)
+    if recorder_cls is Recorder:
+        # Recorder.load expects the records grouped by type
+        with open(path, "w") as fp:
+            json.dump(
+                {t: [r.to_dict() for r in rs] for t, rs in recorder._records_by_type.items()}, fp
+            )
+    else:
+        recorder.write()
+    return recorder_cls, path
+
+
+def test_replay(benchmark, recording):
+    recorder_cls, path = recording
+
+    def replay():
+        recorder = recorder_cls(RecorderMode.REPLAY, None, previous_recording_path=path)
+        for record in _calls():
+            assert recorder.pop_matching_record(record.params) is not None
+
+    benchmark.pedantic(replay, rounds=3)
+
+
+def test_replay_first_call(benchmark, recording):
+    recorder_cls, path = recording
+
+    def replay():
+        recorder = recorder_cls(RecorderMode.REPLAY, None, previous_recording_path=path)
+        record = next(_calls())
+        assert recorder.pop_matching_record(record.params) is not None
+
+    benchmark.pedantic(replay, rounds=3)
@@ -0,0 +1,98 @@
+import pytest
+
+from dbt.adapters.base import BaseRelation
+from dbt.adapters.base.relation import SchemaSearchMap
+
+pytest.importorskip("pytest_benchmark")
+
+
+def make_relations(count, schemas=10):
+    return [
+        BaseRelation.create(database="db", schema=f"schema_{i % schemas}", identifier=f"t{i}")
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(scope="module")
+def relations():
+    return make_relations(5000)
+
+
+@pytest.fixture(scope="module")
+def duplicate_relations():
+    return make_relations(5000)
+
+
+def test_relation_set_membership(benchmark, relations, duplicate_relations):
+    def run():
+        members = set(relations)
+        return sum(1 for relation in duplicate_relations if relation in members)
+
+    assert benchmark(run) == len(relations)
+
+
+def test_relation_dict_keys(benchmark, relations, duplicate_relations):
+    def run():
+        by_relation = {relation: i for i, relation in enumerate(relations)}
+        return [by_relation[relation] for relation in duplicate_relations]
+
+    assert benchmark(run) == list(range(len(relations)))
+
+
+def test_schema_search_map(benchmark, relations):
+    def run():
+        schema_map = SchemaSearchMap()
+        for relation in relations:
+            schema_map.add(relation)
+        return schema_map
+
+    schema_map = benchmark(run)
+    assert sum(len(schemas) for schemas in schema_map.values()) == 10
+
+
+def test_cache_schemas(benchmark):
+    def run(relations):
+        return [relation.without_identifier() for relation in relations]
+
+    schemas = benchmark.pedantic(
+        run, setup=lambda: ((make_relations(5000),), {}), rounds=5, iterations=1
+    )
+    assert len({id(schema) for schema in schemas}) == 10
+
+
+def test_catalog_info_schemas(benchmark):
+    def run(relations):
+        return [relation.information_schema_only() for relation in relations]
+
+    info_schemas = benchmark.pedantic(
+        run, setup=lambda: ((make_relations(5000),), {}), rounds=5, iterations=1
+    )
+    assert len({id(info_schema) for info_schema in info_schemas}) == 1
+
+
+def test_relation_create(benchmark):
+    assert len(benchmark(make_relations, 1000)) == 1000
+
+
+def test_relation_render(benchmark):
+    def run(relations):
+        return [relation.render() for relation in relations]
+
+    rendered = benchmark.pedantic(
+        run, setup=lambda: ((make_relations(1000),), {}), rounds=5, iterations=1
+    )
+    assert rendered[0] == '"db"."schema_0"."t0"'
+
+
+def test_relation_incorporate_type(benchmark, relations):
+    def run():
+        return [relation.incorporate(type="table") for relation in relations]
+
+    assert benchmark(run)[0].is_table
+
+
+def test_relation_incorporate_path(benchmark, relations):
+    def run():
+        return [relation.incorporate(path={"identifier": "other"}) for relation in relations]
+
+    assert benchmark(run)[0].identifier == "other"
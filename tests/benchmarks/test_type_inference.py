@@ -0,0 +1,46 @@
+import csv
+
+import pytest
+from dbt_common.clients.agate_helper import from_csv
+
+from dbt.adapters.sql import SQLAdapter
+
+pytest.importorskip("pytest_benchmark")
+
+ROWS = 50000
+
+
+@pytest.fixture(scope="module")
+def seed_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("seeds") / "seed.csv"
+    with open(path, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(["id", "amount", "flag", "day", "name", "updated_at"])
+        for i in range(ROWS):
+            writer.writerow(
+                [
+                    i,
+                    f"{i % 1000}.{i % 97:02d}",
+                    "true" if i % 2 else "false",
+                    f"2020-01-{i % 28 + 1:02d}",
+                    f"name_{i % 500}",
+                    f"2020-01-01 {i % 24:02d}:{i % 60:02d}:00",
+                ]
+            )
+    return path
+
+
+def _convert_types(table):
+    return {
+        name: SQLAdapter.convert_type(table, idx) for idx, name in enumerate(table.column_names)
+    }
+
+
+def test_convert_types_agate(benchmark, seed_path):
+    result = benchmark(lambda: _convert_types(from_csv(str(seed_path), [])))
+    assert result["amount"] == "float8"
+
+
+def test_convert_types_single_pass(benchmark, seed_path):
+    result = benchmark(lambda: SQLAdapter.convert_csv_types(seed_path))
+    assert result == _convert_types(from_csv(str(seed_path), []))
@@ -1,8 +1,17 @@
+from datetime import datetime, timedelta, timezone
 from unittest import mock
 
+from dbt_common.context import set_invocation_context
+from dbt_common.exceptions import DbtDatabaseError, DbtInternalError, MacroResultError
 import pytest
 
+from dbt.adapters.base.column import Column
+from dbt.adapters.base.connections import AdapterResponse
 from dbt.adapters.base.impl import BaseAdapter, ConstraintSupport
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.capability import Capability, CapabilityDict, CapabilitySupport, Support
+from dbt.adapters.contracts.connection import ConnectionState
+from dbt.adapters.exceptions import ApproximateMatchError
 
 
 class TestBaseAdapterConstraintRendering:
@@ -234,3 +243,707 @@ class TestBaseAdapterConstraintRendering:
 
         rendered_constraints = BaseAdapter.render_raw_model_constraints(constraints)
         assert rendered_constraints == []
+
+
+class TestCatalogFilterTable:
+    column_names = ["table_database", "table_schema", "table_name", "column_index"]
+
+    @pytest.fixture
+    def table(self):
+        import agate
+
+        rows = [
+            ["DB", "Schema", "a", 1],
+            ["db", "other", "b", 2],
+            ["db", None, "c", 3],
+            ["db", "schema", "D", 4],
+        ]
+        return agate.Table(rows, self.column_names)
+
+    def test_filters_by_used_schemas(self, table):
+        result = BaseAdapter._catalog_filter_table(table, frozenset({("db", "SCHEMA")}))
+        assert [row["table_name"] for row in result] == ["a", "D"]
+        assert [row["column_index"] for row in result] == [1, 4]
+
+    def test_coerces_relation_name_columns_to_text(self):
+        import agate
+
+        table = agate.Table([["db", 123, "t", 1]], self.column_names)
+        result = BaseAdapter._catalog_filter_table(table, frozenset({("db", "123")}))
+        assert isinstance(result.column_types[1], agate.Text)
+        assert result[0]["table_schema"] == "123"
+
+    def test_unfiltered_text_table_is_not_rebuilt(self, table):
+        used_schemas = frozenset({("db", "schema"), ("db", "other")})
+        filtered = BaseAdapter._catalog_filter_table(table, used_schemas)
+        assert BaseAdapter._catalog_filter_table(filtered, used_schemas) is filtered
+
+    def test_missing_column_raises(self):
+        import agate
+
+        table = agate.Table([["db", "schema"]], ["table_database", "table_schema"])
+        with pytest.raises(DbtInternalError):
+            BaseAdapter._catalog_filter_table(table, frozenset({("db", "schema")}))
+
+    def test_pushdown_skips_schema_filter(self, table):
+        capabilities = CapabilityDict(
+            {Capability.CatalogFilterPushdown: CapabilitySupport(support=Support.Full)}
+        )
+        with mock.patch.object(BaseAdapter, "_capabilities", capabilities):
+            result = BaseAdapter._catalog_filter_table(table, frozenset({("db", "schema")}))
+        assert len(result) == 4
+
+    def test_get_filtered_catalog_filters_relations(self, adapter, table):
+        relations = {
+            BaseRelation.create(database="db", schema="schema", identifier="d"),
+            BaseRelation.create(database="db", schema="other", identifier="b"),
+        }
+        with mock.patch.object(adapter, "get_catalog", return_value=(table, [])):
+            catalog, exceptions = adapter.get_filtered_catalog([], frozenset(), relations)
+        assert [row["table_name"] for row in catalog] == ["b", "D"]
+        assert exceptions == []
+
+
+class TestCatalogByRelationChunks:
+    @pytest.fixture
+    def capabilities(self):
+        capabilities = CapabilityDict(
+            {Capability.SchemaMetadataByRelations: CapabilitySupport(support=Support.Full)}
+        )
+        with mock.patch.object(BaseAdapter, "_capabilities", capabilities):
+            yield
+
+    @staticmethod
+    def _relations(count, schema="schema"):
+        return {
+            BaseRelation.create(database="db", schema=schema, identifier=f"t{i}")
+            for i in range(count)
+        }
+
+    def test_chunks_respect_max_relations(self, adapter):
+        chunks = adapter._get_catalog_relation_chunks(self._relations(250))
+        assert sorted(len(chunk) for _, chunk in chunks) == [50, 100, 100]
+
+    def test_unknown_schema_size_prefers_full_catalog(self, adapter):
+        assert adapter._catalog_by_relations_is_cheaper(self._relations(100))
+        assert not adapter._catalog_by_relations_is_cheaper(self._relations(101))
+
+    def test_large_cached_schema_prefers_chunks(self, adapter):
+        for relation in self._relations(2000):
+            adapter.cache.add(relation)
+        assert adapter._catalog_by_relations_is_cheaper(self._relations(250))
+
+    def test_get_filtered_catalog_runs_chunks(self, adapter, capabilities):
+        import agate
+
+        adapter.config.args = mock.Mock(single_threaded=True)
+        for relation in self._relations(2000):
+            adapter.cache.add(relation)
+        relations = self._relations(250)
+
+        empty = agate.Table([], ["table_database", "table_schema", "table_name"])
+        with mock.patch.object(
+            adapter, "_get_one_catalog_by_relations", return_value=empty
+        ) as get_one, mock.patch.object(adapter, "get_catalog") as get_catalog:
+            adapter.get_filtered_catalog([], frozenset({("db", "schema")}), relations)
+
+        get_catalog.assert_not_called()
+        assert get_one.call_count == 3
+
+
+class TestGetRelation:
+    @pytest.fixture
+    def cached_adapter(self, adapter):
+        adapter.config.quoting = {"database": True, "schema": True, "identifier": True}
+        for identifier in ("orders", "Customers", "payments"):
+            adapter.cache.add(
+                BaseRelation.create(database="db", schema="schema", identifier=identifier)
+            )
+        return adapter
+
+    @pytest.mark.parametrize("identifier", ["orders", "Customers", "missing"])
+    def test_matches_full_scan(self, cached_adapter, identifier):
+        relations = cached_adapter.cache.get_relations("db", "schema")
+        expected = cached_adapter._make_match(relations, "db", "schema", identifier)
+
+        relation = cached_adapter.get_relation("db", "schema", identifier)
+        assert ([relation] if relation else []) == expected
+
+    @pytest.mark.parametrize("identifier", ["customers", '"orders"'])
+    def test_approximate_match_raises(self, cached_adapter, identifier):
+        with pytest.raises(ApproximateMatchError):
+            cached_adapter.get_relation("db", "schema", identifier)
+
+    def test_does_not_list_cached_schema(self, cached_adapter):
+        with mock.patch.object(cached_adapter, "list_relations") as list_relations:
+            relation = cached_adapter.get_relation("db", "schema", "payments")
+        list_relations.assert_not_called()
+        assert relation.identifier == "payments"
+
+
+class TestComputeSchemaDiff:
+    def test_diff(self, adapter):
+        source_columns = [
+            Column("id", "integer"),
+            Column("name", "character varying", char_size=10),
+            Column("amount", "numeric", numeric_precision=10, numeric_scale=2),
+            Column("added", "text"),
+        ]
+        target_columns = [
+            Column("id", "integer"),
+            Column("name", "character varying", char_size=20),
+            Column("amount", "numeric", numeric_precision=12, numeric_scale=4),
+            Column("removed", "text"),
+        ]
+        source = BaseRelation.create(database="db", schema="schema", identifier="source")
+        target = BaseRelation.create(database="db", schema="schema", identifier="target")
+
+        with mock.patch.object(
+            adapter, "get_columns_in_relation", side_effect=[source_columns, target_columns]
+        ) as get_columns:
+            changes = adapter.compute_schema_diff(source, target)
+
+        assert get_columns.call_args_list == [mock.call(source), mock.call(target)]
+        assert changes == {
+            "schema_changed": True,
+            "source_not_in_target": [source_columns[3]],
+            "target_not_in_source": [target_columns[3]],
+            "source_columns": source_columns,
+            "target_columns": target_columns,
+            "new_target_types": [{"column_name": "amount", "new_type": "numeric(10,2)"}],
+        }
+
+    def test_no_changes(self, adapter):
+        columns = [Column("id", "integer"), Column("Name", "text")]
+        changes = adapter._diff_column_schemas(columns, list(columns))
+        assert changes["schema_changed"] is False
+        assert changes["source_not_in_target"] == []
+        assert changes["target_not_in_source"] == []
+        assert changes["new_target_types"] == []
+
+        changes = adapter._diff_column_schemas(columns, [Column("id", "integer")])
+        assert changes["schema_changed"] is True
+        assert changes["source_not_in_target"] == [columns[1]]
+
+
+class TestColumnCache:
+    @pytest.fixture(autouse=True)
+    def cache_columns(self):
+        with mock.patch.object(BaseAdapter, "CACHE_COLUMNS", True):
+            yield
+
+    @staticmethod
+    def _relation(identifier):
+        return BaseRelation.create(database="db", schema="schema", identifier=identifier)
+
+    def test_off_by_default(self, adapter):
+        relation = self._relation("first")
+        with mock.patch.object(BaseAdapter, "CACHE_COLUMNS", False):
+            with mock.patch.object(
+                adapter, "get_columns_in_relation", return_value=[Column("a", "integer")]
+            ) as get_columns:
+                adapter.get_columns_in_relations([relation])
+                adapter.get_columns_in_relations([relation])
+            assert get_columns.call_count == 2
+            assert adapter._get_cached_columns(relation) is None
+
+    def test_get_columns_in_relations_caches(self, adapter):
+        first, second = self._relation("first"), self._relation("second")
+        columns = {first: [Column("a", "integer")], second: [Column("b", "text")]}
+
+        with mock.patch.object(
+            adapter, "get_columns_in_relation", side_effect=lambda r: columns[r]
+        ) as get_columns:
+            assert adapter.get_columns_in_relations([first, second]) == columns
+            assert adapter.get_columns_in_relations([second, first]) == columns
+        assert get_columns.call_count == 2
+
+    def test_empty_columns_are_not_cached(self, adapter):
+        relation = self._relation("missing")
+        with mock.patch.object(adapter, "get_columns_in_relation", return_value=[]):
+            assert adapter.get_columns_in_relations([relation]) == {relation: []}
+        assert adapter._get_cached_columns(relation) is None
+
+    def test_ddl_invalidates(self, adapter):
+        relation, other = self._relation("first"), self._relation("other")
+        columns = [Column("a", "integer")]
+
+        for invalidate in (
+            lambda: adapter.cache_added(relation),
+            lambda: adapter.cache_dropped(relation),
+            lambda: adapter.cache_renamed(relation, other),
+            lambda: adapter.cache_renamed(other, relation),
+            lambda: adapter.invalidate_column_cache(),
+        ):
+            adapter._cache_columns(relation, columns)
+            assert adapter._get_cached_columns(relation) == columns
+            invalidate()
+            assert adapter._get_cached_columns(relation) is None
+
+    def test_drop_invalidates_dependents_only(self, adapter):
+        table, view, other = (
+            self._relation("table"),
+            self._relation("view"),
+            self._relation("other"),
+        )
+        for relation in (table, view, other):
+            adapter.cache_added(relation)
+            adapter._cache_columns(relation, [Column("a", "integer")])
+        adapter.cache.add_link(table, view)
+
+        adapter.cache_dropped(table)
+
+        assert adapter._get_cached_columns(table) is None
+        assert adapter._get_cached_columns(view) is None
+        assert adapter._get_cached_columns(other) == [Column("a", "integer")]
+
+    def test_cached_columns_are_copies(self, adapter):
+        relation = self._relation("first")
+        columns = [Column("a", "character varying", char_size=10)]
+        adapter._cache_columns(relation, columns)
+        columns[0].char_size = 20
+        adapter._get_cached_columns(relation)[0].char_size = 30
+        assert adapter._get_cached_columns(relation)[0].char_size == 10
+
+
+class TestGetInsertBatches:
+    def test_full_batches_share_statement(self, adapter):
+        relation = BaseRelation.create(database="db", schema="schema", identifier="seed")
+        rows = [(i, f"name_{i}") for i in range(5)]
+
+        batches = list(adapter.get_insert_batches(relation, '"id", "name"', rows, 2, "%s"))
+
+        assert [bindings for _, bindings in batches] == [
+            [0, "name_0", 1, "name_1"],
+            [2, "name_2", 3, "name_3"],
+            [4, "name_4"],
+        ]
+        (full, _), (again, _), (partial, _) = batches
+        assert (
+            full == 'insert into "db"."schema"."seed" ("id", "name") values\n(%s, %s),\n(%s, %s)'
+        )
+        assert again is full
+        assert partial == 'insert into "db"."schema"."seed" ("id", "name") values\n(%s, %s)'
+
+        other = BaseRelation.create(database="db", schema="schema", identifier="other")
+        rerun = list(adapter.get_insert_batches(other, '"id", "name"', rows[:2], 2, "%s"))
+        assert rerun[0][0] == full.replace('"seed"', '"other"')
+
+    def test_no_rows(self, adapter):
+        relation = BaseRelation.create(database="db", schema="schema", identifier="seed")
+        assert list(adapter.get_insert_batches(relation, '"id"', [], 2, "%s")) == []
+
+
+class TestDiffSeedRows:
+    ROWS = [(1, "a"), (2, "b"), (2, "b"), (3, None)]
+
+    def _hashes(self, rows):
+        return [BaseAdapter._seed_row_hash(row) for row in rows]
+
+    def test_unchanged(self, adapter):
+        changes = adapter.diff_seed_rows(self.ROWS, self._hashes(self.ROWS))
+        assert changes == {"rows": [], "deleted_hashes": [], "delete_all": False}
+
+    def test_changed_rows(self, adapter):
+        stored = [(1, "a"), (2, "b"), (3, ""), (4, "d")]
+
+        changes = adapter.diff_seed_rows(self.ROWS, self._hashes(stored))
+
+        b_hash, null_hash = self._hashes([(2, "b"), (3, None)])
+        assert changes["rows"] == [(2, "b", b_hash), (2, "b", b_hash), (3, None, null_hash)]
+        assert changes["deleted_hashes"] == self._hashes(stored[1:])
+        assert not changes["delete_all"]
+
+    def test_rows_without_hashes(self, adapter):
+        changes = adapter.diff_seed_rows(self.ROWS, self._hashes(self.ROWS[:1]) + [None])
+
+        assert [row[:-1] for row in changes["rows"]] == self.ROWS
+        assert changes["deleted_hashes"] == []
+        assert changes["delete_all"]
+
+
+class TestParallelBulkLoad:
+    relation = BaseRelation.create(database="db", schema="schema", identifier="seed__dbt_tmp")
+    rows = [(i, f"name_{i}") for i in range(10)]
+
+    @pytest.fixture(autouse=True)
+    def threads(self, adapter):
+        # the thread pool copies the invocation context into its threads, and
+        # the connections it opens are logged with their type
+        set_invocation_context({})
+        capabilities = CapabilityDict(
+            {Capability.NonTransactionalDDL: CapabilitySupport(support=Support.Full)}
+        )
+        with mock.patch.object(adapter.connections, "TYPE", "test"):
+            with mock.patch.object(BaseAdapter, "_capabilities", capabilities):
+                yield
+
+    def _load(self, adapter, single_threaded=False):
+        adapter.config.args = mock.Mock(single_threaded=single_threaded)
+        with mock.patch.object(adapter, "bulk_load_rows") as load_rows:
+            with mock.patch.object(adapter.connections, "commit") as commit:
+                loaded = adapter.bulk_load(
+                    self.relation, iter(self.rows), ["id", "name"], batch_size=3, parallel=True
+                )
+        chunks = [c.args[2] for c in load_rows.call_args_list]
+        return loaded, chunks, commit.call_count
+
+    def test_chunks_are_loaded_and_committed_per_thread(self, adapter):
+        loaded, chunks, commits = self._load(adapter, single_threaded=False)
+
+        assert loaded == 10
+        assert sorted(row for chunk in chunks for row in chunk) == self.rows
+        assert sorted(len(chunk) for chunk in chunks) == [1, 3, 3, 3]
+        assert 1 <= commits <= adapter.config.threads
+        assert adapter._bulk_load_connections == 0
+
+    def test_transactional_ddl_loads_on_the_current_connection(self, adapter):
+        with mock.patch.object(BaseAdapter, "_capabilities", CapabilityDict({})):
+            loaded, chunks, commits = self._load(adapter)
+
+        assert loaded == 10
+        assert len(chunks) == 4
+        assert commits == 0
+
+    def test_loads_share_the_threads(self, adapter):
+        open_connection = mock.Mock(state=ConnectionState.OPEN)
+        adapter.connections.thread_connections = {1: open_connection, 2: open_connection}
+        adapter._bulk_load_connections = 1
+
+        assert adapter._claim_bulk_load_connections() == adapter.config.threads - 3
+        assert adapter._claim_bulk_load_connections() == 0
+
+        # with a single free connection, the load runs on the current one
+        adapter._bulk_load_connections = adapter.config.threads - 3
+        loaded, chunks, commits = self._load(adapter)
+        assert loaded == 10
+        assert commits == 0
+        assert adapter._bulk_load_connections == adapter.config.threads - 3
+
+    def test_single_threaded_loads_on_the_current_connection(self, adapter):
+        loaded, chunks, commits = self._load(adapter, single_threaded=True)
+
+        assert loaded == 10
+        assert chunks == [self.rows[0:3], self.rows[3:6], self.rows[6:9], self.rows[9:]]
+        assert commits == 0
+
+    def test_failure_stops_the_load(self, adapter):
+        adapter.config.args = mock.Mock(single_threaded=False)
+        with mock.patch.object(adapter, "bulk_load_rows", side_effect=DbtInternalError("boom")):
+            with mock.patch.object(adapter.connections, "commit") as commit:
+                with pytest.raises(DbtInternalError):
+                    adapter.bulk_load(
+                        self.relation, self.rows, ["id", "name"], batch_size=3, parallel=True
+                    )
+        commit.assert_not_called()
+
+    def test_failed_load_drops_the_staging_relation(self, adapter):
+        adapter.config.args = mock.Mock(single_threaded=True)
+        with mock.patch.object(adapter, "bulk_load_rows", side_effect=DbtInternalError("boom")):
+            with mock.patch.object(adapter, "drop_relation", create=True) as drop_relation:
+                with pytest.raises(DbtInternalError):
+                    adapter.bulk_load(
+                        self.relation,
+                        self.rows,
+                        ["id", "name"],
+                        parallel=True,
+                        drop_on_error=True,
+                    )
+        drop_relation.assert_called_once_with(self.relation)
+
+    def test_can_bulk_load_in_parallel(self, adapter):
+        assert adapter.can_bulk_load_in_parallel()
+        with mock.patch.object(BaseAdapter, "_capabilities", CapabilityDict({})):
+            assert not adapter.can_bulk_load_in_parallel()
+
+
+class TestIncrementalCatalog:
+    column_names = ["table_database", "table_schema", "table_name", "table_comment"]
+
+    @pytest.fixture
+    def capabilities(self):
+        capabilities = CapabilityDict(
+            {Capability.TableLastModifiedMetadata: CapabilitySupport(support=Support.Full)}
+        )
+        with mock.patch.object(BaseAdapter, "_capabilities", capabilities):
+            yield
+
+    @pytest.fixture
+    def relations(self):
+        return {
+            name: BaseRelation.create(database="db", schema="schema", identifier=name)
+            for name in ("unchanged", "changed", "new")
+        }
+
+    def test_only_changed_relations_are_queried(self, adapter, capabilities, relations):
+        import agate
+
+        generated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        previous_catalog = agate.Table(
+            [
+                ["db", "schema", "unchanged", "old"],
+                ["db", "schema", "changed", "old"],
+                ["db", "schema", "dropped", "old"],
+            ],
+            self.column_names,
+        )
+        new_catalog = agate.Table(
+            [["db", "schema", "changed", "new"], ["db", "schema", "new", "new"]],
+            self.column_names,
+        )
+
+        def freshness(modified):
+            return {"max_loaded_at": modified, "snapshotted_at": modified, "age": 0.0}
+
+        freshness_responses = {
+            relations["unchanged"]: freshness(datetime(2024, 1, 1, tzinfo=timezone.utc)),
+            relations["changed"]: freshness(datetime(2024, 1, 3, tzinfo=timezone.utc)),
+        }
+        with mock.patch.object(
+            adapter,
+            "calculate_freshness_from_metadata_batch",
+            return_value=([], freshness_responses),
+        ), mock.patch.object(
+            adapter, "get_catalog", return_value=(new_catalog, [])
+        ) as get_catalog:
+            catalog, exceptions = adapter.get_filtered_catalog(
+                [],
+                frozenset({("db", "schema")}),
+                set(relations.values()),
+                previous_catalog=previous_catalog,
+                previous_catalog_generated_at=generated_at,
+            )
+
+        get_catalog.assert_called_once()
+        assert exceptions == []
+        assert sorted((row["table_name"], row["table_comment"]) for row in catalog) == [
+            ("changed", "new"),
+            ("new", "new"),
+            ("unchanged", "old"),
+        ]
+
+    def test_full_catalog_without_relations(self, adapter, capabilities):
+        import agate
+
+        previous_catalog = agate.Table([["db", "schema", "old", "old"]], self.column_names)
+        full_catalog = agate.Table(
+            [["db", "schema", "managed", "new"], ["db", "schema", "unmanaged", "new"]],
+            self.column_names,
+        )
+        with mock.patch.object(
+            adapter, "get_catalog", return_value=(full_catalog, [])
+        ), mock.patch.object(
+            adapter, "calculate_freshness_from_metadata_batch"
+        ) as calculate_freshness:
+            catalog, _ = adapter.get_filtered_catalog(
+                [],
+                frozenset({("db", "schema")}),
+                None,
+                previous_catalog=previous_catalog,
+                previous_catalog_generated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            )
+
+        calculate_freshness.assert_not_called()
+        assert sorted(row["table_name"] for row in catalog) == ["managed", "unmanaged"]
+
+    def test_requires_last_modified_capability(self, adapter, relations):
+        import agate
+
+        previous_catalog = agate.Table([], self.column_names)
+        with mock.patch.object(
+            adapter, "get_catalog", return_value=(previous_catalog, [])
+        ), mock.patch.object(
+            adapter, "calculate_freshness_from_metadata_batch"
+        ) as calculate_freshness:
+            adapter.get_filtered_catalog(
+                [],
+                frozenset(),
+                set(relations.values()),
+                previous_catalog=previous_catalog,
+                previous_catalog_generated_at=datetime(2024, 1, 1),
+            )
+        calculate_freshness.assert_not_called()
+
+
+class TestCatalogSchemaGroups:
+    @pytest.fixture
+    def info_schema(self):
+        return BaseRelation.create(database="db", schema="schema").information_schema_only()
+
+    def test_small_schemas_are_not_split(self, adapter, info_schema):
+        groups = adapter._get_catalog_schema_groups(info_schema, {"a", "b", "c"})
+        assert groups == [{"a", "b", "c"}]
+
+    def test_groups_are_balanced_by_relation_counts(self, adapter, info_schema):
+        adapter._catalog_relation_counts.update(
+            {("db", "a"): 400, ("db", "b"): 300, ("db", "c"): 200, ("db", "d"): 100}
+        )
+        adapter.config.threads = 2
+        groups = adapter._get_catalog_schema_groups(info_schema, {"a", "b", "c", "d"})
+        assert sorted(groups, key=sorted) == [{"a", "d"}, {"b", "c"}]
+
+    def test_groups_use_cached_relation_counts(self, adapter, info_schema):
+        for schema, count in (("a", 150), ("b", 150)):
+            for i in range(count):
+                adapter.cache.add(
+                    BaseRelation.create(database="db", schema=schema, identifier=f"t{i}")
+                )
+        groups = adapter._get_catalog_schema_groups(info_schema, {"a", "b"})
+        assert sorted(groups, key=sorted) == [{"a"}, {"b"}]
+
+    def test_catalog_relation_counts_are_recorded(self, adapter):
+        import agate
+
+        table = agate.Table(
+            [
+                ["DB", "A", "t1", "id"],
+                ["db", "a", "t1", "name"],
+                ["db", "a", "t2", "id"],
+                ["db", "b", "t3", "id"],
+            ],
+            ["table_database", "table_schema", "table_name", "column_name"],
+        )
+        adapter._record_catalog_relation_counts(table)
+        assert adapter._catalog_relation_counts == {("db", "a"): 2, ("db", "b"): 1}
+
+
+class TestCalculateFreshnessFromMetadataBatch:
+    def test_one_query_per_info_schema(self, adapter):
+        import agate
+        from dbt_common.utils import AttrDict
+
+        adapter.config.args = mock.Mock(single_threaded=True)
+        sources = [
+            BaseRelation.create(database=database, schema="schema", identifier=f"{database}_t")
+            for database in ("db1", "db2", "db3")
+        ]
+        snapshotted_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        def execute_macro(macro_name, kwargs, **_):
+            (relation,) = kwargs["relations"]
+            table = agate.Table(
+                [[relation.schema, relation.identifier, snapshotted_at, snapshotted_at]],
+                ["schema", "identifier", "last_modified", "snapshotted_at"],
+            )
+            response = AdapterResponse(_message="OK", code=relation.database)
+            return AttrDict({"response": response, "table": table})
+
+        with mock.patch.object(adapter, "execute_macro", side_effect=execute_macro):
+            adapter_responses, freshness = adapter.calculate_freshness_from_metadata_batch(sources)
+
+        assert [r.code for r in adapter_responses] == ["db1", "db2", "db3"]
+        assert set(freshness) == set(sources)
+        assert all(f["age"] == 0.0 for f in freshness.values())
+
+
+class TestCalculateFreshnessBatch:
+    def test_sources_are_batched_per_database(self, adapter):
+        import agate
+        from dbt_common.utils import AttrDict
+
+        adapter.config.args = mock.Mock(single_threaded=True)
+        sources = [
+            (
+                BaseRelation.create(database=database, schema="schema", identifier=f"t{i}"),
+                "loaded_at",
+                "id > 0" if i % 2 else None,
+            )
+            for database in ("db1", "db2")
+            for i in range(3)
+        ]
+        snapshotted_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        batches = []
+
+        def execute_macro(macro_name, kwargs, **_):
+            batch = kwargs["sources"]
+            batches.append([(s["relation"].identifier, s["filter"]) for s in batch])
+            rows = [[i, datetime(2024, 1, 1, i), snapshotted_at] for i in range(len(batch))]
+            table = agate.Table(rows, ["source_index", "max_loaded_at", "snapshotted_at"])
+            return AttrDict({"response": AdapterResponse(_message="OK"), "table": table})
+
+        with mock.patch.object(adapter, "execute_macro", side_effect=execute_macro):
+            adapter_responses, freshness = adapter.calculate_freshness_batch(sources, batch_size=2)
+
+        assert batches == [
+            [("t0", None), ("t1", "id > 0")],
+            [("t2", None)],
+            [("t0", None), ("t1", "id > 0")],
+            [("t2", None)],
+        ]
+        assert len(adapter_responses) == 4
+        assert set(freshness) == {source for source, _, _ in sources}
+        assert freshness[sources[1][0]]["age"] == 23 * 60 * 60
+
+    def test_aware_values_match_single_sources(self, adapter):
+        import agate
+        from dbt_common.utils import AttrDict
+
+        source = BaseRelation.create(database="db", schema="schema", identifier="t")
+        berlin = timezone(timedelta(hours=2))
+        max_loaded_at = datetime(2024, 1, 1, 12, tzinfo=berlin)
+        snapshotted_at = datetime(2024, 1, 1, 13, 30, tzinfo=berlin)
+
+        def execute_macro(macro_name, kwargs, **_):
+            row = [max_loaded_at, snapshotted_at]
+            if macro_name == "collect_freshness_batch":
+                row = [0] + row
+            table = agate.Table(
+                [row], ["source_index", "max_loaded_at", "snapshotted_at"][-len(row) :]
+            )
+            return AttrDict({"response": AdapterResponse(_message="OK"), "table": table})
+
+        with mock.patch.object(adapter, "execute_macro", side_effect=execute_macro):
+            _, batch = adapter.calculate_freshness_batch([(source, "loaded_at", None)])
+            _, single = adapter.calculate_freshness(source, "loaded_at", None)
+
+        assert batch[source] == single
+        assert batch[source]["max_loaded_at"] == datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+        assert batch[source]["max_loaded_at"].utcoffset() == timedelta(0)
+        assert batch[source]["age"] == 90 * 60
+
+    def test_failed_batch_falls_back_to_single_sources(self, adapter):
+        import agate
+        from dbt_common.utils import AttrDict
+
+        sources = [
+            (
+                BaseRelation.create(database="db", schema="schema", identifier=f"t{i}"),
+                f"c{i}",
+                None,
+            )
+            for i in range(2)
+        ]
+        snapshotted_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        macro_names = []
+
+        def execute_macro(macro_name, kwargs, **_):
+            macro_names.append(macro_name)
+            if macro_name == "collect_freshness_batch":
+                raise DbtDatabaseError("cannot cast type integer to timestamp")
+            table = agate.Table(
+                [[datetime(2024, 1, 1), snapshotted_at]], ["max_loaded_at", "snapshotted_at"]
+            )
+            return AttrDict({"response": AdapterResponse(_message="OK"), "table": table})
+
+        with mock.patch.object(adapter, "execute_macro", side_effect=execute_macro):
+            adapter_responses, freshness = adapter.calculate_freshness_batch(sources)
+
+        assert macro_names == [
+            "collect_freshness_batch",
+            "collect_freshness",
+            "collect_freshness",
+        ]
+        assert len(adapter_responses) == 1
+        assert set(freshness) == {source for source, _, _ in sources}
+        assert all(f["age"] == 24 * 60 * 60 for f in freshness.values())
+
+    def test_missing_rows_raise(self, adapter):
+        import agate
+        from dbt_common.utils import AttrDict
+
+        source = BaseRelation.create(database="db", schema="schema", identifier="t")
+        table = agate.Table([], ["source_index", "max_loaded_at", "snapshotted_at"])
+        result = AttrDict({"response": AdapterResponse(_message="OK"), "table": table})
+        with mock.patch.object(adapter, "execute_macro", return_value=result):
+            with pytest.raises(MacroResultError):
+                adapter.calculate_freshness_batch([(source, "loaded_at", None)])
@@ -48,6 +48,16 @@ class TestEmpty(TestCache):
         self.assertEqual(len(self.cache.get_relations("dbt", "test")), 0)
 
 
+class TestRelationCounts(TestCache):
+    def test_counts_by_schema(self):
+        self.cache.add(make_relation("DBT", "Foo", "bar"))
+        self.cache.add(make_relation("dbt", "foo", "baz"))
+        self.cache.add(make_relation("dbt", "other", "bar"))
+        self.assertEqual(
+            self.cache.get_relation_counts(), {("dbt", "foo"): 2, ("dbt", "other"): 1}
+        )
+
+
 class TestDrop(TestCache):
     def setUp(self):
         super().setUp()
@@ -525,3 +535,35 @@ class TestComplexCache(TestCase):
         self.assertEqual(len(self.cache.get_relations("dbt", "bar")), 1)
         self.assertEqual(len(self.cache.get_relations("dbt_2", "foo")), 1)
         self.assertEqual(len(self.cache.relations), 2)
+
+
+class TestGetRelationsByIdentifier(TestCache):
+    def setUp(self):
+        super().setUp()
+        self.relation = make_relation("dbt", "foo", "Bar")
+        self.cache.add(self.relation)
+        self.cache.add(make_relation("dbt", "foo", "baz"))
+        self.cache.add(make_relation("dbt", "other", "bar"))
+
+    def test_get_by_identifier(self):
+        for identifier in ("Bar", "bar", "BAR", '"bar"'):
+            relations = self.cache.get_relations_by_identifier("DBT", "Foo", identifier)
+            self.assertEqual(relations, [self.relation])
+
+    def test_get_missing(self):
+        self.assertEqual(self.cache.get_relations_by_identifier("dbt", "foo", "qux"), [])
+        self.assertEqual(self.cache.get_relations_by_identifier("dbt", "nope", "bar"), [])
+
+    def test_index_follows_rename_and_drop(self):
+        renamed = make_relation("dbt", "foo", "qux")
+        self.cache.rename(self.relation, renamed)
+        self.assertEqual(self.cache.get_relations_by_identifier("dbt", "foo", "bar"), [])
+        self.assertEqual(self.cache.get_relations_by_identifier("dbt", "foo", "qux"), [renamed])
+
+        self.cache.drop(renamed)
+        self.assertEqual(self.cache.get_relations_by_identifier("dbt", "foo", "qux"), [])
+
+        self.cache.drop_schema("dbt", "other")
+        self.assertEqual(list(self.cache.identifiers), [("dbt", "foo")])
+        self.cache.clear()
+        self.assertEqual(self.cache.identifiers, {})
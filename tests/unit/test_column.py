@@ -1,6 +1,9 @@
+import dataclasses
 import decimal
 from unittest import TestCase
 
+from dbt_common.exceptions import DbtRuntimeError
+
 from dbt.adapters.base import Column
 
 
@@ -27,3 +30,72 @@ class TestNumericType(TestCase):
         col = Column("fieldname", "numeric", numeric_precision=None)
 
         self.assertEqual(col.data_type, "numeric")
+
+
+class TestDataType(TestCase):
+    def test__subclass_data_type_is_not_cached(self):
+        @dataclasses.dataclass
+        class PaddedColumn(Column):
+            padding: int = 0
+
+            @classmethod
+            def string_type(cls, size: int) -> str:
+                return f"varchar({size})"
+
+            def string_size(self) -> int:
+                return super().string_size() + self.padding
+
+        col = PaddedColumn("fieldname", "character", char_size=10)
+        self.assertEqual(col.data_type, "varchar(10)")
+        col.padding = 5
+        self.assertEqual(col.data_type, "varchar(15)")
+
+    def test__cache_follows_fields(self):
+        col = Column("fieldname", "character", char_size=10)
+        self.assertEqual(col.data_type, "character varying(10)")
+        col.char_size = 20
+        self.assertEqual(col.data_type, "character varying(20)")
+
+
+class TestFromDescription(TestCase):
+    def test__sizes(self):
+        col = Column.from_description("fieldname", "character varying(256)")
+        self.assertEqual(col, Column("fieldname", "character varying", 256))
+        self.assertEqual(col.data_type, "character varying(256)")
+
+        col = Column.from_description("fieldname", "numeric(12,2)")
+        self.assertEqual(col, Column("fieldname", "numeric", None, 12, 2))
+        self.assertEqual(col.data_type, "numeric(12,2)")
+
+        col = Column.from_description("fieldname", "geometry(a,b,c)")
+        self.assertEqual(col, Column("fieldname", "geometry"))
+
+    def test__invalid_sizes(self):
+        for raw_data_type in ("varchar(abc)", "numeric(12,x)", "(12)"):
+            with self.assertRaises(DbtRuntimeError):
+                Column.from_description("fieldname", raw_data_type)
+
+
+class TestColumnTypeRegistry(TestCase):
+    def test__types_are_parsed_once(self):
+        registry = Column.type_registry()
+        self.assertIs(registry, Column.type_registry())
+        self.assertIs(registry.get("varchar(10)"), registry.get("varchar(10)"))
+        self.assertIs(Column("a", "Integer").column_type, Column("b", "Integer").column_type)
+
+    def test__families(self):
+        self.assertTrue(Column("a", "VARCHAR").is_string())
+        self.assertFalse(Column("a", "varchar(10)").is_string())
+        self.assertTrue(Column("a", "double precision").is_float())
+        self.assertTrue(Column("a", "int8").is_integer())
+        self.assertTrue(Column("a", "decimal").is_numeric())
+        self.assertTrue(Column("a", "decimal").is_number())
+        self.assertFalse(Column("a", "timestamp").is_number())
+
+    def test__subclass_types(self):
+        class CustomColumn(Column):
+            STRING_TYPES = Column.STRING_TYPES | {"string"}
+
+        self.assertTrue(CustomColumn("a", "STRING").is_string())
+        self.assertFalse(Column("a", "STRING").is_string())
+        self.assertIsNot(CustomColumn.type_registry(), Column.type_registry())
@@ -154,6 +154,12 @@ sample_values = [
     types.ConstraintNotEnforced(constraint="", adapter=""),
     types.ConstraintNotSupported(constraint="", adapter=""),
     types.TypeCodeNotFound(type_code=0),
+    types.ColumnChanges(
+        table={"database": "", "schema": "", "identifier": ""},
+        added_columns=[""],
+        removed_columns=[""],
+        type_changes=[{"column_name": "", "orig_type": "", "new_type": ""}],
+    ),
 ]
 
 
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+# modules that are only needed once an adapter is used
+HEAVY_MODULES = {
+    "dbt.adapters.base.impl",
+    "dbt.adapters.events.adapter_types_pb2",
+    "dbt.adapters.relation_configs.config_base",
+    "pytz",
+}
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """The self time, in microseconds, of each module imported by importing a
+    module in a new interpreter, from the output of python -X importtime.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "dbt.adapters.base",
+        "dbt.adapters.base.column",
+        "dbt.adapters.base.relation",
+        "dbt.adapters.relation_configs",
+        "dbt.adapters.sql",
+    ],
+)
+def test_import_is_lazy(module):
+    assert not HEAVY_MODULES & set(_import_times(module))
+
+
+def test_events_import_proto_lazily():
+    times = _import_times("dbt.adapters.events.types")
+    assert "dbt.adapters.events.adapter_types_pb2" not in times
@@ -0,0 +1,138 @@
+import os
+import shutil
+from unittest import mock
+
+from dbt_common.clients.jinja import get_template
+import pytest
+
+from dbt.adapters import macro_bundle
+from dbt.adapters.macro_bundle import build_macro_bundle, get_macro_cache_dir, load_macro_bundle
+
+MACROS = """
+{% macro greet(name) -%}
+  hello {{ name }}{{ suffix }}
+{%- endmacro %}
+
+{% materialization thing, default %}
+  {{ return({}) }}
+{% endmaterialization %}
+"""
+
+
+@pytest.fixture
+def include_path(tmp_path):
+    path = tmp_path / "include"
+    (path / "macros" / "nested").mkdir(parents=True)
+    (path / "macros" / "nested" / "greet.sql").write_text(MACROS)
+    (path / "macros" / "test.sql").write_text("{% test not_empty(model) %}select 1{% endtest %}")
+    (path / "macros" / "notes.txt").write_text("not a macro")
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return tmp_path / "cache"
+
+
+class TestMacroBundle:
+    def test_build(self, include_path):
+        bundle = build_macro_bundle(include_path)
+
+        assert [f.path for f in bundle.files] == ["macros/nested/greet.sql", "macros/test.sql"]
+        assert bundle.files[0].contents == MACROS
+        assert [m.name for m in bundle.macros()] == [
+            "greet",
+            "materialization_thing_default",
+            "test_not_empty",
+        ]
+
+    def test_template_matches_source(self, include_path):
+        macro = next(build_macro_bundle(include_path).macros())
+        ctx = {"suffix": "!"}
+
+        rendered = macro.get_template(ctx).module.dbt_macro__greet("dbt")
+        assert rendered == get_template(macro.contents, ctx).module.dbt_macro__greet("dbt")
+        assert rendered == "hello dbt!"
+
+    def test_loads_from_cache(self, include_path, cache_dir):
+        built = load_macro_bundle(include_path, cache_dir)
+        assert len(list(cache_dir.glob("*.bundle"))) == 1
+
+        with mock.patch.object(macro_bundle, "_build") as build:
+            cached = load_macro_bundle(include_path, cache_dir)
+        build.assert_not_called()
+        assert cached.digest == built.digest
+        assert [m.name for m in cached.macros()] == [m.name for m in built.macros()]
+        assert next(cached.macros()).get_template({"suffix": "?"}).module.dbt_macro__greet(
+            "x"
+        ) == ("hello x?")
+
+    def test_rebuilds_changed_macros(self, include_path, cache_dir):
+        first = load_macro_bundle(include_path, cache_dir)
+        (include_path / "macros" / "test.sql").write_text("{% macro other() %}{% endmacro %}")
+
+        second = load_macro_bundle(include_path, cache_dir)
+        assert second.digest != first.digest
+        assert [m.name for m in second.macros()][-1] == "other"
+        # the previous bundle is replaced
+        assert [p.name for p in cache_dir.glob("*.bundle")] == [
+            f"{macro_bundle._path_key(include_path)}-{second.digest}.bundle"
+        ]
+
+    def test_keeps_bundles_of_other_include_paths(self, include_path, tmp_path, cache_dir):
+        other_path = tmp_path / "other"
+        shutil.copytree(include_path, other_path)
+        load_macro_bundle(other_path, cache_dir)
+        load_macro_bundle(include_path, cache_dir)
+        (include_path / "macros" / "test.sql").write_text("{% macro other() %}{% endmacro %}")
+
+        load_macro_bundle(include_path, cache_dir)
+        assert len(list(cache_dir.glob("*.bundle"))) == 2
+        with mock.patch.object(macro_bundle, "_build") as build:
+            load_macro_bundle(other_path, cache_dir)
+        build.assert_not_called()
+
+    def test_rebuilds_unreadable_cache(self, include_path, cache_dir):
+        bundle = load_macro_bundle(include_path, cache_dir)
+        (cache_file,) = cache_dir.glob("*.bundle")
+        cache_file.write_bytes(b"garbage")
+
+        assert load_macro_bundle(include_path, cache_dir).digest == bundle.digest
+
+    def test_rebuilds_cache_with_another_digest(self, include_path, cache_dir):
+        bundle = load_macro_bundle(include_path, cache_dir)
+        (cache_file,) = cache_dir.glob("*.bundle")
+        other = build_macro_bundle(include_path)
+        other.digest = "0" * 64
+        cache_file.write_bytes(other._dump())
+
+        with mock.patch.object(macro_bundle, "_build", wraps=macro_bundle._build) as build:
+            assert load_macro_bundle(include_path, cache_dir).digest == bundle.digest
+        build.assert_called_once()
+
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="file modes are POSIX only")
+    def test_rebuilds_cache_writable_by_others(self, include_path, cache_dir):
+        load_macro_bundle(include_path, cache_dir)
+        (cache_file,) = cache_dir.glob("*.bundle")
+        cache_file.chmod(0o666)
+
+        with mock.patch.object(macro_bundle, "_build", wraps=macro_bundle._build) as build:
+            load_macro_bundle(include_path, cache_dir)
+        build.assert_called_once()
+        assert cache_file.stat().st_mode & 0o022 == 0
+
+    def test_unwritable_cache(self, include_path, tmp_path):
+        # a file where the cache dir would be
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("")
+
+        assert len(list(load_macro_bundle(include_path, cache_dir).macros())) == 3
+
+    def test_cache_dir_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("DBT_MACRO_CACHE_DIR", str(tmp_path))
+        assert get_macro_cache_dir() == tmp_path
+        monkeypatch.setenv("DBT_MACRO_CACHE_DIR", "")
+        assert get_macro_cache_dir() is None
+        monkeypatch.delenv("DBT_MACRO_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert get_macro_cache_dir() == tmp_path / "dbt" / "macro_bundles"
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+from unittest import mock
+
+from dbt_common.exceptions import DbtRuntimeError
+import pytest
+
+from dbt.adapters.base.query_headers import MacroQueryStringSetter
+from dbt.adapters.contracts.connection import QueryComment
+
+
+def _setter(comment, append=False):
+    config = SimpleNamespace(query_comment=QueryComment(comment=comment, append=append))
+    return MacroQueryStringSetter(config, {})
+
+
+class TestMacroQueryStringSetter:
+    def test_prepend(self):
+        setter = _setter("  {{ connection_name }} ")
+        setter.set("model.a", None)
+        assert setter.add("select 1") == "/* model.a */\nselect 1"
+
+    def test_append(self):
+        setter = _setter("{{ connection_name }}", append=True)
+        setter.set("model.a", None)
+        assert setter.add("select 1;  ") == "select 1\n/* model.a */;"
+        assert setter.add("select 1\n") == "select 1\n/* model.a */"
+
+    def test_empty_comment(self):
+        setter = _setter("")
+        with mock.patch.object(setter, "generator") as generator:
+            setter.set("model.a", SimpleNamespace(unique_id="model.a"))
+        generator.assert_not_called()
+        assert setter.add("select 1") == "select 1"
+
+    def test_rendered_once_per_connection_and_node(self):
+        setter = _setter("{{ connection_name }} {{ node.unique_id }}")
+        node, other = SimpleNamespace(unique_id="model.a"), SimpleNamespace(unique_id="model.b")
+
+        with mock.patch.object(setter, "generator", wraps=setter.generator) as generator:
+            for _ in range(3):
+                setter.set("model.a", node)
+                assert setter.add("select 1") == "/* model.a model.a */\nselect 1"
+            setter.set("model.a", other)
+            setter.set("master", None)
+            setter.set("master", None)
+
+        assert generator.call_count == 2
+        assert setter.add("select 1") == "/* master */\nselect 1"
+
+    def test_nodes_without_unique_id_are_not_cached(self):
+        setter = _setter("{{ connection_name }}")
+        with mock.patch.object(setter, "generator", return_value="x") as generator:
+            setter.set("model.a", object())
+            setter.set("model.a", object())
+        assert generator.call_count == 2
+
+    def test_illegal_comment(self):
+        with pytest.raises(DbtRuntimeError):
+            _setter("*/ {{ connection_name }}")
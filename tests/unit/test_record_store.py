@@ -0,0 +1,304 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+import uuid
+
+from dbt_common.context import get_invocation_context, set_invocation_context
+from dbt_common.record import RecorderMode
+import msgpack
+import pytest
+
+from dbt.adapters.record import RecordReplayCursor
+
+from dbt.adapters.record.cursor.execute import CursorExecuteParams, CursorExecuteRecord
+from dbt.adapters.record.cursor.fetchall import (
+    CursorFetchAllParams,
+    CursorFetchAllRecord,
+    CursorFetchAllResult,
+)
+from dbt.adapters.record.cursor.fetchone import (
+    CursorFetchOneParams,
+    CursorFetchOneRecord,
+    CursorFetchOneResult,
+)
+from dbt.adapters.record.store import (
+    BinaryRecorder,
+    RecordStoreReader,
+    RecordStoreWriter,
+)
+import dbt.adapters.record.store
+
+
+ROWS = [
+    (1, "a", datetime.date(2024, 1, 2), Decimal("1.50")),
+    (2, None, datetime.datetime(2024, 1, 2, 3, 4, 5), Decimal("-7")),
+    (
+        3,
+        "c",
+        datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+        Decimal("0.001"),
+    ),
+]
+
+
+def _execute(sql, seq, connection_name="conn"):
+    return CursorExecuteRecord(
+        CursorExecuteParams(connection_name, sql, [1, "x"]), result=None, seq=seq
+    )
+
+
+def _fetchall(rows, seq, connection_name="conn"):
+    return CursorFetchAllRecord(
+        CursorFetchAllParams(connection_name), CursorFetchAllResult(list(rows)), seq=seq
+    )
+
+
+class _Unprintable:
+    def __str__(self):
+        raise ValueError("cannot be printed")
+
+
+class TestRecordStore:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        writer = RecordStoreWriter(path, chunk_rows=2)
+        writer.add(_execute("select 1", 0))
+        writer.add(_fetchall(ROWS, 1))
+        writer.add(
+            CursorFetchOneRecord(
+                CursorFetchOneParams("conn"), CursorFetchOneResult((datetime.date(2024, 5, 6),)), 2
+            )
+        )
+        writer.close()
+
+        with RecordStoreReader(path) as reader:
+            assert set(reader) == {
+                "CursorExecuteRecord",
+                "CursorFetchAllRecord",
+                "CursorFetchOneRecord",
+            }
+            execute = CursorExecuteRecord.from_dict(reader["CursorExecuteRecord"][0])
+            fetchall = CursorFetchAllRecord.from_dict(reader["CursorFetchAllRecord"][0])
+            fetchone = CursorFetchOneRecord.from_dict(reader["CursorFetchOneRecord"][0])
+
+        assert execute.params == CursorExecuteParams("conn", "select 1", [1, "x"])
+        assert execute.seq == 0
+        assert fetchall.result.results == ROWS
+        assert fetchall.seq == 1
+        assert fetchone.result.result == [datetime.date(2024, 5, 6)]
+
+    def test_interns_operations(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        sql = "select * from a_rather_long_table_name where id = %s"
+        writer = RecordStoreWriter(path)
+        for seq in range(5):
+            writer.add(_execute(sql, seq))
+        writer.add(_execute("select 2", 5))
+        writer.close()
+
+        assert path.read_bytes().count(sql.encode()) == 1
+        with RecordStoreReader(path) as reader:
+            operations = [r["params"]["operation"] for r in reader["CursorExecuteRecord"]]
+        assert operations == [sql] * 5 + ["select 2"]
+
+    def test_skips_records_that_cannot_be_written(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        writer = RecordStoreWriter(path, chunk_rows=1)
+        with mock.patch.object(dbt.adapters.record.store.logger, "warning") as warning:
+            writer.add(_fetchall([(1,)], 0))
+            writer.add(_fetchall([(2,), (_Unprintable(),)], 1))
+            writer.add(_execute("select 1", 2))
+            writer.add(_fetchall([(3,)], 3))
+            writer.add(
+                CursorExecuteRecord(
+                    CursorExecuteParams("conn", "select 2", [_Unprintable()]), result=None, seq=4
+                )
+            )
+        writer.close()
+
+        with RecordStoreReader(path) as reader:
+            seqs = [r["seq"] for r in reader["CursorFetchAllRecord"]]
+            assert len(reader["CursorExecuteRecord"]) == 1
+        assert seqs == [0, 3]
+        messages = [c.args[0] for c in warning.call_args_list]
+        assert len(messages) == 2
+        assert "CursorFetchAllRecord" in messages[0]
+        assert "CursorExecuteRecord" in messages[1]
+
+    def test_unknown_values_are_recorded_as_strings(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        value = uuid.UUID(int=1)
+        writer = RecordStoreWriter(path)
+        writer.add(_fetchall([(value, datetime.timedelta(seconds=1))], 0))
+        writer.close()
+
+        with RecordStoreReader(path) as reader:
+            result = reader["CursorFetchAllRecord"][0]["result"]
+        assert result == {"results": [[str(value), "0:00:01"]]}
+
+    def test_records_by_connection(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        writer = RecordStoreWriter(path, chunk_rows=1)
+        for seq in range(6):
+            writer.add(_fetchall([(seq,), (seq,)], seq, connection_name=f"conn{seq % 2}"))
+        writer.close()
+        # as if recording was aborted, so that the frames have to be read
+        unindexed = tmp_path / "unindexed.dbtrec"
+        unindexed.write_bytes(path.read_bytes()[:-5])
+
+        for source in (path, unindexed):
+            with RecordStoreReader(source) as reader:
+                records = reader.records("CursorFetchAllRecord", "conn1")
+                assert [r["seq"] for r in records] == [1, 3, 5]
+                assert records[-1]["result"]["results"] == [[5], [5]]
+                assert [r["seq"] for r in reader["CursorFetchAllRecord"]] == list(range(6))
+                assert len(reader.records("CursorFetchAllRecord", "conn2")) == 0
+                assert len(reader.records("CursorExecuteRecord", "conn1")) == 0
+
+    def test_skips_truncated_record(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        writer = RecordStoreWriter(path, chunk_rows=1)
+        writer.add(_fetchall([(1,)], 0))
+        writer.add(_fetchall([(2,), (3,)], 1))
+        # as if recording was aborted before the store was closed
+        writer._file.flush()
+        aborted = path.read_bytes()[:-2]
+        writer.close()
+        path.write_bytes(aborted)
+
+        with RecordStoreReader(path) as reader:
+            assert [r["seq"] for r in reader["CursorFetchAllRecord"]] == [0]
+
+    @pytest.mark.parametrize("chunks_written", [0, 1, 2])
+    def test_skips_record_cut_at_a_chunk_boundary(self, tmp_path, chunks_written):
+        path = tmp_path / "recording.dbtrec"
+        writer = RecordStoreWriter(path, chunk_rows=1)
+        writer.add(_fetchall([(1,)], 0))
+        writer._file.flush()
+        start = len(path.read_bytes())
+        writer.add(_fetchall([(2,), (3,), (4,)], 1))
+        writer._file.flush()
+        data = path.read_bytes()
+        writer.close()
+        # the record frame and the first chunks_written chunk frames
+        chunk_frame = dbt.adapters.record.store._FRAME.size + len(msgpack.packb([[2]]))
+        end = len(data) - (3 - chunks_written) * chunk_frame
+        assert end > start
+        path.write_bytes(data[:end])
+
+        with RecordStoreReader(path) as reader:
+            assert [r["seq"] for r in reader["CursorFetchAllRecord"]] == [0]
+
+    def test_empty_results_are_kept(self, tmp_path):
+        path = tmp_path / "recording.dbtrec"
+        writer = RecordStoreWriter(path)
+        writer.add(_fetchall([], 0))
+        writer._file.flush()
+        aborted = path.read_bytes()
+        writer.close()
+        path.write_bytes(aborted)
+
+        with RecordStoreReader(path) as reader:
+            assert reader["CursorFetchAllRecord"][0]["result"] == {"results": []}
+
+
+class TestBinaryRecorder:
+    def test_record_and_replay(self, tmp_path):
+        path = str(tmp_path / "recording.dbtrec")
+        recorder = BinaryRecorder(RecorderMode.RECORD, None, current_recording_path=path)
+        recorder.add_record(_execute("select 1", None))
+        recorder.add_record(_fetchall(ROWS, None))
+        recorder.write()
+
+        replay = BinaryRecorder(RecorderMode.REPLAY, None, previous_recording_path=path)
+        assert replay.expect_record(CursorExecuteParams("conn", "select 1", [1, "x"])) is None
+        assert replay.expect_record(CursorFetchAllParams("conn")) == ROWS
+
+    def test_replay_by_connection(self, tmp_path):
+        path = str(tmp_path / "recording.dbtrec")
+        recorder = BinaryRecorder(RecorderMode.RECORD, None, current_recording_path=path)
+        for seq in range(4):
+            recorder.add_record(_execute(f"select {seq}", None, f"conn{seq % 2}"))
+        recorder.write()
+
+        replay = BinaryRecorder(RecorderMode.REPLAY, None, previous_recording_path=path)
+        # a call that doesn't come next on its connection is still matched
+        record = replay.pop_matching_record(CursorExecuteParams("conn1", "select 3", [1, "x"]))
+        assert record.seq == 3
+        record = replay.pop_matching_record(CursorExecuteParams("conn1", "select 1", [1, "x"]))
+        assert record.seq == 1
+        record = replay.pop_matching_record(CursorExecuteParams("conn0", "select 0", [1, "x"]))
+        assert record.seq == 0
+        params = CursorExecuteParams("conn1", "select 1", [1, "x"])
+        assert replay.pop_matching_record(params) is None
+
+    def test_in_memory_write(self, tmp_path):
+        path = str(tmp_path / "recording.dbtrec")
+        recorder = BinaryRecorder(
+            RecorderMode.RECORD, None, current_recording_path=path, in_memory=True
+        )
+        recorder.add_record(_fetchall(ROWS, None))
+        recorder.add_record(_execute("select 1", None))
+        recorder.write()
+
+        with RecordStoreReader(path) as reader:
+            assert reader["CursorFetchAllRecord"][0]["seq"] == 0
+            assert reader["CursorExecuteRecord"][0]["seq"] == 1
+
+
+class TestReplayLatency:
+    @pytest.fixture
+    def recorder(self):
+        set_invocation_context({})
+
+        def use(recorder):
+            get_invocation_context().recorder = recorder
+            return recorder
+
+        yield use
+        get_invocation_context().recorder = None
+
+    @pytest.fixture
+    def recording(self, tmp_path, recorder):
+        path = str(tmp_path / "recording.dbtrec")
+        native_cursor = mock.Mock()
+        native_cursor.fetchall.return_value = [(1,)]
+        cursor = RecordReplayCursor(native_cursor, mock.Mock())
+        cursor.connection.name = "conn"
+
+        recorder(BinaryRecorder(RecorderMode.RECORD, None, current_recording_path=path))
+        with mock.patch("dbt.adapters.record.cursor.timing.time.perf_counter") as perf_counter:
+            perf_counter.side_effect = [10.0, 10.5, 20.0, 20.25]
+            cursor.execute("select 1", [1])
+            assert cursor.fetchall() == [(1,)]
+        get_invocation_context().recorder.write()
+        return path
+
+    def test_records_elapsed_time(self, recording):
+        with RecordStoreReader(recording) as reader:
+            assert reader["CursorExecuteRecord"][0]["elapsed"] == 0.5
+            assert reader["CursorFetchAllRecord"][0]["elapsed"] == 0.25
+
+    @pytest.mark.parametrize("replay_latency,sleeps", [(None, []), (2.0, [1.0, 0.5])])
+    def test_replay_sleeps(self, recording, recorder, replay_latency, sleeps):
+        recorder(
+            BinaryRecorder(
+                RecorderMode.REPLAY,
+                None,
+                previous_recording_path=recording,
+                replay_latency=replay_latency,
+            )
+        )
+        cursor = RecordReplayCursor(None, mock.Mock())
+        cursor.connection.name = "conn"
+        with mock.patch.object(dbt.adapters.record.store.time, "sleep") as sleep:
+            cursor.execute("select 1", [1])
+            assert cursor.fetchall() == [(1,)]
+        assert [c.args[0] for c in sleep.call_args_list] == sleeps
+
+    def test_replay_latency_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("DBT_RECORDER_REPLAY_LATENCY", "0.5")
+        recorder = BinaryRecorder(
+            RecorderMode.RECORD, None, current_recording_path=str(tmp_path / "r"), in_memory=True
+        )
+        assert recorder.replay_latency == 0.5
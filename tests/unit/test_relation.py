@@ -4,7 +4,7 @@ import pytest
 
 from dbt.adapters.base import BaseRelation
 from dbt.adapters.base.relation import EventTimeFilter
-from dbt.adapters.contracts.relation import RelationType
+from dbt.adapters.contracts.relation import FakeAPIObject, RelationType
 
 
 @pytest.mark.parametrize(
@@ -167,3 +167,68 @@ def test_create_ephemeral_from_uses_identifier():
     node = Node(name="name_should_not_be_used", identifier="test")
     ephemeral_relation = BaseRelation.create_ephemeral_from(node)
     assert str(ephemeral_relation) == "__dbt__cte__test"
+
+
+def test_equality_and_hash():
+    relation = BaseRelation.create(database="db", schema="schema", identifier="table")
+    same = BaseRelation.create(database="db", schema="schema", identifier="table")
+    assert relation == same
+    assert hash(relation) == hash(same)
+    assert {relation: 1}[same] == 1
+
+    assert relation != relation.include(database=False)
+    assert relation != replace(relation, limit=1)
+    assert relation != BaseRelation.create(database="db", schema="schema", identifier="other")
+    assert relation != "db.schema.table"
+
+
+def test_render_is_cached_per_instance():
+    relation = BaseRelation.create(database="db", schema="schema", identifier="table")
+    assert relation.render() is relation.render()
+    assert relation.quote(identifier=False).render() == '"db"."schema".table'
+
+
+def test_derived_relations_are_shared():
+    relation = BaseRelation.create(database="db", schema="schema", identifier="table")
+    other = BaseRelation.create(database="db", schema="schema", identifier="other")
+
+    assert relation.without_identifier() is relation.without_identifier()
+    assert relation.without_identifier() is other.without_identifier()
+    assert relation.information_schema_only() is other.information_schema_only()
+    assert relation.information_schema("tables") is other.information_schema("tables")
+    assert relation.information_schema("tables") is not relation.information_schema_only()
+
+    assert relation.without_identifier().render() == '"db"."schema"'
+    assert relation.information_schema_only().render() == '"db".INFORMATION_SCHEMA'
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"type": "table"},
+        {"type": RelationType.View},
+        {"type": None},
+        {"path": {"identifier": "other"}},
+        {"path": {"database": None, "schema": "other"}},
+        {"quote_policy": {"identifier": False}},
+        {"limit": 10, "require_alias": False},
+        {"path": {"identifier": 1}},
+        {"path": {"unknown": "value"}},
+        {"type": "unknown"},
+    ],
+)
+def test_incorporate_matches_round_trip(kwargs):
+    relation = BaseRelation.create(
+        database="db", schema="schema", identifier="table", type=RelationType.Table
+    )
+    try:
+        expected = FakeAPIObject.incorporate(relation, **kwargs)
+    except Exception as exc:
+        with pytest.raises(type(exc)):
+            relation.incorporate(**kwargs)
+        return
+
+    actual = relation.incorporate(**kwargs)
+    assert type(actual) is BaseRelation
+    assert actual.to_dict() == expected.to_dict()
+    assert actual.render() == expected.render()
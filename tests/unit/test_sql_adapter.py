@@ -0,0 +1,212 @@
+from datetime import date
+from decimal import Decimal
+from multiprocessing import get_context
+from unittest import mock
+
+import pytest
+from dbt_common.exceptions import DbtRuntimeError
+
+from dbt.adapters.base.column import Column
+from dbt.adapters.base.relation import BaseRelation
+from dbt.adapters.sql import SQLAdapter
+
+
+class SQLAdapterStub(SQLAdapter):
+    ConnectionManager = mock.Mock()
+
+    @classmethod
+    def date_function(cls) -> str:
+        return "now()"
+
+
+@pytest.fixture
+def sql_adapter(config):
+    return SQLAdapterStub(config, get_context("spawn"))
+
+
+def _relation(identifier, database="db", schema="schema"):
+    return BaseRelation.create(database=database, schema=schema, identifier=identifier)
+
+
+class TestColumnCache:
+    def test_get_columns_in_relation_is_cached(self, sql_adapter):
+        relation = _relation("table")
+        columns = [Column("id", "integer")]
+
+        with mock.patch.object(sql_adapter, "CACHE_COLUMNS", True), mock.patch.object(
+            sql_adapter, "execute_macro", return_value=columns
+        ) as macro:
+            assert sql_adapter.get_columns_in_relation(relation) == columns
+            assert sql_adapter.get_columns_in_relation(relation) == columns
+            assert macro.call_count == 1
+
+            sql_adapter.cache_renamed(relation, _relation("renamed"))
+            assert sql_adapter.get_columns_in_relation(relation) == columns
+            assert macro.call_count == 2
+
+    def test_get_columns_in_relations_queries_each_database_once(self, sql_adapter):
+        first, second = _relation("first"), _relation("Second", schema="Other")
+        elsewhere, missing = _relation("first", database="other_db"), _relation("missing")
+        rows = {
+            "db": [
+                ("schema", "first", "id", "integer", None, 32, 0),
+                ("other", "second", "name", "character varying", 10, None, None),
+                ("schema", "first", "amount", "numeric", None, 10, 2),
+            ],
+            "other_db": [("schema", "first", "id", "bigint", None, 64, 0)],
+        }
+
+        def execute_macro(name, kwargs):
+            assert name == "get_columns_in_relations"
+            return rows[kwargs["relations"][0].database]
+
+        with mock.patch.object(sql_adapter, "execute_macro", side_effect=execute_macro) as macro:
+            columns = sql_adapter.get_columns_in_relations([first, second, elsewhere, missing])
+
+        assert macro.call_count == 2
+        assert columns == {
+            first: [
+                Column("id", "integer", None, 32, 0),
+                Column("amount", "numeric", None, 10, 2),
+            ],
+            second: [Column("name", "character varying", 10)],
+            elsewhere: [Column("id", "bigint", None, 64, 0)],
+            missing: [],
+        }
+
+
+class TestAlterRelationColumns:
+    @pytest.fixture
+    def relations(self, sql_adapter):
+        goal, current = _relation("goal"), _relation("current")
+        columns = {
+            goal: [
+                Column("a", "character varying", 20),
+                Column("b", "character varying", 30),
+                Column("c", "integer"),
+            ],
+            current: [
+                Column("a", "character varying", 10),
+                Column("b", "character varying", 30),
+                Column("c", "integer"),
+            ],
+        }
+        sql_adapter.get_columns_in_relation = columns.__getitem__
+        return goal, current
+
+    def test_expand_column_types_alters_once(self, sql_adapter, relations):
+        goal, current = relations
+        with mock.patch.object(sql_adapter, "execute_macro") as macro, mock.patch(
+            "dbt.adapters.base.impl.fire_event"
+        ) as fire_event:
+            sql_adapter.expand_column_types(goal, current)
+
+        macro.assert_called_once_with(
+            "alter_relation_columns",
+            kwargs={
+                "relation": current,
+                "add_columns": [],
+                "remove_columns": [],
+                "type_changes": [
+                    {
+                        "column_name": "a",
+                        "orig_type": "character varying(10)",
+                        "new_type": "character varying(20)",
+                    }
+                ],
+            },
+        )
+        (event,), _ = fire_event.call_args
+        assert event.code() == "E051"
+        assert "changing a from character varying(10) to character varying(20)" in (
+            event.message()
+        )
+
+    def test_expand_column_types_uses_overridden_alter_column_type(self, sql_adapter, relations):
+        goal, current = relations
+        with mock.patch.object(
+            SQLAdapterStub, "alter_column_type", autospec=True
+        ) as alter_column_type, mock.patch.object(sql_adapter, "execute_macro") as macro:
+            sql_adapter.expand_column_types(goal, current)
+
+        macro.assert_not_called()
+        alter_column_type.assert_called_once_with(
+            sql_adapter, current, "a", "character varying(20)"
+        )
+
+    def test_no_changes(self, sql_adapter):
+        with mock.patch.object(sql_adapter, "execute_macro") as macro:
+            sql_adapter.alter_relation_columns(_relation("table"), [], None, [])
+        macro.assert_not_called()
+
+
+class TestBulkLoad:
+    def _load(self, sql_adapter, source, **kwargs):
+        with mock.patch.object(sql_adapter, "execute_macro", return_value="%s"):
+            with mock.patch.object(sql_adapter.connections, "add_bulk_insert") as insert:
+                loaded = sql_adapter.bulk_load(_relation("seed"), source, **kwargs)
+        return loaded, [c.args for c in insert.call_args_list]
+
+    def test_csv_file_is_loaded_in_chunks(self, sql_adapter, tmp_path):
+        path = tmp_path / "seed.csv"
+        path.write_text("id,name\n1,a\n2,\n3,c\n4, NULL\n", encoding="utf-8")
+
+        loaded, calls = self._load(sql_adapter, str(path), batch_size=2)
+
+        assert loaded == 4
+        table, columns = '"db"."schema"."seed"', ['"id"', '"name"']
+        assert calls == [
+            (table, columns, [[Decimal(1), "a"], [Decimal(2), None]], "%s"),
+            (table, columns, [[Decimal(3), "c"], [Decimal(4), None]], "%s"),
+        ]
+
+    def test_csv_fields_are_converted_to_their_column_types(self, sql_adapter, tmp_path):
+        path = tmp_path / "seed.csv"
+        path.write_text(
+            "id,amount,flag,day,code\n1,1.5,true,2020-01-01,007\n2,null,false,,8\n3\n",
+            encoding="utf-8",
+        )
+
+        loaded, calls = self._load(sql_adapter, path, text_columns=["code"])
+
+        assert loaded == 3
+        assert calls[0][2] == [
+            [Decimal(1), Decimal("1.5"), True, date(2020, 1, 1), "007"],
+            [Decimal(2), None, False, None, "8"],
+            [Decimal(3), None, None, None, None],
+        ]
+
+    def test_rows_with_unquoted_columns(self, sql_adapter):
+        rows = iter([(1, "a"), (2, "")])
+
+        loaded, calls = self._load(
+            sql_adapter, rows, column_names=["id", "name"], quote_columns=False
+        )
+
+        assert loaded == 2
+        assert calls == [('"db"."schema"."seed"', ["id", "name"], [(1, "a"), (2, "")], "%s")]
+
+    def test_empty_csv_file(self, sql_adapter, tmp_path):
+        path = tmp_path / "seed.csv"
+        path.write_text("", encoding="utf-8")
+
+        assert self._load(sql_adapter, path) == (0, [])
+
+    def test_rows_require_column_names(self, sql_adapter):
+        with pytest.raises(DbtRuntimeError):
+            sql_adapter.bulk_load(_relation("seed"), [(1,)])
+
+
+def test_convert_csv_types(tmp_path):
+    path = tmp_path / "seed.csv"
+    path.write_text(
+        "id,amount,flag,day,name\n1,1.5,true,2020-01-01,a\n2,2,,,b\n", encoding="utf-8"
+    )
+
+    assert SQLAdapterStub.convert_csv_types(str(path), text_columns=["name"]) == {
+        "id": "integer",
+        "amount": "float8",
+        "flag": "boolean",
+        "day": "date",
+        "name": "text",
+    }
@@ -1,4 +1,7 @@
+from contextlib import contextmanager
+from multiprocessing import get_context
 import unittest
+from unittest import mock
 
 from dbt.adapters.sql import SQLConnectionManager
 
@@ -18,3 +21,57 @@ class TestProcessSQLResult(unittest.TestCase):
             list(SQLConnectionManager.process_results(cols_with_more_dupes, rows)),
             [{"a": 1, "a_2": 2, "a_3": 3, "b": 4}],
         )
+
+
+class SQLConnectionManagerStub(SQLConnectionManager):
+    TYPE = "test"
+
+    @contextmanager
+    def exception_handler(self, sql):
+        yield
+
+    def cancel(self, connection):
+        pass
+
+    @classmethod
+    def get_response(cls, cursor):
+        return "OK"
+
+    @classmethod
+    def open(cls, connection):
+        return connection
+
+
+class TestAddBulkInsert(unittest.TestCase):
+    def setUp(self):
+        self.manager = SQLConnectionManagerStub(mock.Mock(), get_context("spawn"))
+        self.connection = mock.Mock(transaction_open=True)
+        self.connection.name = "test"
+        self.manager.get_thread_connection = mock.Mock(return_value=self.connection)
+        self.rows = [(1, 'say "hi"'), (None, ""), (2, "a,b\nc")]
+
+    def test_rows_to_csv(self):
+        self.assertEqual(
+            SQLConnectionManager._rows_to_csv(self.rows),
+            '"1","say ""hi"""\n,""\n"2","a,b\nc"\n',
+        )
+
+    def test_copy_when_enabled(self):
+        cursor = self.connection.handle.cursor.return_value
+        with mock.patch.object(self.manager, "BULK_INSERT_WITH_COPY", True):
+            self.manager.add_bulk_insert('"t"', ['"a"', '"b"'], self.rows)
+
+        sql, fp = cursor.copy_expert.call_args.args
+        self.assertEqual(sql, 'copy "t" ("a", "b") from stdin with (format csv)')
+        self.assertEqual(fp.read(), SQLConnectionManager._rows_to_csv(self.rows))
+        cursor.executemany.assert_not_called()
+
+    def test_executemany_by_default(self):
+        # even when the driver's cursors could copy
+        cursor = self.connection.handle.cursor.return_value
+        self.manager.add_bulk_insert('"t"', ['"a"', '"b"'], self.rows, binding_char="?")
+
+        cursor.executemany.assert_called_once_with(
+            'insert into "t" ("a", "b") values (?, ?)', self.rows
+        )
+        cursor.copy_expert.assert_not_called()
@@ -0,0 +1,82 @@
+from unittest import mock
+
+import agate
+import pytest
+from dbt_common.clients.agate_helper import from_csv
+
+from dbt.adapters.base.type_inference import infer_csv_types, infer_row_types
+
+CSVS = {
+    "integers": "a\n1\n-20\n300\n",
+    "decimals": "a\n1.5\n-0.125\n1.50\n2\n",
+    "formatted_numbers": 'a\n"1,000"\n$5\n-3%\n1e5\n',
+    "booleans": "a\ntrue\nFALSE\n\n",
+    "dates": "a\n2020-01-31\n2019-12-01\nnull\n",
+    "datetimes": "a\n2020-01-31 10:00:00\n2019-12-01 00:00:01\n",
+    "iso_datetimes": "a\n2020-01-31T10:00:00\n2019-12-01T00:00:01.5\n",
+    "mixed": "a\n1\n2020-01-31\nhéllo\nwörld!\n",
+    "nulls": "a\n\nnull\n",
+    "short_rows": "a,b\n1\n2,x\n",
+    "many_columns": "a,b,c,d\n1,true,2020-01-01,x\n2.25,false,2020-01-02,yy\n",
+}
+
+AGGREGATES = {
+    agate.Number: [agate.MaxPrecision, agate.Min, agate.Max],
+    agate.Date: [agate.Min, agate.Max],
+    agate.DateTime: [agate.Min, agate.Max],
+    agate.Text: [agate.MaxLength],
+}
+
+
+def _summarize(table):
+    summary = []
+    for idx, column_type in enumerate(table.column_types):
+        aggregates = [agate.HasNulls]
+        for agate_type, type_aggregates in AGGREGATES.items():
+            if isinstance(column_type, agate_type):
+                aggregates.extend(type_aggregates)
+        values = [table.aggregate(aggregate(idx)) for aggregate in aggregates]
+        summary.append((type(column_type), values))
+    return summary
+
+
+@pytest.mark.parametrize("name", sorted(CSVS))
+@pytest.mark.parametrize("text_columns", [(), ("a",)])
+def test_infer_csv_types_matches_agate(tmp_path, name, text_columns):
+    path = tmp_path / f"{name}.csv"
+    path.write_text(CSVS[name], encoding="utf-8")
+
+    expected = from_csv(str(path), text_columns)
+    actual = infer_csv_types(path, text_columns, batch_size=2)
+
+    assert actual.column_names == expected.column_names
+    assert _summarize(actual) == _summarize(expected)
+
+
+def test_infer_row_types_keeps_only_deciding_values():
+    rows = [[str(i), "x" * (i % 7)] for i in range(1000)]
+
+    table = infer_row_types(rows, ["id", "name"])
+
+    assert len(table.rows) < 10
+    assert table.aggregate(agate.Max("id")) == 999
+    assert table.aggregate(agate.MaxLength("name")) == 6
+    assert table.aggregate(agate.HasNulls("name"))
+
+
+def test_infer_csv_types_empty_file(tmp_path):
+    path = tmp_path / "empty.csv"
+    path.write_text("", encoding="utf-8")
+
+    assert infer_csv_types(path).column_names == ()
+
+
+def test_infer_row_types_follows_the_seed_type_tester():
+    tester = agate.TypeTester(types=[agate.Boolean(), agate.Text()])
+    with mock.patch(
+        "dbt.adapters.base.type_inference.build_type_tester", return_value=tester
+    ) as build:
+        table = infer_row_types([["1"], ["0"]], ["a"], text_columns=["b"])
+
+    build.assert_called_once_with(["b"])
+    assert isinstance(table.column_types[0], agate.Boolean)